@@ -1,7 +1,15 @@
 """File categorization and analysis logic."""
 
+import os
+import re
+import time
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, compress, islice, repeat
+from operator import and_, contains, ge, le
+from typing import Iterable, Iterator
+
 from scanner import FileInfo
-from utils import days_since
 
 # File extension categories
 CATEGORIES = {
@@ -14,6 +22,9 @@ CATEGORIES = {
     'Code': {'.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.cs', '.go', '.rs', '.rb', '.php'},
 }
 
+# Category name -> small integer id used by the filter columns
+CATEGORY_IDS = {name: i for i, name in enumerate([*CATEGORIES, 'Other'])}
+
 # Known game installation paths
 GAME_PATHS = [
     'steam',
@@ -29,6 +40,137 @@ GAME_PATHS = [
 ]
 
 
+class ExclusionTrie:
+    """
+    Prefix trie of excluded paths, keyed on path components.
+
+    A path is excluded if it equals an added path or lies beneath it.
+    Matching uses a regex compiled from the trie, with alternatives
+    factored by shared prefix, so the regex engine walks the trie in C:
+    cost grows with path depth, not with the number of exclusions.
+    Paths are matched as given, so add and query lowercased paths for
+    case-insensitive matching.
+    """
+
+    _END = object()  # Marks a node where an excluded path ends
+
+    def __init__(self, paths=(), sep: str = os.sep):
+        self.sep = sep
+        self._root = {}
+        self._regex = None
+        for path in paths:
+            self.add(path)
+
+    def __bool__(self) -> bool:
+        return bool(self._root)
+
+    def add(self, path: str):
+        """Add a path to the trie."""
+        # A trailing separator ("c:\\" or "d:\\games\\") names the same folder
+        node = self._root
+        for part in path.rstrip(self.sep).split(self.sep):
+            if self._END in node:
+                return  # Already covered by an excluded parent
+            node = node.setdefault(part, {})
+        # Anything previously excluded beneath this path is now redundant
+        node.clear()
+        node[self._END] = True
+        self._regex = None
+
+    @property
+    def regex(self) -> 're.Pattern':
+        """Compiled pattern whose match() tests a path for exclusion."""
+        if self._regex is None:
+            if self._root:
+                pattern = self._node_pattern(self._root)
+            else:
+                pattern = '(?!)'  # Never matches
+            self._regex = re.compile(pattern)
+        return self._regex
+
+    def _node_pattern(self, node: dict) -> str:
+        """Build the regex alternatives for the children of a trie node."""
+        sep = re.escape(self.sep)
+        alternatives = []
+        for part, child in node.items():
+            if part is self._END:
+                continue
+            if self._END in child:
+                # Excluded here; anything deeper is already covered
+                alternatives.append(f'{re.escape(part)}(?:{sep}|$)')
+            else:
+                alternatives.append(f'{re.escape(part)}{sep}{self._node_pattern(child)}')
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return f"(?:{'|'.join(alternatives)})"
+
+    def matches(self, path: str) -> bool:
+        """Check if a path equals or lies beneath any added path."""
+        return self.regex.match(path) is not None
+
+
+class SearchIndex:
+    """
+    Substring search over many strings at once.
+
+    The strings are joined into one NUL-separated blob so a search is a
+    series of C-level str.find calls over the blob, instead of one
+    Python-level `in` test per string.
+    """
+
+    def __init__(self, texts=()):
+        texts = list(texts)
+        self._texts = texts
+        self._blob = '\0'.join(texts)
+        # Start offset of each string within the blob
+        self._offsets = array('q', accumulate(
+            (len(text) + 1 for text in texts[:-1]), initial=0
+        )) if texts else array('q')
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def find(self, term: str) -> list[int]:
+        """
+        Find the strings containing a substring.
+
+        Returns:
+            Indices of the matching strings, in ascending order
+        """
+        if not term:
+            return list(range(len(self)))
+        if '\0' in term:
+            return []
+
+        blob = self._blob
+        offsets = self._offsets
+        last = len(offsets) - 1
+        matches = []
+
+        pos = blob.find(term)
+        while pos != -1:
+            index = bisect_right(offsets, pos) - 1
+            matches.append(index)
+            if index == last:
+                break
+            # Resume at the next string so each string matches at most once
+            pos = blob.find(term, offsets[index + 1])
+
+        return matches
+
+    def refine(self, indices: list[int], term: str) -> list[int]:
+        """
+        Keep the indices whose strings contain a substring.
+
+        Meant for narrowing an earlier result, e.g. while a search term is
+        being typed; the containment tests run as chained C-level maps.
+        """
+        texts = self._texts
+        return list(compress(
+            indices, map(contains, map(texts.__getitem__, indices), repeat(term))
+        ))
+
+
 def categorize_file(file_info: FileInfo) -> str:
     """
     Determine the category of a file based on extension and path.
@@ -36,10 +178,11 @@ def categorize_file(file_info: FileInfo) -> str:
     Returns one of: Video, Audio, Image, Document, Archive, Game, Code, Other
     """
     ext = file_info.extension.lower()
-    path_lower = file_info.path.lower()
 
-    # Check for games first (by path)
+    # Check for games first (by path); only executables need the
+    # lowercased path, so don't build it for every file
     if ext == '.exe':
+        path_lower = file_info.path.lower()
         for game_path in GAME_PATHS:
             if game_path in path_lower:
                 return 'Game'
@@ -54,32 +197,84 @@ def categorize_file(file_info: FileInfo) -> str:
     return 'Other'
 
 
-def calculate_staleness_score(file_info: FileInfo) -> float:
+def calculate_staleness_score(file_info: FileInfo, now: float = None) -> float:
     """
     Calculate a "staleness score" for a file.
     Higher score = more likely to be deletable (large + old).
 
     Formula: size_in_mb * days_since_access
+
+    Args:
+        file_info: The file to score
+        now: Current time as a timestamp (default: time.time()); pass
+            one in when scoring many files so they share a clock reading
     """
+    if now is None:
+        now = time.time()
     size_mb = file_info.size / (1024 * 1024)
-    days_old = days_since(file_info.last_accessed)
+    # Whole days, counted like filter_indices' age cutoff
+    days_old = int((now - file_info.last_accessed) // 86400)
     return size_mb * days_old
 
 
-def analyze_files(files: list[FileInfo]) -> list[dict]:
+class FileEntry:
+    """
+    An analyzed file: the scanned FileInfo plus category and staleness.
+
+    Uses __slots__ to keep large scans compact. Item access
+    (entry['category']) is kept so code written against the old
+    dict entries keeps working.
+    """
+
+    __slots__ = ('file_info', 'category', 'staleness_score', 'path_lc')
+
+    def __init__(self, file_info: FileInfo, category: str, staleness_score: float):
+        self.file_info = file_info
+        self.category = category
+        self.staleness_score = staleness_score
+        self.path_lc = file_info.path.lower()  # Search and exclusion key
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+
+def analyze_files(files: Iterable[FileInfo]) -> list[FileEntry]:
     """
     Analyze a list of files and add category and staleness info.
 
-    Returns list of dicts with file info plus category and staleness_score.
+    Returns list of FileEntry records with file info plus category and
+    staleness_score.
+    """
+    now = time.time()
+    return [
+        FileEntry(
+            file_info,
+            categorize_file(file_info),
+            calculate_staleness_score(file_info, now),
+        )
+        for file_info in files
+    ]
+
+
+def analyze_files_iter(files: Iterable[FileInfo], chunk_size: int = 10000) -> Iterator[list[FileEntry]]:
     """
-    analyzed = []
-    for file_info in files:
-        analyzed.append({
-            'file_info': file_info,
-            'category': categorize_file(file_info),
-            'staleness_score': calculate_staleness_score(file_info),
-        })
-    return analyzed
+    Analyze files incrementally, yielding FileEntry lists of up to chunk_size.
+
+    Lets callers publish partial results while the rest is still being
+    analyzed.
+    """
+    it = iter(files)
+    while True:
+        chunk = analyze_files(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
 
 def filter_files(
@@ -100,6 +295,9 @@ def filter_files(
     Returns:
         Filtered list of analyzed file dicts
     """
+    # Files accessed at or before the cutoff are at least min_days_old days old
+    cutoff = time.time() - min_days_old * 86400
+
     filtered = []
     for item in analyzed_files:
         file_info = item['file_info']
@@ -113,7 +311,7 @@ def filter_files(
             continue
 
         # Age filter
-        if days_since(file_info.last_accessed) < min_days_old:
+        if min_days_old > 0 and file_info.last_accessed > cutoff:
             continue
 
         filtered.append(item)
@@ -121,6 +319,84 @@ def filter_files(
     return filtered
 
 
+def build_filter_columns(analyzed_files: list[dict]) -> dict:
+    """
+    Build column arrays of the fields used by filter_indices.
+
+    Storing each field contiguously lets the numeric filters run as
+    C-level passes over the arrays instead of per-dict Python lookups.
+
+    Returns:
+        Dict with 'size' (int64 bytes), 'accessed' (float64 timestamps) and
+        'category' (int8 ids from CATEGORY_IDS) arrays, parallel to the input
+    """
+    other_id = CATEGORY_IDS['Other']
+    return {
+        'size': array('q', [item['file_info'].size for item in analyzed_files]),
+        'accessed': array('d', [item['file_info'].last_accessed for item in analyzed_files]),
+        'category': array('b', [
+            CATEGORY_IDS.get(item['category'], other_id) for item in analyzed_files
+        ]),
+    }
+
+
+def filter_indices(
+    columns: dict,
+    categories: list[str] = None,
+    min_size: int = 0,
+    min_days_old: int = 0,
+    indices: list[int] = None,
+) -> list[int]:
+    """
+    Filter by the same criteria as filter_files, using filter columns.
+
+    Args:
+        columns: Column arrays from build_filter_columns
+        categories: List of categories to include (None = all)
+        min_size: Minimum file size in bytes
+        min_days_old: Minimum days since last access
+        indices: Candidate indices to filter, in ascending order
+            (None = all files)
+
+    Returns:
+        Indices of the matching files, in ascending order
+    """
+    def column(name):
+        # Only read the candidates' values when given a subset
+        values = columns[name]
+        if indices is None:
+            return values
+        return map(values.__getitem__, indices)
+
+    if indices is None:
+        candidates = range(len(columns['size']))
+    else:
+        candidates = indices
+
+    # Only build predicates that can exclude something
+    masks = []
+    if min_size > 0:
+        masks.append(map(ge, column('size'), repeat(min_size)))
+
+    if min_days_old > 0:
+        # Files accessed at or before the cutoff are at least min_days_old days old
+        cutoff = time.time() - min_days_old * 86400
+        masks.append(map(le, column('accessed'), repeat(cutoff)))
+
+    if categories:
+        wanted = {CATEGORY_IDS[c] for c in categories if c in CATEGORY_IDS}
+        masks.append(map(wanted.__contains__, column('category')))
+
+    if not masks:
+        return list(candidates)
+
+    mask = masks[0]
+    for other in masks[1:]:
+        mask = map(and_, mask, other)
+
+    return list(compress(candidates, mask))
+
+
 def sort_files(
     analyzed_files: list[dict],
     sort_by: str = 'size',
@@ -1,11 +1,22 @@
-"""File operations for move and compress."""
+"""File operations for move, delete and compress."""
 
 import os
 import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Callable, Optional
 from datetime import datetime
 
+# Try to import send2trash for safe deletion
+try:
+    from send2trash import send2trash
+    HAS_SEND2TRASH = True
+except ImportError:
+    HAS_SEND2TRASH = False
+
+# Write buffer for exports, which can run to millions of rows
+EXPORT_BUFFER_SIZE = 1 << 18
+
 
 def move_files(
     files: list,
@@ -25,9 +36,10 @@ def move_files(
         stop_flag: Optional callable that returns True to stop
 
     Returns:
-        Dict with stats: moved, failed, total_size
+        Dict with stats: moved, failed, total_size, plus the list of
+        successfully moved file dicts under 'moved_files'
     """
-    stats = {'moved': 0, 'failed': 0, 'total_size': 0, 'errors': []}
+    stats = {'moved': 0, 'failed': 0, 'total_size': 0, 'errors': [], 'moved_files': []}
 
     if not os.path.isdir(destination):
         try:
@@ -78,6 +90,7 @@ def move_files(
             shutil.move(src_path, dest_path)
             stats['moved'] += 1
             stats['total_size'] += file_info.size
+            stats['moved_files'].append(file_dict)
 
         except (OSError, shutil.Error) as e:
             stats['failed'] += 1
@@ -86,6 +99,98 @@ def move_files(
     return stats
 
 
+def trash_files(
+    files: list,
+    progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    stop_flag: Optional[Callable[[], bool]] = None,
+    max_workers: int = 8
+) -> dict:
+    """
+    Move files to the Recycle Bin.
+
+    Each move is an independent, I/O-bound shell call, so they are
+    dispatched to a thread pool and collected as they complete.
+
+    Args:
+        files: List of file dicts from analyzer
+        progress_callback: Optional callback(filename, current, total)
+        stop_flag: Optional callable that returns True to stop
+        max_workers: Number of concurrent deletions
+
+    Returns:
+        Dict with stats: deleted, failed, total_size, plus the list of
+        successfully deleted file dicts under 'deleted_files'
+    """
+    stats = {
+        'deleted': 0,
+        'failed': 0,
+        'total_size': 0,
+        'errors': [],
+        'deleted_files': []
+    }
+
+    total = len(files)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(send2trash, file_dict['file_info'].path): file_dict
+            for file_dict in files
+        }
+
+        stopped = False
+        done = 0
+
+        for future in as_completed(futures):
+            if not stopped and stop_flag and stop_flag():
+                # Drop queued deletions but still record those in flight
+                stopped = True
+                for pending in futures:
+                    pending.cancel()
+            if future.cancelled():
+                continue
+
+            file_dict = futures[future]
+            file_info = file_dict['file_info']
+            done += 1
+
+            if progress_callback:
+                progress_callback(file_info.name, done, total)
+
+            try:
+                future.result()
+                stats['deleted'] += 1
+                stats['total_size'] += file_info.size
+                stats['deleted_files'].append(file_dict)
+            except Exception as e:
+                stats['failed'] += 1
+                stats['errors'].append(f"{file_info.name}: {e}")
+
+    return stats
+
+
+def trash_paths(paths: list, max_workers: int = 8) -> list:
+    """
+    Move files or folders to the Recycle Bin, several at a time.
+
+    Args:
+        paths: Paths to move
+        max_workers: Number of concurrent deletions
+
+    Returns:
+        List of the paths that were moved
+    """
+    def trash(path):
+        try:
+            send2trash(path)
+            return True
+        except Exception:
+            return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        moved = list(executor.map(trash, paths))
+    return [path for path, ok in zip(paths, moved) if ok]
+
+
 def compress_files(
     files: list,
     archive_path: str,
@@ -157,7 +262,9 @@ def compress_files(
 def export_file_list(
     files: list,
     output_path: str,
-    format: str = 'csv'
+    format: str = 'csv',
+    buffering: int = EXPORT_BUFFER_SIZE,
+    progress_callback: Optional[Callable[[str, int, int], None]] = None
 ) -> bool:
     """
     Export file list to CSV or HTML.
@@ -166,63 +273,74 @@ def export_file_list(
         files: List of file dicts from analyzer
         output_path: Output file path
         format: 'csv' or 'html'
+        buffering: Write buffer size in bytes
+        progress_callback: Optional callback(filename, current, total)
 
     Returns:
         True if successful, False otherwise
     """
     try:
         if format.lower() == 'csv':
-            return _export_csv(files, output_path)
+            return _export_csv(files, output_path, buffering, progress_callback)
         elif format.lower() == 'html':
-            return _export_html(files, output_path)
+            return _export_html(files, output_path, buffering, progress_callback)
         else:
             return False
     except Exception:
         return False
 
 
-def _export_csv(files: list, output_path: str) -> bool:
+def _csv_rows(files: list, progress_callback=None):
+    """Yield the CSV row of each file."""
+    from utils import format_size, format_date
+
+    total = len(files)
+    for i, file_dict in enumerate(files, 1):
+        fi = file_dict['file_info']
+        if progress_callback:
+            progress_callback(fi.name, i, total)
+        yield (
+            fi.name,
+            fi.size,
+            format_size(fi.size),
+            file_dict['category'],
+            format_date(fi.last_accessed),
+            fi.path
+        )
+
+
+def _export_csv(
+    files: list,
+    output_path: str,
+    buffering: int = EXPORT_BUFFER_SIZE,
+    progress_callback=None
+) -> bool:
     """Export files to CSV format."""
     import csv
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=buffering) as f:
         writer = csv.writer(f)
         writer.writerow(['Name', 'Size (bytes)', 'Size', 'Category', 'Last Accessed', 'Path'])
-
-        for file_dict in files:
-            fi = file_dict['file_info']
-            from utils import format_size, format_date
-            writer.writerow([
-                fi.name,
-                fi.size,
-                format_size(fi.size),
-                file_dict['category'],
-                format_date(fi.last_accessed),
-                fi.path
-            ])
+        writer.writerows(_csv_rows(files, progress_callback))
 
     return True
 
 
-def _export_html(files: list, output_path: str) -> bool:
-    """Export files to HTML format."""
-    from utils import format_size, format_date
-
-    html = """<!DOCTYPE html>
+_HTML_HEAD = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>Disk Space Analysis Report</title>
     <style>
-        body { font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; }
-        h1 { color: #333; }
-        table { border-collapse: collapse; width: 100%; margin-top: 20px; }
-        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-        th { background-color: #4a90d9; color: white; }
-        tr:nth-child(even) { background-color: #f9f9f9; }
-        tr:hover { background-color: #f1f1f1; }
-        .size { text-align: right; }
-        .stats { background: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
+        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; }}
+        h1 {{ color: #333; }}
+        table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #4a90d9; color: white; }}
+        tr:nth-child(even) {{ background-color: #f9f9f9; }}
+        tr:hover {{ background-color: #f1f1f1; }}
+        .size {{ text-align: right; }}
+        .stats {{ background: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
     </style>
 </head>
 <body>
@@ -243,34 +361,62 @@ def _export_html(files: list, output_path: str) -> bool:
             </tr>
         </thead>
         <tbody>
-{rows}
-        </tbody>
+"""
+
+_HTML_ROW = """            <tr>
+                <td>{name}</td>
+                <td class="size">{size}</td>
+                <td>{category}</td>
+                <td>{accessed}</td>
+                <td>{path}</td>
+            </tr>
+"""
+
+_HTML_TAIL = """        </tbody>
     </table>
 </body>
 </html>"""
 
-    rows = []
-    total_size = 0
 
-    for file_dict in files:
+def _html_rows(files: list, progress_callback=None):
+    """Yield the HTML table row of each file."""
+    from html import escape
+    from utils import format_size, format_date
+
+    total = len(files)
+    for i, file_dict in enumerate(files, 1):
         fi = file_dict['file_info']
-        total_size += fi.size
-        rows.append(f"""            <tr>
-                <td>{fi.name}</td>
-                <td class="size">{format_size(fi.size)}</td>
-                <td>{file_dict['category']}</td>
-                <td>{format_date(fi.last_accessed)}</td>
-                <td>{fi.path}</td>
-            </tr>""")
-
-    html = html.format(
-        date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        total_files=len(files),
-        total_size=format_size(total_size),
-        rows='\n'.join(rows)
-    )
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+        if progress_callback:
+            progress_callback(fi.name, i, total)
+        yield _HTML_ROW.format(
+            name=escape(fi.name),
+            size=format_size(fi.size),
+            category=escape(file_dict['category']),
+            accessed=format_date(fi.last_accessed),
+            path=escape(fi.path)
+        )
+
+
+def _export_html(
+    files: list,
+    output_path: str,
+    buffering: int = EXPORT_BUFFER_SIZE,
+    progress_callback=None
+) -> bool:
+    """Export files to HTML format."""
+    from utils import format_size
+
+    total_size = sum(file_dict['file_info'].size for file_dict in files)
+
+    # Rows are streamed into the buffered file rather than joined into
+    # one string, so large exports don't hold the whole page in memory
+    with open(output_path, 'w', encoding='utf-8', buffering=buffering) as f:
+        f.write(_HTML_HEAD.format(
+            date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            total_files=len(files),
+            total_size=format_size(total_size)
+        ))
+        f.writelines(_html_rows(files, progress_callback))
+        f.write(_HTML_TAIL)
 
     return True
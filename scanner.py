@@ -2,13 +2,20 @@
 
 import os
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 from dataclasses import dataclass
 
 
 @dataclass
 class FileInfo:
-    """Stores information about a scanned file."""
+    """
+    Stores information about a scanned file.
+
+    Uses __slots__ (spelled out, since dataclass(slots=True) needs
+    Python 3.10) so large scans don't carry a __dict__ per file.
+    """
+    __slots__ = ('path', 'name', 'size', 'last_accessed', 'last_modified', 'extension')
+
     path: str
     name: str
     size: int
@@ -38,23 +45,22 @@ SKIP_FOLDERS = {
 }
 
 
-def scan_directory(
+def iter_directory(
     root_path: str,
     progress_callback: Optional[Callable[[str, int], None]] = None,
     stop_flag: Optional[Callable[[], bool]] = None
-) -> list[FileInfo]:
+) -> Iterator[FileInfo]:
     """
-    Recursively scan a directory and collect file information.
+    Recursively scan a directory, yielding file information as it is found.
 
     Args:
         root_path: Path to start scanning from
         progress_callback: Optional callback(current_path, file_count) for progress updates
         stop_flag: Optional callable that returns True to stop scanning
 
-    Returns:
-        List of FileInfo objects for all files found
+    Yields:
+        FileInfo objects for all files found
     """
-    files = []
     file_count = 0
     stopped = False
 
@@ -86,17 +92,17 @@ def scan_directory(
                         last_modified=stat.st_mtime,
                         extension=Path(filename).suffix.lower()
                     )
-                    files.append(file_info)
-                    file_count += 1
-
-                    # Update progress every 50 files
-                    if progress_callback and file_count % 50 == 0:
-                        progress_callback(dirpath, file_count)
-
                 except (PermissionError, OSError, FileNotFoundError):
                     # Skip files we can't access
                     continue
 
+                yield file_info
+                file_count += 1
+
+                # Update progress every 50 files
+                if progress_callback and file_count % 50 == 0:
+                    progress_callback(dirpath, file_count)
+
             if stopped:
                 break
 
@@ -108,28 +114,51 @@ def scan_directory(
     if progress_callback:
         progress_callback("Scan complete" if not stopped else "Scan stopped", file_count)
 
-    return files
 
+def scan_directory(
+    root_path: str,
+    progress_callback: Optional[Callable[[str, int], None]] = None,
+    stop_flag: Optional[Callable[[], bool]] = None
+) -> list[FileInfo]:
+    """
+    Recursively scan a directory and collect file information.
+
+    Args:
+        root_path: Path to start scanning from
+        progress_callback: Optional callback(current_path, file_count) for progress updates
+        stop_flag: Optional callable that returns True to stop scanning
+
+    Returns:
+        List of FileInfo objects for all files found
+    """
+    return list(iter_directory(root_path, progress_callback, stop_flag))
 
-def scan_multiple_paths(
+
+def iter_multiple_paths(
     paths: list[str],
     progress_callback: Optional[Callable[[str, int], None]] = None,
     stop_flag: Optional[Callable[[], bool]] = None
-) -> list[FileInfo]:
-    """Scan multiple directories/drives and combine results."""
-    all_files = []
+) -> Iterator[FileInfo]:
+    """Scan multiple directories/drives, yielding files as they are found."""
     total_count = 0
 
     for path in paths:
         if stop_flag and stop_flag():
             break
 
-        def wrapped_callback(current_path, count):
+        def wrapped_callback(current_path, count, base=total_count):
             if progress_callback:
-                progress_callback(current_path, total_count + count)
+                progress_callback(current_path, base + count)
 
-        files = scan_directory(path, wrapped_callback, stop_flag)
-        total_count += len(files)
-        all_files.extend(files)
+        for file_info in iter_directory(path, wrapped_callback, stop_flag):
+            yield file_info
+            total_count += 1
 
-    return all_files
+
+def scan_multiple_paths(
+    paths: list[str],
+    progress_callback: Optional[Callable[[str, int], None]] = None,
+    stop_flag: Optional[Callable[[], bool]] = None
+) -> list[FileInfo]:
+    """Scan multiple directories/drives and combine results."""
+    return list(iter_multiple_paths(paths, progress_callback, stop_flag))
@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 from typing import Callable, Optional
 from collections import defaultdict
+from operator import itemgetter
 from datetime import datetime, timedelta
 from scanner import FileInfo
 
@@ -22,6 +23,9 @@ TEMP_EXTENSIONS = {
     '.log', '.dmp', '.crash', '.swp', '.swo',
 }
 
+# Folders at least this big are reported as large
+LARGE_FOLDER_MIN_GB = 1.0
+
 # Windows user profile paths for temp
 USER_TEMP_PATHS = [
     r'AppData\Local\Temp',
@@ -121,7 +125,7 @@ def find_temp_files(files: list) -> list:
     return temp_files
 
 
-def find_large_folders(files: list, min_size_gb: float = 1.0) -> list:
+def find_large_folders(files: list, min_size_gb: float = LARGE_FOLDER_MIN_GB) -> list:
     """
     Find folders that exceed a size threshold.
 
@@ -132,24 +136,26 @@ def find_large_folders(files: list, min_size_gb: float = 1.0) -> list:
     Returns:
         List of (folder_path, size, file_count) tuples
     """
-    folder_stats = defaultdict(lambda: {'size': 0, 'count': 0})
+    folder_sizes = defaultdict(int)
+    folder_counts = defaultdict(int)
 
     for file_dict in files:
         file_info = file_dict['file_info']
         folder = os.path.dirname(file_info.path)
-        folder_stats[folder]['size'] += file_info.size
-        folder_stats[folder]['count'] += 1
+        folder_sizes[folder] += file_info.size
+        folder_counts[folder] += 1
 
     min_size_bytes = min_size_gb * (1024 ** 3)
 
+    # Only the folders over the threshold are sorted
     large_folders = [
-        (folder, stats['size'], stats['count'])
-        for folder, stats in folder_stats.items()
-        if stats['size'] >= min_size_bytes
+        (folder, size, folder_counts[folder])
+        for folder, size in folder_sizes.items()
+        if size >= min_size_bytes
     ]
 
     # Sort by size descending
-    large_folders.sort(key=lambda x: x[1], reverse=True)
+    large_folders.sort(key=itemgetter(1), reverse=True)
 
     return large_folders
 
@@ -207,3 +213,54 @@ def analyze_disk_usage(files: list) -> dict:
     results['downloads_size'] = downloads_size
 
     return results
+
+
+def remove_deleted_files(results: dict, deleted_files: list) -> dict:
+    """
+    Update analyze_disk_usage results in place after files were deleted.
+
+    This gives the same results as analyzing the remaining files again,
+    without going through all of them.
+
+    Args:
+        results: Dict returned by analyze_disk_usage
+        deleted_files: File dicts that no longer exist
+
+    Returns:
+        The updated results dict
+    """
+    deleted = set(map(id, deleted_files))
+    if not deleted:
+        return results
+
+    for key in ('temp_files', 'old_downloads'):
+        results[key] = [f for f in results[key] if id(f) not in deleted]
+
+    # Take the deleted files out of their folders' totals
+    removed = defaultdict(lambda: [0, 0])
+    for file_dict in deleted_files:
+        file_info = file_dict['file_info']
+        folder_removed = removed[os.path.dirname(file_info.path)]
+        folder_removed[0] += file_info.size
+        folder_removed[1] += 1
+
+    min_size_bytes = LARGE_FOLDER_MIN_GB * (1024 ** 3)
+    large_folders = []
+    for folder, size, count in results['large_folders']:
+        if folder in removed:
+            size -= removed[folder][0]
+            count -= removed[folder][1]
+            if size < min_size_bytes:
+                continue
+        large_folders.append((folder, size, count))
+    large_folders.sort(key=itemgetter(1), reverse=True)
+    results['large_folders'] = large_folders
+
+    temp_size = sum(f['file_info'].size for f in results['temp_files'])
+    downloads_size = sum(f['file_info'].size for f in results['old_downloads'])
+
+    results['potential_savings'] = temp_size + downloads_size
+    results['temp_size'] = temp_size
+    results['downloads_size'] = downloads_size
+
+    return results
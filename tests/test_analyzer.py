@@ -6,8 +6,9 @@ import os
 
 from scanner import FileInfo
 from analyzer import (
-    categorize_file, calculate_staleness_score, analyze_files,
-    filter_files, sort_files, CATEGORIES, GAME_PATHS
+    categorize_file, calculate_staleness_score, analyze_files, analyze_files_iter,
+    filter_files, sort_files, build_filter_columns, filter_indices,
+    ExclusionTrie, SearchIndex, FileEntry, CATEGORIES, GAME_PATHS
 )
 
 
@@ -146,6 +147,15 @@ class TestCalculateStalenessScore(unittest.TestCase):
             calculate_staleness_score(small_file)
         )
 
+    def test_explicit_now_counts_whole_days(self):
+        """Test scoring against a given current time."""
+        fi = FileInfo(
+            path="test", name="test.txt", size=2 * 1024 * 1024,  # 2 MB
+            last_accessed=1000.0, last_modified=1000.0, extension=".txt"
+        )
+        now = 1000.0 + 10.5 * 24 * 60 * 60  # 10.5 days later
+        self.assertEqual(calculate_staleness_score(fi, now), 20.0)
+
 
 class TestAnalyzeFiles(unittest.TestCase):
     """Tests for analyze_files function."""
@@ -163,11 +173,20 @@ class TestAnalyzeFiles(unittest.TestCase):
         result = analyze_files(self.files)
         self.assertIsInstance(result, list)
 
-    def test_analyze_returns_dicts(self):
-        """Test that analyze returns list of dicts."""
+    def test_analyze_returns_file_entries(self):
+        """Test that analyze returns list of FileEntry records."""
         result = analyze_files(self.files)
         for item in result:
-            self.assertIsInstance(item, dict)
+            self.assertIsInstance(item, FileEntry)
+
+    def test_file_entry_item_access(self):
+        """Test that FileEntry supports dict-style access."""
+        item = analyze_files(self.files)[0]
+        self.assertIs(item['file_info'], item.file_info)
+        self.assertEqual(item['category'], item.category)
+        self.assertEqual(item.path_lc, item.file_info.path.lower())
+        with self.assertRaises(KeyError):
+            item['missing']
 
     def test_analyzed_has_required_keys(self):
         """Test that analyzed items have required keys."""
@@ -183,6 +202,17 @@ class TestAnalyzeFiles(unittest.TestCase):
         self.assertEqual(result[0]['file_info'].name, "video.mp4")
         self.assertEqual(result[1]['file_info'].name, "doc.pdf")
 
+    def test_analyze_iter_yields_chunks(self):
+        """Test that incremental analysis yields bounded chunks in order."""
+        chunks = list(analyze_files_iter(iter(self.files), chunk_size=2))
+        self.assertTrue(all(0 < len(chunk) <= 2 for chunk in chunks))
+        flat = [item.file_info for chunk in chunks for item in chunk]
+        self.assertEqual(flat, self.files)
+
+    def test_analyze_iter_empty(self):
+        """Test that incremental analysis of nothing yields no chunks."""
+        self.assertEqual(list(analyze_files_iter([])), [])
+
     def test_analyze_assigns_categories(self):
         """Test that categories are assigned correctly."""
         result = analyze_files(self.files)
@@ -253,6 +283,171 @@ class TestFilterFiles(unittest.TestCase):
         self.assertEqual(len(result), 4)
 
 
+class TestFilterIndices(unittest.TestCase):
+    """Tests for build_filter_columns and filter_indices."""
+
+    def setUp(self):
+        """Create analyzed test data and its filter columns."""
+        now = time.time()
+        old = now - (60 * 24 * 60 * 60)  # 60 days ago
+
+        self.files = [
+            FileInfo("C:\\test\\big_video.mp4", "big_video.mp4", 500 * 1024 * 1024, old, old, ".mp4"),
+            FileInfo("C:\\test\\small_video.mp4", "small_video.mp4", 10 * 1024 * 1024, now, now, ".mp4"),
+            FileInfo("C:\\test\\old_doc.pdf", "old_doc.pdf", 1 * 1024 * 1024, old, old, ".pdf"),
+            FileInfo("C:\\test\\notes.xyz", "notes.xyz", 100, now, now, ".xyz"),
+        ]
+        self.analyzed = analyze_files(self.files)
+        self.columns = build_filter_columns(self.analyzed)
+
+    def test_columns_are_parallel(self):
+        """Test that every column has one entry per file."""
+        for column in self.columns.values():
+            self.assertEqual(len(column), len(self.analyzed))
+
+    def test_no_filters_returns_all(self):
+        """Test that default arguments match every file."""
+        self.assertEqual(filter_indices(self.columns), [0, 1, 2, 3])
+
+    def test_filter_by_category(self):
+        """Test filtering by category, including Other."""
+        self.assertEqual(filter_indices(self.columns, categories=['Video']), [0, 1])
+        self.assertEqual(filter_indices(self.columns, categories=['Other']), [3])
+
+    def test_filter_combined(self):
+        """Test combining multiple filters."""
+        result = filter_indices(
+            self.columns,
+            categories=['Video'],
+            min_size=100 * 1024 * 1024,
+            min_days_old=30
+        )
+        self.assertEqual(result, [0])
+
+    def test_filter_candidate_indices(self):
+        """Test that only the given candidate indices are considered."""
+        self.assertEqual(filter_indices(self.columns, indices=[1, 3]), [1, 3])
+        self.assertEqual(filter_indices(self.columns, min_days_old=30, indices=[1, 2]), [2])
+        self.assertEqual(filter_indices(self.columns, categories=['Video'], indices=[]), [])
+
+    def test_matches_filter_files(self):
+        """Test that results agree with filter_files."""
+        cases = [
+            {'categories': ['Document']},
+            {'min_size': 5 * 1024 * 1024},
+            {'min_days_old': 30},
+            {'categories': ['Video', 'Other'], 'min_days_old': 0},
+        ]
+        for kwargs in cases:
+            with self.subTest(**kwargs):
+                expected = filter_files(self.analyzed, **kwargs)
+                indices = filter_indices(self.columns, **kwargs)
+                self.assertEqual([self.analyzed[i] for i in indices], expected)
+
+
+class TestExclusionTrie(unittest.TestCase):
+    """Tests for ExclusionTrie."""
+
+    def setUp(self):
+        """Create a trie with a folder and a file excluded."""
+        self.trie = ExclusionTrie(
+            ["c:\\users\\me\\node_modules", "c:\\data\\keep.bin"],
+            sep="\\"
+        )
+
+    def test_empty_trie(self):
+        """Test that an empty trie matches nothing and is falsy."""
+        trie = ExclusionTrie(sep="\\")
+        self.assertFalse(trie)
+        self.assertFalse(trie.matches("c:\\anything"))
+
+    def test_exact_match(self):
+        """Test that excluded paths themselves match."""
+        self.assertTrue(self.trie.matches("c:\\data\\keep.bin"))
+        self.assertTrue(self.trie.matches("c:\\users\\me\\node_modules"))
+
+    def test_descendant_match(self):
+        """Test that paths beneath an excluded folder match."""
+        self.assertTrue(self.trie.matches("c:\\users\\me\\node_modules\\pkg\\index.js"))
+
+    def test_partial_component_does_not_match(self):
+        """Test that a shared name prefix is not treated as a parent folder."""
+        self.assertFalse(self.trie.matches("c:\\users\\me\\node_modules_old\\a.js"))
+        self.assertFalse(self.trie.matches("c:\\data\\keep.bin.bak"))
+
+    def test_parent_does_not_match(self):
+        """Test that parents of an excluded path are not excluded."""
+        self.assertFalse(self.trie.matches("c:\\users\\me"))
+
+    def test_trailing_separator(self):
+        """Test that a trailing separator names the same folder."""
+        trie = ExclusionTrie(["d:\\games\\", "e:\\"], sep="\\")
+        self.assertTrue(trie.matches("d:\\games\\save.dat"))
+        self.assertTrue(trie.matches("e:\\music\\song.mp3"))
+        self.assertFalse(trie.matches("d:\\other.txt"))
+
+    def test_regex_special_characters(self):
+        """Test that path characters are matched literally."""
+        trie = ExclusionTrie(["c:\\a+b (x)"], sep="\\")
+        self.assertTrue(trie.matches("c:\\a+b (x)\\file.txt"))
+        self.assertFalse(trie.matches("c:\\aab (x)\\file.txt"))
+
+    def test_redundant_paths_are_pruned(self):
+        """Test that paths under an excluded folder don't grow the matcher."""
+        trie = ExclusionTrie(["c:\\a\\b\\c", "c:\\a\\b\\d"], sep="\\")
+        trie.add("c:\\a")
+        trie.add("c:\\a\\x")
+        self.assertEqual(trie.regex.pattern, "c:\\\\a(?:\\\\|$)")
+        self.assertTrue(trie.matches("c:\\a\\b\\e"))
+        self.assertFalse(trie.matches("c:\\ab"))
+
+    def test_add_after_match(self):
+        """Test that adding a path updates the compiled matcher."""
+        self.assertFalse(self.trie.matches("c:\\temp\\a.tmp"))
+        self.trie.add("c:\\temp")
+        self.assertTrue(self.trie.matches("c:\\temp\\a.tmp"))
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Tests for SearchIndex."""
+
+    def setUp(self):
+        """Create an index over a few paths."""
+        self.texts = ["c:\\a\\report.pdf", "c:\\b\\photo.jpg", "d:\\report\\x.txt", "e:\\zz"]
+        self.index = SearchIndex(self.texts)
+
+    def test_matches_agree_with_in(self):
+        """Test that results match a per-string substring test."""
+        for term in ["report", "c:", "\\", "zz", "missing", "pdf"]:
+            with self.subTest(term=term):
+                expected = [i for i, t in enumerate(self.texts) if term in t]
+                self.assertEqual(self.index.find(term), expected)
+
+    def test_each_string_matched_once(self):
+        """Test that repeated occurrences in one string yield one index."""
+        index = SearchIndex(["aaaa", "baab"])
+        self.assertEqual(index.find("a"), [0, 1])
+
+    def test_no_match_across_strings(self):
+        """Test that a term spanning two strings does not match."""
+        index = SearchIndex(["ab", "cd"])
+        self.assertEqual(index.find("bc"), [])
+
+    def test_empty_term_matches_all(self):
+        """Test that an empty term matches every string."""
+        self.assertEqual(self.index.find(""), [0, 1, 2, 3])
+
+    def test_refine_keeps_matching_indices(self):
+        """Test narrowing an earlier result to a longer term."""
+        indices = self.index.find("rep")
+        self.assertEqual(self.index.refine(indices, "report\\"), [2])
+        self.assertEqual(self.index.refine([], "report"), [])
+
+    def test_empty_index(self):
+        """Test searching an empty index."""
+        self.assertEqual(SearchIndex().find("a"), [])
+
+
 class TestSortFiles(unittest.TestCase):
     """Tests for sort_files function."""
 
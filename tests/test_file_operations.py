@@ -0,0 +1,84 @@
+"""Unit tests for file_operations module."""
+
+import csv
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from scanner import FileInfo
+from analyzer import analyze_files
+from file_operations import export_file_list, trash_paths
+
+
+class TestExportFileList(unittest.TestCase):
+    """Tests for export_file_list function."""
+
+    def setUp(self):
+        """Create a temporary directory and some analyzed files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        now = time.time()
+        self.files = analyze_files([
+            FileInfo(path='/data/movie.mp4', name='movie.mp4', size=5 * 1024 ** 3,
+                     last_accessed=now, last_modified=now, extension='.mp4'),
+            FileInfo(path='/data/a<b>&c.txt', name='a<b>&c.txt', size=100,
+                     last_accessed=now, last_modified=now, extension='.txt'),
+        ])
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_csv_export(self):
+        """Test that every file is written as a CSV row after the header."""
+        path = os.path.join(self.temp_dir.name, 'files.csv')
+        self.assertTrue(export_file_list(self.files, path, 'csv'))
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0][0], 'Name')
+        self.assertEqual([row[5] for row in rows[1:]], ['/data/movie.mp4', '/data/a<b>&c.txt'])
+        self.assertEqual(rows[1][1], str(5 * 1024 ** 3))
+
+    def test_html_export(self):
+        """Test that the HTML report lists every file with escaped names."""
+        path = os.path.join(self.temp_dir.name, 'files.html')
+        self.assertTrue(export_file_list(self.files, path, 'html', buffering=64))
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        self.assertIn('<strong>Total Files:</strong> 2', html)
+        self.assertIn('movie.mp4', html)
+        self.assertIn('a&lt;b&gt;&amp;c.txt', html)
+        self.assertTrue(html.endswith('</html>'))
+
+    def test_progress_callback(self):
+        """Test that progress is reported for every exported row."""
+        path = os.path.join(self.temp_dir.name, 'files.csv')
+        calls = []
+        export_file_list(self.files, path, 'csv',
+                         progress_callback=lambda *args: calls.append(args))
+        self.assertEqual(calls, [('movie.mp4', 1, 2), ('a<b>&c.txt', 2, 2)])
+
+    def test_unknown_format(self):
+        """Test that an unknown format is rejected."""
+        path = os.path.join(self.temp_dir.name, 'files.xml')
+        self.assertFalse(export_file_list(self.files, path, 'xml'))
+
+
+class TestTrashPaths(unittest.TestCase):
+    """Tests for trash_paths function."""
+
+    def test_returns_moved_paths_in_order(self):
+        """Test that only the paths moved without error are returned."""
+        def fake_send2trash(path):
+            if 'locked' in path:
+                raise OSError('in use')
+
+        paths = [f'/tmp/file{i}' for i in range(20)] + ['/tmp/locked']
+        with mock.patch('file_operations.send2trash', fake_send2trash, create=True):
+            moved = trash_paths(paths, max_workers=4)
+        self.assertEqual(moved, paths[:-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Unit tests for the preview pane's thumbnail cache."""
+
+import os
+import tempfile
+import unittest
+
+from ui.preview_pane import trim_thumb_cache
+
+
+class TestTrimThumbCache(unittest.TestCase):
+    """Tests for trim_thumb_cache function."""
+
+    def setUp(self):
+        """Create a cache directory with previews of different ages."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for age in range(4):
+            path = os.path.join(self.temp_dir.name, f'thumb{age}.webp')
+            with open(path, 'wb') as f:
+                f.write(b'x' * 100)
+            mtime = 1_000_000 - age * 1000
+            os.utime(path, (mtime, mtime))
+            self.paths.append(path)
+
+    def tearDown(self):
+        """Remove the cache directory."""
+        self.temp_dir.cleanup()
+
+    def test_removes_oldest_first(self):
+        """Test that the least recently used previews are removed."""
+        trim_thumb_cache(250, self.temp_dir.name)
+        self.assertEqual([os.path.exists(p) for p in self.paths], [True, True, False, False])
+
+    def test_keeps_cache_under_limit(self):
+        """Test that nothing is removed when the cache fits."""
+        trim_thumb_cache(400, self.temp_dir.name)
+        self.assertTrue(all(map(os.path.exists, self.paths)))
+
+    def test_missing_directory(self):
+        """Test that a cache not created yet is left alone."""
+        trim_thumb_cache(0, os.path.join(self.temp_dir.name, 'missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
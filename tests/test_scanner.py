@@ -5,7 +5,10 @@ import tempfile
 import os
 import time
 
-from scanner import FileInfo, scan_directory, scan_multiple_paths, SKIP_FOLDERS
+from scanner import (
+    FileInfo, iter_directory, iter_multiple_paths, scan_directory, scan_multiple_paths,
+    SKIP_FOLDERS
+)
 
 
 class TestFileInfo(unittest.TestCase):
@@ -43,6 +46,13 @@ class TestFileInfo(unittest.TestCase):
         self.assertTrue(hasattr(fi, 'last_modified'))
         self.assertTrue(hasattr(fi, 'extension'))
 
+    def test_file_info_has_no_instance_dict(self):
+        """Test that FileInfo uses slots instead of a per-instance dict."""
+        fi = FileInfo("/a", "a", 1, 0, 0, "")
+        self.assertFalse(hasattr(fi, '__dict__'))
+        with self.assertRaises(AttributeError):
+            fi.other = 1
+
 
 class TestScanDirectory(unittest.TestCase):
     """Tests for scan_directory function."""
@@ -84,6 +94,12 @@ class TestScanDirectory(unittest.TestCase):
         for fi in files:
             self.assertIsInstance(fi, FileInfo)
 
+    def test_iter_directory_is_lazy(self):
+        """Test that iter_directory yields files one at a time."""
+        files = iter_directory(self.temp_dir)
+        self.assertIsInstance(next(files), FileInfo)
+        self.assertEqual(len(list(files)), 7)
+
     def test_scan_captures_correct_metadata(self):
         """Test that file metadata is correct."""
         files = scan_directory(self.temp_dir)
@@ -159,6 +175,15 @@ class TestScanMultiplePaths(unittest.TestCase):
         files = scan_multiple_paths(self.temp_dirs)
         self.assertEqual(len(files), 6)  # 3 files * 2 dirs
 
+    def test_iter_multiple_paths_progress_is_cumulative(self):
+        """Test that progress counts continue across paths."""
+        counts = []
+        files = list(iter_multiple_paths(
+            self.temp_dirs, progress_callback=lambda path, count: counts.append(count)
+        ))
+        self.assertEqual(len(files), 6)
+        self.assertEqual(counts, [3, 6])
+
     def test_scan_multiple_with_stop_flag(self):
         """Test stop flag works across multiple paths."""
         count = [0]
@@ -72,11 +72,17 @@ class TestSizeParsing(unittest.TestCase):
         self.assertEqual(self.app._parse_size("  500 MB  "), 500 * 1024 * 1024)
         self.assertEqual(self.app._parse_size("1  GB"), 1024 ** 3)
 
+    def test_bare_number_is_bytes(self):
+        """Test that a number without a unit is taken as bytes."""
+        self.assertEqual(self.app._parse_size("2048"), 2048)
+
     def test_invalid_returns_zero(self):
         """Test invalid input returns zero."""
         self.assertEqual(self.app._parse_size("invalid"), 0)
         self.assertEqual(self.app._parse_size("MB"), 0)
         self.assertEqual(self.app._parse_size(""), 0)
+        self.assertEqual(self.app._parse_size("1.2.3 MB"), 0)
+        self.assertEqual(self.app._parse_size("5 PB"), 0)
 
     def test_mb_not_confused_with_b(self):
         """Test that MB is not confused with B (regression test)."""
@@ -139,6 +145,13 @@ class TestDaysParsing(unittest.TestCase):
         """Test invalid input returns zero."""
         self.assertEqual(self.app._parse_days("invalid"), 0)
         self.assertEqual(self.app._parse_days(""), 0)
+        self.assertEqual(self.app._parse_days("-5 days"), 0)
+
+    def test_other_spellings(self):
+        """Test day counts written without the combobox's spacing."""
+        self.assertEqual(self.app._parse_days("1 day"), 1)
+        self.assertEqual(self.app._parse_days("14days"), 14)
+        self.assertEqual(self.app._parse_days(" 60 "), 60)
 
     def test_all_dropdown_values(self):
         """Test all values from the dropdown menu."""
@@ -8,7 +8,7 @@ from scanner import FileInfo
 from analyzer import analyze_files
 from smart_analysis import (
     find_temp_files, find_large_folders, find_old_downloads,
-    analyze_disk_usage, TEMP_PATTERNS, TEMP_EXTENSIONS, USER_TEMP_PATHS
+    analyze_disk_usage, remove_deleted_files, TEMP_PATTERNS, TEMP_EXTENSIONS, USER_TEMP_PATHS
 )
 
 
@@ -232,6 +232,52 @@ class TestAnalyzeDiskUsage(unittest.TestCase):
         self.assertEqual(result['potential_savings'], 3000000)
 
 
+class TestRemoveDeletedFiles(unittest.TestCase):
+    """Tests for remove_deleted_files function."""
+
+    def _make_analyzed(self, path, size, timestamp):
+        """Helper to create analyzed file dict."""
+        name = os.path.basename(path)
+        ext = os.path.splitext(name)[1].lower()
+        fi = FileInfo(path, name, size, timestamp, timestamp, ext)
+        return {'file_info': fi, 'category': 'Other', 'staleness_score': 0}
+
+    def test_matches_fresh_analysis(self):
+        """Test that the updated results equal analyzing the remaining files."""
+        old = time.time() - (60 * 24 * 60 * 60)
+        gb = 1024 ** 3
+        files = [
+            self._make_analyzed("/home/user/Downloads/cache/big.tmp", gb, old),
+            self._make_analyzed("/home/user/Downloads/cache/other.zip", gb, old),
+            self._make_analyzed("/home/user/Downloads/cache/small.bin", 10, old),
+            self._make_analyzed("/data/videos/movie.mp4", 2 * gb, old),
+            self._make_analyzed("/data/temp/scratch.tmp", 500, old),
+        ]
+        deleted = [files[0], files[4]]
+
+        result = remove_deleted_files(analyze_disk_usage(files), deleted)
+        expected = analyze_disk_usage([f for f in files if f not in deleted])
+
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            [folder for folder, size, count in result['large_folders']],
+            ['/data/videos', '/home/user/Downloads/cache']
+        )
+
+    def test_drops_folders_below_threshold(self):
+        """Test that folders shrunk below 1 GB are no longer listed."""
+        gb = 1024 ** 3
+        now = time.time()
+        files = [
+            self._make_analyzed("/data/a.bin", gb, now),
+            self._make_analyzed("/data/b.bin", 100, now),
+        ]
+
+        result = remove_deleted_files(analyze_disk_usage(files), files[:1])
+
+        self.assertEqual(result['large_folders'], [])
+
+
 class TestConstants(unittest.TestCase):
     """Tests for module constants."""
 
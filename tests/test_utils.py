@@ -1,10 +1,15 @@
 """Unit tests for utils module."""
 
+import os
+import tempfile
 import unittest
 import time
 from datetime import datetime, timedelta
 
-from utils import format_size, format_date, days_since, get_available_drives
+from utils import (
+    format_size, format_status_size, format_date, days_since, get_available_drives,
+    load_json, save_json, JsonCache
+)
 
 
 class TestFormatSize(unittest.TestCase):
@@ -60,6 +65,20 @@ class TestFormatSize(unittest.TestCase):
         self.assertIsInstance(result, str)
 
 
+class TestFormatStatusSize(unittest.TestCase):
+    """Tests for format_status_size function."""
+
+    def test_small_sizes_exact(self):
+        """Test that sizes under 1 MB are formatted unchanged."""
+        for size in [0, 500, 1536, 1024 ** 2 - 1]:
+            self.assertEqual(format_status_size(size), format_size(size))
+
+    def test_large_sizes_rounded_to_kb(self):
+        """Test that large sizes format like their whole-KB value."""
+        size = 5 * 1024 ** 3 + 777
+        self.assertEqual(format_status_size(size), format_size(5 * 1024 ** 3))
+
+
 class TestFormatDate(unittest.TestCase):
     """Tests for format_date function."""
 
@@ -81,6 +100,18 @@ class TestFormatDate(unittest.TestCase):
         result = format_date(0)
         self.assertIsInstance(result, str)
 
+    def test_fractional_seconds(self):
+        """Test that fractions of a second don't change the result."""
+        now = int(time.time())
+        self.assertEqual(format_date(now + 0.25), format_date(now))
+        self.assertEqual(format_date(now + 0.75), format_date(now + 0.5))
+
+    def test_invalid_timestamp(self):
+        """Test that timestamps that aren't dates give Unknown."""
+        self.assertEqual(format_date(float('nan')), "Unknown")
+        self.assertEqual(format_date(float('inf')), "Unknown")
+        self.assertEqual(format_date(1e20), "Unknown")
+
 
 class TestDaysSince(unittest.TestCase):
     """Tests for days_since function."""
@@ -105,6 +136,17 @@ class TestDaysSince(unittest.TestCase):
         thirty_days_ago = time.time() - (30 * 24 * 60 * 60)
         self.assertEqual(days_since(thirty_days_ago), 30)
 
+    def test_invalid_timestamp(self):
+        """Test that a timestamp that isn't a number of seconds gives 0."""
+        self.assertEqual(days_since(float('nan')), 0)
+        self.assertEqual(days_since(None), 0)
+
+    def test_given_now(self):
+        """Test counting from a given current time."""
+        now = 1_700_000_000
+        self.assertEqual(days_since(now - 86400 * 3 - 1, now=now), 3)
+        self.assertEqual(days_since(now - 86400 * 3 + 1, now=now), 2)
+
 
 class TestGetAvailableDrives(unittest.TestCase):
     """Tests for get_available_drives function."""
@@ -127,5 +169,90 @@ class TestGetAvailableDrives(unittest.TestCase):
             self.assertTrue(drive.endswith('\\') or drive.endswith('/'))
 
 
+class TestJsonFiles(unittest.TestCase):
+    """Tests for load_json and save_json functions."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'data.json')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test that saved data loads back unchanged."""
+        data = {'name': 'Large videos', 'paths': ['C:\\Temp', 'D:\\Games']}
+        save_json(self.path, data)
+        self.assertEqual(load_json(self.path), data)
+
+    def test_save_replaces_existing(self):
+        """Test that saving overwrites and leaves no temporary file."""
+        save_json(self.path, [1, 2, 3])
+        save_json(self.path, [4])
+        self.assertEqual(load_json(self.path), [4])
+        self.assertEqual(os.listdir(self.temp_dir.name), ['data.json'])
+
+    def test_failed_save_removes_temporary_file(self):
+        """Test that a save that cannot replace the target cleans up."""
+        os.mkdir(self.path)
+        with self.assertRaises(OSError):
+            save_json(self.path, [1])
+        self.assertEqual(os.listdir(self.temp_dir.name), ['data.json'])
+        self.assertTrue(os.path.isdir(self.path))
+
+    def test_load_missing_returns_default(self):
+        """Test loading a file that does not exist."""
+        self.assertEqual(load_json(self.path, []), [])
+
+    def test_load_corrupt_returns_default(self):
+        """Test loading a file with invalid JSON."""
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+        self.assertEqual(load_json(self.path, {}), {})
+
+
+class TestJsonCache(unittest.TestCase):
+    """Tests for JsonCache."""
+
+    def setUp(self):
+        """Create a temporary directory and an empty cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'data.json')
+        self.cache = JsonCache()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_unchanged_file_returns_same_object(self):
+        """Test that an unchanged file is not parsed again."""
+        save_json(self.path, {'a': 1})
+        first = self.cache.get(self.path)
+        self.assertEqual(first, {'a': 1})
+        self.assertIs(self.cache.get(self.path), first)
+
+    def test_changed_file_is_reloaded(self):
+        """Test that a file with a new mtime is parsed again."""
+        save_json(self.path, [1])
+        self.assertEqual(self.cache.get(self.path), [1])
+        save_json(self.path, [2])
+        os.utime(self.path, ns=(0, 10 ** 9))
+        self.assertEqual(self.cache.get(self.path), [2])
+
+    def test_save_updates_cache(self):
+        """Test that saving through the cache makes get return that object."""
+        data = ['c:\\temp']
+        self.cache.save(self.path, data)
+        self.assertIs(self.cache.get(self.path), data)
+        self.assertEqual(load_json(self.path), data)
+
+    def test_missing_file_uses_each_default(self):
+        """Test that a missing file yields the default passed to each call."""
+        self.assertIsNone(self.cache.get(self.path))
+        self.assertEqual(self.cache.get(self.path, []), [])
+
+
 if __name__ == '__main__':
     unittest.main()
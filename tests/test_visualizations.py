@@ -0,0 +1,94 @@
+"""Unit tests for the visualization layout helpers."""
+
+import unittest
+
+from ui.visualizations import fold_small_categories, rank_categories, squarify
+
+
+class TestSquarify(unittest.TestCase):
+    """Tests for squarify function."""
+
+    def test_areas_proportional_to_sizes(self):
+        """Test that each rectangle's area matches its share of the total."""
+        sizes = [600, 300, 200, 100, 50, 25, 25]
+        rects = squarify(sizes, 0, 0, 400, 300)
+
+        self.assertEqual(len(rects), len(sizes))
+        total = sum(sizes)
+        for size, (x, y, w, h) in zip(sizes, rects):
+            self.assertAlmostEqual(w * h, 400 * 300 * size / total)
+
+    def test_rectangles_stay_inside(self):
+        """Test that every rectangle lies within the given space."""
+        rects = squarify([5, 4, 3, 2, 1], 10, 20, 200, 100)
+        for x, y, w, h in rects:
+            self.assertGreaterEqual(x, 10 - 1e-9)
+            self.assertGreaterEqual(y, 20 - 1e-9)
+            self.assertLessEqual(x + w, 210 + 1e-9)
+            self.assertLessEqual(y + h, 120 + 1e-9)
+
+    def test_rectangles_are_squarish(self):
+        """Test that equal sizes in a square give square-ish rectangles."""
+        rects = squarify([1] * 4, 0, 0, 100, 100)
+        for x, y, w, h in rects:
+            self.assertAlmostEqual(w, 50)
+            self.assertAlmostEqual(h, 50)
+
+    def test_equal_sizes_fill_space(self):
+        """Test that equal sizes get equal rectangles covering the space."""
+        rects = squarify([7] * 5, 0, 0, 300, 200)
+
+        self.assertEqual(len(rects), 5)
+        for x, y, w, h in rects:
+            self.assertAlmostEqual(w * h, 300 * 200 / 5)
+            self.assertLessEqual(x + w, 300 + 1e-9)
+            self.assertLessEqual(y + h, 200 + 1e-9)
+        self.assertAlmostEqual(max(y + h for x, y, w, h in rects), 200)
+
+    def test_empty(self):
+        """Test that nothing to lay out gives no rectangles."""
+        self.assertEqual(squarify([], 0, 0, 100, 100), [])
+        self.assertEqual(squarify([1, 2], 0, 0, 0, 100), [])
+
+
+class TestRankCategories(unittest.TestCase):
+    """Tests for rank_categories function."""
+
+    def test_largest_first_without_empty(self):
+        """Test that categories are ordered by size and empty ones dropped."""
+        ranked = rank_categories({'Audio': 10, 'Other': 0, 'Video': 30, 'Image': 20})
+        self.assertEqual(ranked, [('Video', 30), ('Image', 20), ('Audio', 10)])
+
+    def test_empty(self):
+        """Test that no sizes give no categories."""
+        self.assertEqual(rank_categories({}), [])
+        self.assertEqual(rank_categories({'Other': 0}), [])
+
+
+class TestFoldSmallCategories(unittest.TestCase):
+    """Tests for fold_small_categories function."""
+
+    def test_small_categories_folded(self):
+        """Test that small categories become one 'Other' in size order."""
+        ranked = [('Video', 100), ('Audio', 40), ('Image', 30), ('Code', 5), ('Game', 4)]
+        self.assertEqual(
+            fold_small_categories(ranked, 10),
+            [('Video', 100), ('Audio', 40), ('Image', 30), ('Other', 9)]
+        )
+
+    def test_merges_existing_other(self):
+        """Test that an existing 'Other' category takes the small ones."""
+        ranked = [('Video', 100), ('Other', 20), ('Audio', 15), ('Code', 5), ('Game', 4)]
+        self.assertEqual(
+            fold_small_categories(ranked, 10),
+            [('Video', 100), ('Other', 29), ('Audio', 15)]
+        )
+
+    def test_single_small_category_kept(self):
+        """Test that one small category keeps its name."""
+        ranked = [('Video', 100), ('Code', 5)]
+        self.assertEqual(fold_small_categories(ranked, 10), ranked)
+
+
+if __name__ == '__main__':
+    unittest.main()
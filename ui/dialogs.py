@@ -46,6 +46,16 @@ def show_info(parent, title: str, message: str):
     messagebox.showinfo(title, message, parent=parent)
 
 
+def ask_yes_no(parent, title: str, message: str, warning: bool = False) -> bool:
+    """Ask a yes/no question; returns True for yes."""
+    return messagebox.askyesno(
+        title,
+        message,
+        icon=messagebox.WARNING if warning else messagebox.QUESTION,
+        parent=parent
+    )
+
+
 def ask_folder(parent, title: str = "Select Folder") -> str:
     """
     Open a folder selection dialog.
@@ -3,9 +3,10 @@
 import tkinter as tk
 from tkinter import ttk
 import threading
-import os
+import time
 from utils import format_size, format_date
 from duplicate_finder import find_duplicates, get_duplicate_stats
+from file_operations import trash_files
 from ui.dialogs import ask_confirmation, show_info, show_error
 
 try:
@@ -22,7 +23,9 @@ class DuplicateFinderWindow:
         self.parent = parent
         self.files = files
         self.duplicates = {}
+        self.groups = []  # Duplicate groups in display order
         self.stop_scan = False
+        self._deleting = False  # A delete worker is moving files to the trash
 
         self.window = tk.Toplevel(parent)
         self.window.title("Duplicate File Finder")
@@ -141,25 +144,25 @@ class DuplicateFinderWindow:
             command=self.window.destroy
         ).pack(side=tk.RIGHT)
 
-        ttk.Button(
+        self.refresh_btn = ttk.Button(
             btn_frame,
             text="Refresh",
             command=self._start_scan
-        ).pack(side=tk.RIGHT, padx=5)
+        )
+        self.refresh_btn.pack(side=tk.RIGHT, padx=5)
 
     def _start_scan(self):
         """Start scanning for duplicates."""
         self.stop_scan = False
         self.duplicates = {}
+        self.groups = []
         self.tree.delete(*self.tree.get_children())
 
         self.progress_frame.pack(fill=tk.X, pady=(0, 10))
         self.progress['value'] = 0
 
         # Disable buttons during scan
-        self.delete_btn.config(state=tk.DISABLED)
-        self.keep_newest_btn.config(state=tk.DISABLED)
-        self.keep_oldest_btn.config(state=tk.DISABLED)
+        self._update_buttons()
 
         # Run scan in background
         thread = threading.Thread(target=self._scan_worker, daemon=True)
@@ -167,8 +170,17 @@ class DuplicateFinderWindow:
 
     def _scan_worker(self):
         """Background worker for finding duplicates."""
+        last_update = [0.0]
+
         def progress_callback(stage, current, total):
-            self.window.after(0, lambda: self._update_progress(stage, current, total))
+            # Throttle to ~30 updates/sec, always letting the final one through
+            now = time.monotonic()
+            if now - last_update[0] < 0.033 and current != total:
+                return
+            last_update[0] = now
+            self.window.after(
+                0, lambda s=stage, c=current, t=total: self._update_progress(s, c, t)
+            )
 
         def stop_flag():
             return self.stop_scan
@@ -205,10 +217,17 @@ class DuplicateFinderWindow:
         self._populate_tree()
 
         # Enable buttons
-        if self.duplicates and HAS_SEND2TRASH:
-            self.delete_btn.config(state=tk.NORMAL)
-            self.keep_newest_btn.config(state=tk.NORMAL)
-            self.keep_oldest_btn.config(state=tk.NORMAL)
+        self._update_buttons()
+
+    def _update_buttons(self):
+        """Enable the delete buttons if there are duplicates, unless a delete is running."""
+        can_delete = HAS_SEND2TRASH and self.duplicates and not self._deleting
+        state = tk.NORMAL if can_delete else tk.DISABLED
+        self.delete_btn.config(state=state)
+        self.keep_newest_btn.config(state=state)
+        self.keep_oldest_btn.config(state=state)
+        # A scan now would hash the files being trashed
+        self.refresh_btn.config(state=tk.DISABLED if self._deleting else tk.NORMAL)
 
     def _scan_error(self, error_msg):
         """Called on scan error."""
@@ -223,39 +242,56 @@ class DuplicateFinderWindow:
     def _populate_tree(self):
         """Populate the tree with duplicate groups."""
         self.tree.delete(*self.tree.get_children())
+        self.groups = list(self.duplicates.values())
 
-        for i, (hash_val, files) in enumerate(self.duplicates.items(), 1):
+        # There can be many thousands of rows, so they go straight to the
+        # Tcl insert command; Treeview.insert re-formats its keyword
+        # options into Tcl arguments on every call
+        call, widget = self.tree.tk.call, self.tree._w
+        for i, files in enumerate(self.groups):
             # Create group node
             size = files[0]['file_info'].size
-            group_id = self.tree.insert(
-                '', tk.END,
-                text=f"Group {i}",
-                values=('', format_size(size), f"{len(files)} files", ''),
-                open=True
+            group_id = call(
+                widget, 'insert', '', tk.END,
+                '-text', f"Group {i + 1}",
+                '-values', ('', format_size(size), f"{len(files)} files", ''),
+                '-open', True
             )
 
-            # Add files to group
-            for file_dict in files:
+            # Add files to group. Rows are addressed by "group:file" ids so the
+            # file dicts can be looked up in self.groups; the size is shared by
+            # the whole group and only shown on the group row.
+            for j, file_dict in enumerate(files):
                 file_info = file_dict['file_info']
-                self.tree.insert(
-                    group_id, tk.END,
-                    text='',
-                    values=(
+                call(
+                    widget, 'insert', group_id, tk.END,
+                    '-id', f"{i}:{j}",
+                    '-values', (
                         file_info.name,
-                        format_size(file_info.size),
+                        '',
                         file_info.path,
                         format_date(file_info.last_accessed)
                     ),
-                    tags=('file',)
+                    '-tags', 'file'
                 )
 
+    def _get_file_dict(self, iid: str):
+        """Get the file dict for a file row id, or None for group rows."""
+        group, sep, index = iid.partition(':')
+        if not sep:
+            return None
+        try:
+            return self.groups[int(group)][int(index)]
+        except (ValueError, IndexError):
+            return None
+
     def _get_selected_files(self) -> list:
-        """Get list of selected file paths."""
+        """Get list of selected file dicts."""
         selected = []
         for item in self.tree.selection():
-            values = self.tree.item(item, 'values')
-            if values and values[2] and os.path.isfile(values[2]):
-                selected.append(values[2])
+            file_dict = self._get_file_dict(item)
+            if file_dict is not None:
+                selected.append(file_dict)
         return selected
 
     def _delete_selected(self):
@@ -264,26 +300,23 @@ class DuplicateFinderWindow:
             show_error(self.window, "Error", "send2trash not installed")
             return
 
-        selected = self._get_selected_files()
-        if not selected:
+        selected_files = self._get_selected_files()
+        if not selected_files:
             show_info(self.window, "No Selection", "Select files to delete.")
             return
 
-        total_size = sum(os.path.getsize(p) for p in selected if os.path.exists(p))
+        selected = [f['file_info'].path for f in selected_files]
+        total_size = sum(f['file_info'].size for f in selected_files)
 
         if not ask_confirmation(self.window, selected, total_size):
             return
 
-        deleted = 0
-        for path in selected:
-            try:
-                send2trash(path)
-                deleted += 1
-            except Exception:
-                pass
+        def done(stats):
+            show_info(self.window, "Done", f"Deleted {stats['deleted']} file(s)")
+            self._drop_files(stats['deleted_files'])
+            self._start_scan()  # Refresh
 
-        show_info(self.window, "Done", f"Deleted {deleted} file(s)")
-        self._start_scan()  # Refresh
+        self._trash(selected_files, done)
 
     def _keep_newest(self):
         """Keep only the newest file in each group."""
@@ -313,34 +346,65 @@ class DuplicateFinderWindow:
             )
 
             # Keep first (newest/oldest), delete rest
-            for file_dict in sorted_files[1:]:
-                files_to_delete.append(file_dict['file_info'].path)
+            files_to_delete.extend(sorted_files[1:])
 
         if not files_to_delete:
             show_info(self.window, "Nothing to Delete", "No duplicate files to remove.")
             return
 
-        total_size = sum(
-            os.path.getsize(p) for p in files_to_delete
-            if os.path.exists(p)
-        )
+        # Sizes are known from the scan, so no need to stat every file
+        paths = [f['file_info'].path for f in files_to_delete]
+        total_size = sum(f['file_info'].size for f in files_to_delete)
 
         action = "newest" if newest else "oldest"
-        if not ask_confirmation(self.window, files_to_delete, total_size):
+        if not ask_confirmation(self.window, paths, total_size):
             return
 
-        deleted = 0
-        for path in files_to_delete:
+        def done(stats):
+            show_info(
+                self.window,
+                "Done",
+                f"Kept {action} file in each group.\n"
+                f"Deleted {stats['deleted']} file(s), "
+                f"freed {format_size(stats['total_size'])}"
+            )
+            self._drop_files(stats['deleted_files'])
+            self._start_scan()  # Refresh
+
+        self._trash(files_to_delete, done)
+
+    def _trash(self, file_dicts: list, on_done):
+        """
+        Move files to the Recycle Bin on a worker thread.
+
+        trash_files runs the moves concurrently; on_done(stats) is then
+        called on the Tk thread, unless the window was closed meanwhile.
+        """
+        self._deleting = True
+        self._update_buttons()
+        self.stats_var.set(f"Deleting {len(file_dicts):,} file(s)...")
+
+        def finish(stats):
+            self._deleting = False
+            on_done(stats)
+            self._update_buttons()
+
+        def worker():
+            stats = trash_files(file_dicts)
             try:
-                send2trash(path)
-                deleted += 1
-            except Exception:
-                pass
-
-        show_info(
-            self.window,
-            "Done",
-            f"Kept {action} file in each group.\n"
-            f"Deleted {deleted} file(s), freed {format_size(total_size)}"
-        )
-        self._start_scan()  # Refresh
+                self.window.after(0, self._if_open, finish, stats)
+            except tk.TclError:
+                pass  # Tk has shut down
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _if_open(self, callback, *args):
+        """Call callback(*args) unless the window was closed meanwhile."""
+        if self.window.winfo_exists():
+            callback(*args)
+
+    def _drop_files(self, file_dicts: list):
+        """Forget deleted files so a refresh doesn't hash them again."""
+        if file_dicts:
+            removed = set(map(id, file_dicts))
+            self.files = [f for f in self.files if id(f) not in removed]
@@ -4,9 +4,20 @@ import tkinter as tk
 from tkinter import ttk
 import os
 import subprocess
+from operator import attrgetter
 from utils import format_size, format_date
 
 
+# Sort key functions by column id, built once at import
+_SORT_KEYS = {
+    'size': attrgetter('file_info.size'),
+    'accessed': attrgetter('file_info.last_accessed'),
+    'name': lambda x: x.file_info.name.lower(),
+    'category': attrgetter('category'),
+    'path': attrgetter('path_lc'),
+}
+
+
 class FileTable(ttk.Frame):
     """A treeview table for displaying files with selection and context menu."""
 
@@ -17,11 +28,28 @@ class FileTable(ttk.Frame):
         ('category', 'Category', 80),
         ('path', 'Path', 400),
     ]
+    ROW_CACHE_SIZE = 4096  # Formatted rows kept for redisplay
+    # Sent on the treeview when the selection changes. The treeview's own
+    # <<TreeviewSelect>> also fires whenever scrolling moves the selected
+    # rows to other slots, so listeners bind this instead.
+    SELECT_EVENT = '<<FileTableSelect>>'
 
     def __init__(self, parent):
         super().__init__(parent)
-        self.files_data = []  # Store analyzed file dicts
-        self.selected_items = set()
+        # The table is virtualized: the treeview only holds one row per
+        # visible line ("slot"), and scrolling rewrites the slots' values.
+        # Selection is kept here so it can span rows that aren't shown.
+        self.files_data = []  # Displayed file dicts, in display order
+        self._top = 0  # Index in files_data of the first shown row
+        self._slots = []  # File dict in each treeview row; iid is the slot number
+        self._page = 10  # Rows that fit in the treeview
+        self._page_estimated = True  # _page not yet measured from a row
+        self._height = 0  # Treeview height in pixels
+        self._selected = {}  # id(file dict) -> selected file dict
+        self._selected_size = 0  # Total size of the selected files
+        self._row_cache = {}  # id(file dict) -> (file dict, column values)
+        self._cursor = None  # File dict with the keyboard focus
+        self._anchor = None  # File dict where shift-selection starts
         self.sort_column = 'size'
         self.sort_reverse = True
 
@@ -52,24 +80,45 @@ class FileTable(ttk.Frame):
             )
             self.tree.column(col_id, width=col_width, minwidth=50)
 
-        # Scrollbars
-        vsb = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        # Scrollbars; the vertical one scrolls files_data, not the treeview
+        self.vsb = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._yview)
         hsb = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(xscrollcommand=hsb.set)
 
         # Grid layout
         self.tree.grid(row=0, column=0, sticky='nsew')
-        vsb.grid(row=0, column=1, sticky='ns')
+        self.vsb.grid(row=0, column=1, sticky='ns')
         hsb.grid(row=1, column=0, sticky='ew')
 
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
         # Bind events
-        self.tree.bind('<<TreeviewSelect>>', self._on_selection_change)
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<Button-1>', self._on_click)
+        self.tree.bind('<Control-Button-1>', self._on_ctrl_click)
+        self.tree.bind('<Shift-Button-1>', self._on_shift_click)
         self.tree.bind('<Button-3>', self._on_right_click)  # Right-click
         self.tree.bind('<Double-1>', self._on_double_click)  # Double-click to open
 
+        # Scrolling and keyboard navigation move through files_data
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self._scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self._scroll(3))
+        moves = {
+            'Up': lambda: -1,
+            'Down': lambda: 1,
+            'Prior': lambda: -self._page_step(),
+            'Next': self._page_step,
+            'Home': lambda: -len(self.files_data),
+            'End': lambda: len(self.files_data),
+        }
+        for key, delta in moves.items():
+            self.tree.bind(f'<{key}>', lambda e, d=delta: self._move_cursor(d()))
+            self.tree.bind(
+                f'<Shift-{key}>', lambda e, d=delta: self._move_cursor(d(), extend=True)
+            )
+
     def _create_context_menu(self):
         """Create the right-click context menu."""
         self.context_menu = tk.Menu(self, tearoff=0)
@@ -116,13 +165,14 @@ class FileTable(ttk.Frame):
         # Select the item under cursor if not already selected
         item = self.tree.identify_row(event.y)
         if item:
-            if item not in self.tree.selection():
-                self.tree.selection_set(item)
+            file_dict = self._get_file_at_index(item)
+            if file_dict is not None and id(file_dict) not in self._selected:
+                self._cursor = self._anchor = file_dict
+                self._set_selection([file_dict])
 
             # Update menu state based on selection
-            selection = self.tree.selection()
-            has_selection = len(selection) > 0
-            single_selection = len(selection) == 1
+            has_selection = len(self._selected) > 0
+            single_selection = len(self._selected) == 1
 
             # Enable/disable menu items
             state_single = tk.NORMAL if single_selection else tk.DISABLED
@@ -149,45 +199,43 @@ class FileTable(ttk.Frame):
     def _get_file_at_index(self, iid: str):
         """Get file dict for a treeview item id."""
         try:
-            index = int(iid)
-            if 0 <= index < len(self.files_data):
-                return self.files_data[index]
+            return self.files_data[self._top + int(iid)]
         except (ValueError, IndexError):
-            pass
-        return None
+            return None
+
+    def _first_selected(self):
+        """Get the first selected file dict in display order, or None."""
+        selected = self.get_selected_files()
+        return selected[0] if selected else None
 
     def _open_selected_file(self):
         """Open the selected file with its default application."""
-        selected = self.tree.selection()
-        if selected:
-            file_dict = self._get_file_at_index(selected[0])
-            if file_dict:
-                path = file_dict['file_info'].path
-                try:
-                    os.startfile(path)
-                except OSError as e:
-                    from ui.dialogs import show_error
-                    show_error(self.winfo_toplevel(), "Error", f"Cannot open file:\n{e}")
+        file_dict = self._first_selected()
+        if file_dict:
+            path = file_dict['file_info'].path
+            try:
+                os.startfile(path)
+            except OSError as e:
+                from ui.dialogs import show_error
+                show_error(self.winfo_toplevel(), "Error", f"Cannot open file:\n{e}")
 
     def _open_file_location(self):
         """Open the file's folder in File Explorer and select it."""
-        selected = self.tree.selection()
-        if selected:
-            file_dict = self._get_file_at_index(selected[0])
-            if file_dict:
-                path = file_dict['file_info'].path
-                try:
-                    # Use explorer /select to open folder and highlight the file
-                    subprocess.run(['explorer', '/select,', path], check=False)
-                except Exception as e:
-                    from ui.dialogs import show_error
-                    show_error(self.winfo_toplevel(), "Error", f"Cannot open location:\n{e}")
+        file_dict = self._first_selected()
+        if file_dict:
+            path = file_dict['file_info'].path
+            try:
+                # Use explorer /select to open folder and highlight the file
+                subprocess.run(['explorer', '/select,', path], check=False)
+            except Exception as e:
+                from ui.dialogs import show_error
+                show_error(self.winfo_toplevel(), "Error", f"Cannot open location:\n{e}")
 
     def _copy_path(self):
         """Copy full path(s) of selected file(s) to clipboard."""
         selected = self.get_selected_files()
         if selected:
-            paths = [f['file_info'].path for f in selected]
+            paths = [f.file_info.path for f in selected]
             text = '\n'.join(paths)
             self.clipboard_clear()
             self.clipboard_append(text)
@@ -197,7 +245,7 @@ class FileTable(ttk.Frame):
         """Copy filename(s) of selected file(s) to clipboard."""
         selected = self.get_selected_files()
         if selected:
-            names = [f['file_info'].name for f in selected]
+            names = [f.file_info.name for f in selected]
             text = '\n'.join(names)
             self.clipboard_clear()
             self.clipboard_append(text)
@@ -206,11 +254,9 @@ class FileTable(ttk.Frame):
     def _show_properties(self):
         """Show properties dialog for selected file."""
         if self.on_show_properties:
-            selected = self.tree.selection()
-            if selected:
-                file_dict = self._get_file_at_index(selected[0])
-                if file_dict:
-                    self.on_show_properties(file_dict)
+            file_dict = self._first_selected()
+            if file_dict:
+                self.on_show_properties(file_dict)
 
     def _add_to_exclusion(self):
         """Add selected files to exclusion list."""
@@ -222,12 +268,10 @@ class FileTable(ttk.Frame):
     def _exclude_folder(self):
         """Add the folder containing selected file to exclusion list."""
         if self.on_exclude_file:
-            selected = self.tree.selection()
-            if selected:
-                file_dict = self._get_file_at_index(selected[0])
-                if file_dict:
-                    folder = os.path.dirname(file_dict['file_info'].path)
-                    self.on_exclude_file(folder)
+            file_dict = self._first_selected()
+            if file_dict:
+                folder = os.path.dirname(file_dict['file_info'].path)
+                self.on_exclude_file(folder)
 
     def _delete_selected(self):
         """Delete selected files (calls external handler)."""
@@ -249,112 +293,324 @@ class FileTable(ttk.Frame):
 
     def _sort_and_refresh(self):
         """Sort the data and refresh the display."""
-        if not self.files_data:
-            return
-
-        # Define sort keys
-        if self.sort_column == 'size':
-            key = lambda x: x['file_info'].size
-        elif self.sort_column == 'accessed':
-            key = lambda x: x['file_info'].last_accessed
-        elif self.sort_column == 'name':
-            key = lambda x: x['file_info'].name.lower()
-        elif self.sort_column == 'category':
-            key = lambda x: x['category']
-        elif self.sort_column == 'path':
-            key = lambda x: x['file_info'].path.lower()
-        else:
-            key = lambda x: x['file_info'].size
-
-        self.files_data.sort(key=key, reverse=self.sort_reverse)
+        if self.files_data:
+            key = _SORT_KEYS.get(self.sort_column, _SORT_KEYS['size'])
+            self.files_data.sort(key=key, reverse=self.sort_reverse)
         self._refresh_display()
 
     def _refresh_display(self):
         """Refresh the treeview display with current data."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Insert sorted data
-        for i, item in enumerate(self.files_data):
-            file_info = item['file_info']
-            values = (
-                file_info.name,
-                format_size(file_info.size),
-                format_date(file_info.last_accessed),
-                item['category'],
-                file_info.path,
-            )
-            self.tree.insert('', tk.END, iid=str(i), values=values)
+        # Rows that are no longer shown can't stay selected
+        changed = False
+        if self._selected:
+            shown = set(map(id, self.files_data))
+            kept = {key: f for key, f in self._selected.items() if key in shown}
+            changed = len(kept) != len(self._selected)
+            if changed:
+                self._selected = kept
+                self._selected_size = sum(f.file_info.size for f in kept.values())
+        if changed:
+            self._selection_changed()
+        else:
+            self._render()
+
+    def _render(self):
+        """Show the page of files_data starting at _top in the slots."""
+        data = self.files_data
+        self._top = max(0, min(self._top, len(data) - self._page))
+        rows = data[self._top:self._top + self._page]
+
+        # Only rewrite rows whose file changed, so re-filtering or removing
+        # files below the visible page leaves the treeview untouched
+        # Rows go straight to the Tcl commands, as scrolling rewrites a
+        # page of them per step and Treeview.insert/item re-format their
+        # keyword options every call
+        tree = self.tree
+        call, widget = tree.tk.call, tree._w
+        slots = self._slots
+        for slot, item in enumerate(rows):
+            if slot >= len(slots):
+                call(
+                    widget, 'insert', '', tk.END,
+                    '-id', str(slot), '-values', self._row_values(item)
+                )
+            elif item is not slots[slot]:
+                call(widget, 'item', str(slot), '-values', self._row_values(item))
+        if len(slots) > len(rows):
+            tree.delete(*map(str, range(len(rows), len(slots))))
+        self._slots = rows
+
+        selected = self._selected
+        shown = [str(slot) for slot, item in enumerate(rows) if id(item) in selected]
+        if set(shown) != set(tree.selection()):
+            tree.selection_set(shown)
+        for slot, item in enumerate(rows):
+            if item is self._cursor:
+                tree.focus(str(slot))
+                break
+
+        if data:
+            self.vsb.set(self._top / len(data), (self._top + len(rows)) / len(data))
+        else:
+            self.vsb.set(0, 1)
+
+        # The first real row gives the exact row and heading heights
+        if self._page_estimated and rows and self._height:
+            page = self._rows_fitting()
+            if page != self._page:
+                self._page = page
+                self._render()
+
+    def _row_values(self, item) -> tuple:
+        """Get the column values shown for a file."""
+        # Scrolling back and re-filtering show the same files again, so
+        # their formatted rows are kept. The cache holds the file dict
+        # itself, which keeps its id from being reused while cached.
+        cached = self._row_cache.get(id(item))
+        if cached is not None:
+            return cached[1]
+
+        file_info = item.file_info
+        values = (
+            file_info.name,
+            format_size(file_info.size),
+            format_date(file_info.last_accessed),
+            item.category,
+            file_info.path,
+        )
+        if len(self._row_cache) >= self.ROW_CACHE_SIZE:
+            self._row_cache.clear()
+        self._row_cache[id(item)] = (item, values)
+        return values
 
-    def _on_selection_change(self, event):
-        """Handle selection change in treeview."""
-        self.selected_items = set(self.tree.selection())
+    def _rows_fitting(self) -> int:
+        """Count the whole rows that fit in the treeview's height."""
+        try:
+            bbox = self.tree.bbox('0') if self._slots else ''
+        except tk.TclError:
+            bbox = ''
+        if bbox:
+            self._page_estimated = False
+            header, row_height = bbox[1], bbox[3]
+        else:
+            # Guess from the style, erring towards fewer rows
+            try:
+                row_height = int(ttk.Style(self).lookup('Treeview', 'rowheight') or 20)
+            except (tk.TclError, ValueError):
+                row_height = 20
+            header = 2 * row_height
+        return max(1, (self._height - header) // max(1, row_height))
+
+    def _on_resize(self, event):
+        """Fit the number of slots to the treeview's new height."""
+        self._height = event.height
+        page = self._rows_fitting()
+        if page != self._page:
+            self._page = page
+            self._render()
+
+    def _page_step(self) -> int:
+        """Rows to move for a page up or down."""
+        return max(1, self._page - 1)
+
+    def _yview(self, *args):
+        """Scroll files_data from the vertical scrollbar."""
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.files_data)))
+        elif args[0] == 'scroll':
+            count = int(args[1])
+            if args[2] == 'pages':
+                count *= self._page_step()
+            self._scroll(count)
+
+    def _scroll(self, count: int):
+        """Scroll by a number of rows."""
+        self._scroll_to(self._top + count)
+        return 'break'
+
+    def _scroll_to(self, top: int):
+        """Show files_data from index top, as far as it can be shown."""
+        top = max(0, min(top, len(self.files_data) - self._page))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch."""
+        return self._scroll(-3 if event.delta > 0 else 3)
+
+    def _clicked_file(self, event):
+        """Get the file dict of the row under a click, or None."""
+        if self.tree.identify_region(event.x, event.y) not in ('cell', 'tree'):
+            return None
+        return self._get_file_at_index(self.tree.identify_row(event.y))
+
+    def _on_click(self, event):
+        """Select the clicked row only."""
+        file_dict = self._clicked_file(event)
+        if file_dict is None:
+            return None  # Headings and column resizing keep their bindings
+        self.tree.focus_set()
+        self._cursor = self._anchor = file_dict
+        self._set_selection([file_dict])
+        return 'break'
+
+    def _on_ctrl_click(self, event):
+        """Toggle the clicked row's selection."""
+        file_dict = self._clicked_file(event)
+        if file_dict is None:
+            return None
+        self.tree.focus_set()
+        self._cursor = self._anchor = file_dict
+        if self._selected.pop(id(file_dict), None) is None:
+            self._selected[id(file_dict)] = file_dict
+            self._selected_size += file_dict.file_info.size
+        else:
+            self._selected_size -= file_dict.file_info.size
+        self._selection_changed()
+        return 'break'
+
+    def _on_shift_click(self, event):
+        """Select the rows from the anchor to the clicked row."""
+        file_dict = self._clicked_file(event)
+        if file_dict is None:
+            return None
+        self.tree.focus_set()
+        self._cursor = file_dict
+        self._select_from_anchor(self._position(file_dict))
+        return 'break'
+
+    def _move_cursor(self, delta: int, extend: bool = False):
+        """Move the keyboard focus by delta rows, selecting as it goes."""
+        data = self.files_data
+        if not data:
+            return 'break'
+        pos = self._position(self._cursor)
+        if pos is None:
+            pos = self._top
+        else:
+            pos = max(0, min(pos + delta, len(data) - 1))
+        self._cursor = data[pos]
+
+        # Keep the focused row in view
+        if pos < self._top:
+            self._top = pos
+        elif pos >= self._top + self._page:
+            self._top = pos - self._page + 1
 
-    def load_files(self, analyzed_files: list):
-        """Load analyzed files into the table."""
-        self.files_data = analyzed_files.copy()
+        if extend:
+            self._select_from_anchor(pos)
+        else:
+            self._anchor = self._cursor
+            self._set_selection([self._cursor])
+        return 'break'
+
+    def _position(self, file_dict):
+        """Get the index of a file dict in files_data, or None."""
+        if file_dict is None:
+            return None
+        # Usually on screen, so look there before searching everything
+        for pos in range(self._top, min(self._top + self._page, len(self.files_data))):
+            if self.files_data[pos] is file_dict:
+                return pos
+        try:
+            return self.files_data.index(file_dict)
+        except ValueError:
+            return None
+
+    def _select_from_anchor(self, pos: int):
+        """Select the rows between the anchor and index pos."""
+        anchor = self._position(self._anchor)
+        if anchor is None:
+            anchor = pos
+            self._anchor = self.files_data[pos]
+        low, high = min(anchor, pos), max(anchor, pos)
+        self._set_selection(self.files_data[low:high + 1])
+
+    def _set_selection(self, file_dicts):
+        """Replace the selection."""
+        self._selected = {id(f): f for f in file_dicts}
+        self._selected_size = sum(f.file_info.size for f in self._selected.values())
+        self._selection_changed()
+
+    def _selection_changed(self):
+        """Show a changed selection and notify SELECT_EVENT listeners."""
+        self._render()
+        self.tree.event_generate(self.SELECT_EVENT)
+
+    def load_files(self, analyzed_files: list, take_ownership: bool = False):
+        """
+        Load analyzed files into the table.
+
+        Args:
+            analyzed_files: List of analyzed file dicts
+            take_ownership: If True, keep a reference to the list instead of
+                copying it. The table sorts the list in place, so only pass
+                True for a freshly built list the caller won't mutate.
+        """
+        self.files_data = analyzed_files if take_ownership else analyzed_files.copy()
         self._sort_and_refresh()
 
     def clear(self):
         """Clear all files from the table."""
         self.files_data = []
-        self.selected_items = set()
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._selected = {}
+        self._selected_size = 0
+        self._cursor = self._anchor = None
+        self._top = 0
+        self._render()
 
     def get_selected_files(self) -> list:
-        """Get list of selected file dicts."""
-        selected = []
-        for iid in self.tree.selection():
-            try:
-                index = int(iid)
-                if 0 <= index < len(self.files_data):
-                    selected.append(self.files_data[index])
-            except (ValueError, IndexError):
-                continue
-        return selected
+        """Get list of selected file dicts, in display order."""
+        selected = self._selected
+        if len(selected) <= 1:
+            return list(selected.values())
+        return [f for f in self.files_data if id(f) in selected]
 
     def get_file_by_path(self, path: str):
         """Get file dict by path."""
         for file_dict in self.files_data:
-            if file_dict['file_info'].path == path:
+            if file_dict.file_info.path == path:
                 return file_dict
         return None
 
     def remove_file(self, file_dict):
         """Remove a file from the table."""
-        if file_dict in self.files_data:
-            self.files_data.remove(file_dict)
-            self._refresh_display()
+        self.remove_files([file_dict])
 
     def remove_files(self, file_dicts: list):
         """Remove multiple files from the table."""
+        removed = set(map(id, file_dicts))
+        self.files_data = [f for f in self.files_data if id(f) not in removed]
+        selected = len(self._selected)
         for file_dict in file_dicts:
-            if file_dict in self.files_data:
-                self.files_data.remove(file_dict)
-        self._refresh_display()
+            if self._selected.pop(id(file_dict), None) is not None:
+                self._selected_size -= file_dict.file_info.size
+        if len(self._selected) != selected:
+            self._selection_changed()
+        else:
+            self._render()
 
     def select_all(self):
         """Select all items in the table."""
-        items = self.tree.get_children()
-        self.tree.selection_set(items)
+        self._set_selection(self.files_data)
 
     def deselect_all(self):
         """Deselect all items in the table."""
-        self.tree.selection_remove(self.tree.selection())
+        self._set_selection(())
 
     def get_total_count(self) -> int:
         """Get total number of files in table."""
         return len(self.files_data)
 
+    def get_sort_key(self) -> tuple:
+        """Get the (key function, reverse) pair of the current sort order."""
+        return _SORT_KEYS.get(self.sort_column, _SORT_KEYS['size']), self.sort_reverse
+
     def get_selected_count(self) -> int:
         """Get number of selected files."""
-        return len(self.tree.selection())
+        return len(self._selected)
 
     def get_selected_size(self) -> int:
         """Get total size of selected files in bytes."""
-        total = 0
-        for item in self.get_selected_files():
-            total += item['file_info'].size
-        return total
+        return self._selected_size
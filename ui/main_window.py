@@ -3,39 +3,103 @@
 import tkinter as tk
 from tkinter import ttk
 import threading
-import json
 import os
-
-from utils import format_size, get_available_drives
-from scanner import scan_multiple_paths
-from analyzer import analyze_files, filter_files, CATEGORIES
+import queue
+import re
+import time
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import compress, islice
+from operator import not_
+
+from utils import (
+    format_size, format_status_size, get_available_drives, JsonCache
+)
+from scanner import iter_multiple_paths
+from analyzer import (
+    analyze_files_iter, build_filter_columns, filter_indices, ExclusionTrie,
+    SearchIndex, FileEntry, CATEGORIES
+)
 from ui.file_table import FileTable
 from ui.preview_pane import PreviewPane
 from ui.visualizations import VisualizationWindow
 from ui.duplicate_view import DuplicateFinderWindow
 from ui.smart_analysis_view import SmartAnalysisWindow
 from ui.dialogs import (
-    DriveSelectionDialog, ask_confirmation, show_info, show_error,
+    DriveSelectionDialog, ask_confirmation, ask_yes_no, show_info, show_error,
     FilePropertiesDialog, ExclusionListDialog
 )
 
-from file_operations import move_files, compress_files, export_file_list
+from file_operations import (
+    move_files, compress_files, export_file_list, trash_files, HAS_SEND2TRASH
+)
 from theme_manager import ThemeManager
 
-# Try to import send2trash for safe deletion
-try:
-    from send2trash import send2trash
-    HAS_SEND2TRASH = True
-except ImportError:
-    HAS_SEND2TRASH = False
+# Project root, where the config files live
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Filter combobox choices and their parsed values
+SIZE_CHOICES = {
+    "0": 0,
+    "1 MB": 1 << 20,
+    "10 MB": 10 << 20,
+    "50 MB": 50 << 20,
+    "100 MB": 100 << 20,
+    "500 MB": 500 << 20,
+    "1 GB": 1 << 30,
+}
+DAYS_CHOICES = {
+    "0 days": 0,
+    "7 days": 7,
+    "30 days": 30,
+    "90 days": 90,
+    "180 days": 180,
+    "365 days": 365,
+}
+
+
+# A number with an optional byte unit, e.g. "500 MB", "1.5gb" or "0"
+_SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d*)?|\.\d+)\s*([KMGT]?B)?\s*$', re.IGNORECASE)
+_SIZE_UNITS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024 ** 2,
+    'GB': 1024 ** 3,
+    'TB': 1024 ** 4,
+}
+
+# A whole number of days, e.g. "30 days", "1 day" or "7"
+_DAYS_RE = re.compile(r'^\s*(\d+)\s*(?:days?)?\s*$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def parse_size(size_str: str) -> int:
+    """Parse size string to bytes."""
+    match = _SIZE_RE.match(size_str)
+    if match is None:
+        return 0
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[(unit or 'B').upper()])
+
+
+@lru_cache(maxsize=128)
+def parse_days(days_str: str) -> int:
+    """Parse days string to integer."""
+    match = _DAYS_RE.match(days_str)
+    return int(match.group(1)) if match else 0
 
 
 class MainWindow:
     """Main application window."""
 
-    SETTINGS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'settings.json')
-    EXCLUSIONS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'exclusions.json')
-    PROFILES_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'profiles.json')
+    SETTINGS_FILE = os.path.join(_BASE_DIR, 'settings.json')
+    EXCLUSIONS_FILE = os.path.join(_BASE_DIR, 'exclusions.json')
+    PROFILES_FILE = os.path.join(_BASE_DIR, 'profiles.json')
+    FILTER_MEMO_SIZE = 8  # Filter results kept for reuse
+    PROFILE_MENU_START = 3  # Menu index of the first saved profile
+    LARGE_REPORT_SIZE = 50 * 1024 ** 2  # Warn before opening bigger reports
 
     def __init__(self, root):
         self.root = root
@@ -45,14 +109,40 @@ class MainWindow:
 
         self.all_files = []  # All scanned files
         self.filtered_files = []  # Currently displayed files
+        self._columns = build_filter_columns([])  # Filter columns for all_files
+        self._total_size = 0  # Sum of the size column
+        self._search_index = SearchIndex()  # Lowercased paths of all_files, built lazily
         self.exclusions = []  # Excluded paths
+        self._exclusion_trie = ExclusionTrie()  # Lowercased exclusion lookup
+        self._filter_memo = {}  # Recent filter keys -> indices, oldest first
+        self._filter_gen = 0  # Bumped to discard in-flight filter results
+        self._data_gen = 0  # Bumped whenever all_files changes
+        self._category = "All"  # Current category_var
+        self._min_size_bytes = 0  # Parsed min_size_var
+        self._min_days_int = 0  # Parsed min_days_var
+        self._search_term = ''  # Stripped, lowercased search_var
+        self._last_filter_key = None  # Filters behind the current view
+        self._last_partial_refresh = 0.0  # Last view refresh during a scan
         self.scan_thread = None
         self.stop_scan = False
+        self.delete_thread = None
+        self.stop_delete = threading.Event()
+        self._exporting = False  # An export thread is writing a file
+        self._json_cache = JsonCache()  # Parsed config files
+        self._select_timer = None  # Pending _refresh_selection call
+        self._filter_timer = None  # Pending debounced _apply_filters call
+        self._tool_windows = {}  # Window class -> (open window, data state)
+
+        # Defaults until the config files are loaded
+        self.profiles = {}
+        self._profile_names = []  # Sorted keys of profiles, in menu order
+        self.is_dark_mode = False
+        self.window_geometry = None
 
-        # Load settings
-        self._load_exclusions()
-        self._load_settings()
-        self._load_profiles()
+        # Read the config files off the main thread so slow disks don't
+        # delay the window; _poll_configs applies them when ready
+        preload = threading.Thread(target=self._preload_configs, daemon=True)
+        preload.start()
 
         # Initialize theme manager
         self.theme_manager = ThemeManager(root)
@@ -61,41 +151,51 @@ class MainWindow:
         self._create_menu()
         self._setup_callbacks()
 
-        # Apply theme after widgets are created
+        self._poll_configs(preload)
+
+    def _preload_configs(self):
+        """Parse the config files into the cache (runs on a worker thread)."""
+        for path in (self.EXCLUSIONS_FILE, self.SETTINGS_FILE, self.PROFILES_FILE):
+            self._json_cache.get(path)
+
+    def _poll_configs(self, thread: threading.Thread):
+        """Apply the config files once the preload thread has parsed them."""
+        if thread.is_alive():
+            self.root.after(20, self._poll_configs, thread)
+            return
+
+        self._load_exclusions()
+        self._load_settings()
+        self._load_profiles()
+
+        self.dark_mode_var.set(self.is_dark_mode)
         if self.is_dark_mode:
             self.theme_manager.set_dark_mode(True)
+        self._rebuild_profiles_menu()
+        if self.all_files:
+            self._apply_filters()
 
     def _load_exclusions(self):
-        """Load exclusion list from file."""
-        try:
-            if os.path.exists(self.EXCLUSIONS_FILE):
-                with open(self.EXCLUSIONS_FILE, 'r') as f:
-                    self.exclusions = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            self.exclusions = []
+        """Load exclusion list from file, unless it is unchanged since last load."""
+        exclusions = self._json_cache.get(self.EXCLUSIONS_FILE, [])
+        if exclusions is not self.exclusions:
+            self.exclusions = exclusions
+            self._rebuild_exclusion_index()
 
     def _save_exclusions(self):
         """Save exclusion list to file."""
         try:
-            with open(self.EXCLUSIONS_FILE, 'w') as f:
-                json.dump(self.exclusions, f, indent=2)
+            self._json_cache.save(self.EXCLUSIONS_FILE, self.exclusions)
         except IOError as e:
             show_error(self.root, "Error", f"Could not save exclusions: {e}")
 
     def _load_settings(self):
         """Load application settings from file."""
-        self.is_dark_mode = False
-        self.window_geometry = None
-        try:
-            if os.path.exists(self.SETTINGS_FILE):
-                with open(self.SETTINGS_FILE, 'r') as f:
-                    settings = json.load(f)
-                    self.is_dark_mode = settings.get('dark_mode', False)
-                    self.window_geometry = settings.get('geometry', None)
-                    if self.window_geometry:
-                        self.root.geometry(self.window_geometry)
-        except (json.JSONDecodeError, IOError):
-            pass
+        settings = self._json_cache.get(self.SETTINGS_FILE, {})
+        self.is_dark_mode = settings.get('dark_mode', False)
+        self.window_geometry = settings.get('geometry', None)
+        if self.window_geometry:
+            self.root.geometry(self.window_geometry)
 
     def _save_settings(self):
         """Save application settings to file."""
@@ -104,26 +204,19 @@ class MainWindow:
                 'dark_mode': self.is_dark_mode,
                 'geometry': self.root.geometry()
             }
-            with open(self.SETTINGS_FILE, 'w') as f:
-                json.dump(settings, f, indent=2)
+            self._json_cache.save(self.SETTINGS_FILE, settings)
         except IOError:
             pass
 
     def _load_profiles(self):
         """Load filter profiles from file."""
-        self.profiles = {}
-        try:
-            if os.path.exists(self.PROFILES_FILE):
-                with open(self.PROFILES_FILE, 'r') as f:
-                    self.profiles = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            self.profiles = {}
+        self.profiles = self._json_cache.get(self.PROFILES_FILE, {})
+        self._profile_names = sorted(self.profiles)
 
     def _save_profiles(self):
         """Save filter profiles to file."""
         try:
-            with open(self.PROFILES_FILE, 'w') as f:
-                json.dump(self.profiles, f, indent=2)
+            self._json_cache.save(self.PROFILES_FILE, self.profiles)
         except IOError:
             pass
 
@@ -200,11 +293,17 @@ class MainWindow:
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="About", command=self._show_about)
 
-        # Keyboard shortcuts
-        self.root.bind('<Control-n>', lambda e: self._on_scan())
-        self.root.bind('<Control-a>', lambda e: self.file_table.select_all())
-        self.root.bind('<F5>', lambda e: self._apply_filters())
-        self.root.bind('<Delete>', lambda e: self._on_delete())
+        # Keyboard shortcuts, bound to the same commands as the menu items.
+        # Binding a registered command by name calls it without building
+        # a tkinter Event (and its %-substitutions) on every keypress.
+        shortcuts = {
+            '<Control-n>': self._on_scan,
+            '<Control-a>': self.file_table.select_all,
+            '<F5>': self._apply_filters,
+            '<Delete>': self._on_delete,
+        }
+        for sequence, command in shortcuts.items():
+            self.root.bind(sequence, self.root.register(command))
 
     def _create_widgets(self):
         """Create all UI widgets."""
@@ -232,7 +331,7 @@ class MainWindow:
         self.preview_pane.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0))
 
         # Bind file selection to preview update
-        self.file_table.tree.bind('<<TreeviewSelect>>', self._on_file_select)
+        self.file_table.tree.bind(FileTable.SELECT_EVENT, self._on_file_select)
 
         # Bottom status bar
         self._create_statusbar(main_frame)
@@ -321,6 +420,7 @@ class MainWindow:
         # Category filter
         ttk.Label(filter_row, text="Category:").pack(side=tk.LEFT)
         self.category_var = tk.StringVar(value="All")
+        self.category_var.trace_add('write', self._on_category_change)
         categories = ["All"] + list(CATEGORIES.keys()) + ["Other"]
         category_combo = ttk.Combobox(
             filter_row,
@@ -330,35 +430,35 @@ class MainWindow:
             width=12
         )
         category_combo.pack(side=tk.LEFT, padx=(5, 20))
-        category_combo.bind('<<ComboboxSelected>>', lambda e: self._apply_filters())
+        category_combo.bind('<<ComboboxSelected>>', lambda e: self._schedule_filters())
 
         # Minimum size filter
         ttk.Label(filter_row, text="Min Size:").pack(side=tk.LEFT)
         self.min_size_var = tk.StringVar(value="0")
-        sizes = ["0", "1 MB", "10 MB", "50 MB", "100 MB", "500 MB", "1 GB"]
+        self.min_size_var.trace_add('write', self._on_min_size_change)
         size_combo = ttk.Combobox(
             filter_row,
             textvariable=self.min_size_var,
-            values=sizes,
+            values=list(SIZE_CHOICES),
             state='readonly',
             width=10
         )
         size_combo.pack(side=tk.LEFT, padx=(5, 20))
-        size_combo.bind('<<ComboboxSelected>>', lambda e: self._apply_filters())
+        size_combo.bind('<<ComboboxSelected>>', lambda e: self._schedule_filters())
 
         # Days since access filter
         ttk.Label(filter_row, text="Not accessed for:").pack(side=tk.LEFT)
         self.min_days_var = tk.StringVar(value="0 days")
-        days = ["0 days", "7 days", "30 days", "90 days", "180 days", "365 days"]
+        self.min_days_var.trace_add('write', self._on_min_days_change)
         days_combo = ttk.Combobox(
             filter_row,
             textvariable=self.min_days_var,
-            values=days,
+            values=list(DAYS_CHOICES),
             state='readonly',
             width=10
         )
         days_combo.pack(side=tk.LEFT, padx=(5, 20))
-        days_combo.bind('<<ComboboxSelected>>', lambda e: self._apply_filters())
+        days_combo.bind('<<ComboboxSelected>>', lambda e: self._schedule_filters())
 
         # Apply button
         ttk.Button(
@@ -402,13 +502,13 @@ class MainWindow:
             textvariable=self.selection_var
         ).pack(side=tk.RIGHT)
 
-        # Bind selection update
-        self.file_table.tree.bind('<<TreeviewSelect>>', self._update_selection_info)
-
     def _add_to_exclusion(self, path: str):
         """Add a path to the exclusion list."""
         if path not in self.exclusions:
             self.exclusions.append(path)
+            # A filter worker may be compiling the current matcher's regex,
+            # so it is replaced rather than extended in place
+            self._rebuild_exclusion_index()
             self._save_exclusions()
             show_info(self.root, "Exclusion Added", f"Added to exclusion list:\n{path}")
             # Refresh to hide excluded files
@@ -416,8 +516,12 @@ class MainWindow:
 
     def _show_exclusion_list(self):
         """Show the exclusion list management dialog."""
+        # Pick up edits made outside the app; a stat when nothing changed
+        self._load_exclusions()
+
         def on_save(new_exclusions):
             self.exclusions = new_exclusions
+            self._rebuild_exclusion_index()
             self._save_exclusions()
             self._apply_filters()
 
@@ -440,50 +544,121 @@ class MainWindow:
         if not file_dicts:
             return
 
-        total_size = sum(f['file_info'].size for f in file_dicts)
-        paths = [f['file_info'].path for f in file_dicts]
-
-        if not ask_confirmation(self.root, paths, total_size):
+        if self.delete_thread and self.delete_thread.is_alive():
+            show_info(self.root, "Busy", "A deletion is already in progress.")
             return
 
-        deleted_count = 0
-        failed_count = 0
+        total_size = sum(f.file_info.size for f in file_dicts)
+        paths = [f.file_info.path for f in file_dicts]
 
-        for file_dict in file_dicts:
-            path = file_dict['file_info'].path
-            try:
-                send2trash(path)
-                deleted_count += 1
-                if file_dict in self.all_files:
-                    self.all_files.remove(file_dict)
-            except Exception:
-                failed_count += 1
+        if not ask_confirmation(self.root, paths, total_size):
+            return
 
+        self.stop_delete.clear()
+        self.stop_btn.config(state=tk.NORMAL)
+        self.status_var.set(f"Deleting {len(file_dicts):,} file(s)...")
+        if not self._scan_running():
+            # The scan owns the progress bar while it runs
+            self.progress.config(mode='determinate', maximum=len(file_dicts), value=0)
+
+        self.delete_thread = threading.Thread(
+            target=self._delete_worker,
+            args=(file_dicts,),
+            daemon=True
+        )
+        self.delete_thread.start()
+
+    def _scan_running(self) -> bool:
+        """Check whether a scan is in progress."""
+        return bool(self.scan_thread and self.scan_thread.is_alive())
+
+    def _delete_worker(self, file_dicts: list):
+        """Worker thread for moving files to the Recycle Bin."""
+        progress_callback = self._throttled_progress(self._update_delete_progress)
+        stats = trash_files(file_dicts, progress_callback, self.stop_delete.is_set)
+        self.root.after(0, self._delete_finalize, stats)
+
+    def _throttled_progress(self, update):
+        """
+        Make a worker's (name, current, total) progress callback that posts
+        update(current, total) to the Tk thread at most every 100 ms, so
+        fast workers don't flood the event queue. The last item is always
+        posted.
+        """
+        last_post = 0.0
+
+        def progress_callback(name, current, total):
+            nonlocal last_post
+            now = time.monotonic()
+            if now - last_post >= 0.1 or current == total:
+                last_post = now
+                self.root.after(0, update, current, total)
+
+        return progress_callback
+
+    def _update_delete_progress(self, current: int, total: int):
+        """Show deletion progress in the status bar."""
+        self.status_var.set(f"Deleting... {current:,} of {total:,} file(s)")
+        if str(self.progress['mode']) == 'determinate':
+            self.progress['value'] = current
+
+    def _delete_finalize(self, stats: dict):
+        """Called on the main thread when deletion finishes."""
+        if not self._scan_running():
+            self.stop_btn.config(state=tk.DISABLED)
+            self.progress.config(mode='indeterminate', value=0)
+
+        self._remove_files(stats['deleted_files'])
         self._apply_filters()
 
-        if failed_count == 0:
+        if stats['failed'] == 0:
             show_info(
                 self.root,
                 "Deletion Complete",
-                f"Successfully moved {deleted_count} file(s) to Recycle Bin.\n"
-                f"Freed: {format_size(total_size)}"
+                f"Successfully moved {stats['deleted']} file(s) to Recycle Bin.\n"
+                f"Freed: {format_size(stats['total_size'])}"
             )
         else:
             show_info(
                 self.root,
                 "Deletion Complete",
-                f"Moved {deleted_count} file(s) to Recycle Bin.\n"
-                f"Failed to delete {failed_count} file(s)."
+                f"Moved {stats['deleted']} file(s) to Recycle Bin.\n"
+                f"Failed to delete {stats['failed']} file(s)."
             )
 
-    def _is_excluded(self, path: str) -> bool:
-        """Check if a path is in the exclusion list."""
-        path_lower = path.lower()
-        for exc in self.exclusions:
-            exc_lower = exc.lower()
-            if path_lower == exc_lower or path_lower.startswith(exc_lower + os.sep):
-                return True
-        return False
+    def _rebuild_exclusion_index(self):
+        """Precompute lowercased exclusion lookups after the list changes."""
+        self._exclusion_trie = ExclusionTrie(exc.lower() for exc in self.exclusions)
+        self._invalidate_filters()
+
+    def _set_all_files(self, analyzed_files: list[FileEntry]):
+        """Replace the scanned file list and rebuild its filter columns."""
+        self.all_files = analyzed_files
+        self._data_gen += 1
+        self._columns = build_filter_columns(analyzed_files)
+        self._total_size = sum(self._columns['size'])
+        self._search_index = SearchIndex(f.path_lc for f in analyzed_files)
+        self._invalidate_filters()
+
+    def _remove_files(self, file_dicts: list):
+        """Drop deleted or moved files from all_files and the table."""
+        if not file_dicts:
+            return
+        removed = set(map(id, file_dicts))
+        keep = [id(f) not in removed for f in self.all_files]
+
+        # One pass over the list and each column instead of a
+        # list.remove() scan per file
+        self.all_files = list(compress(self.all_files, keep))
+        self._data_gen += 1
+        self._total_size -= sum(compress(self._columns['size'], map(not_, keep)))
+        self._columns = {
+            name: array(column.typecode, compress(column, keep))
+            for name, column in self._columns.items()
+        }
+        self._search_index = None
+        self._invalidate_filters()
+        self.file_table.remove_files(file_dicts)
 
     def _on_scan(self):
         """Handle scan button click."""
@@ -505,77 +680,129 @@ class MainWindow:
         self.scan_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
         self.file_table.clear()
-        self.all_files = []
+        self._set_all_files([])
+        self._last_partial_refresh = time.monotonic()
+        self.progress.config(mode='indeterminate', value=0)
         self.progress.start(10)
         self.status_var.set("Scanning...")
 
+        # Files and progress are drained by one poller instead of an
+        # after() per update
+        scan_queue = queue.SimpleQueue()
+        self.root.after(50, self._poll_scan_queue, scan_queue)
+
         self.scan_thread = threading.Thread(
             target=self._scan_worker,
-            args=(selected_drives,),
+            args=(selected_drives, scan_queue),
             daemon=True
         )
         self.scan_thread.start()
 
-    def _scan_worker(self, drives):
-        """Worker thread for scanning."""
-        self._last_update = 0
+    def _scan_worker(self, drives, scan_queue):
+        """
+        Worker thread for scanning.
+
+        Posts ('files', batch) and ('progress', (path, count)) messages to
+        scan_queue, then ('done', finish) with the method that ends the scan.
+        """
+        last_post = 0.0
 
         def progress_callback(path, count):
-            # Throttle updates to every 200ms to keep UI responsive
-            import time
-            current_time = time.time()
-            if current_time - self._last_update >= 0.2:
-                self._last_update = current_time
-                self.root.after(0, lambda p=path, c=count: self.status_var.set(
-                    f"Scanning... {c:,} files found. Current: {p[:50]}..."
-                ))
+            # Just hand the update over; _poll_scan_queue shows the latest
+            nonlocal last_post
+            now = time.monotonic()
+            if now - last_post >= 0.1:
+                last_post = now
+                scan_queue.put(('progress', (path, count)))
 
         def stop_flag():
             return self.stop_scan
 
         try:
-            files = scan_multiple_paths(drives, progress_callback, stop_flag)
-            if self.stop_scan:
-                analyzed = analyze_files(files)
-                self.root.after(0, lambda: self._scan_stopped(analyzed))
-            else:
-                analyzed = analyze_files(files)
-                self.root.after(0, lambda: self._scan_complete(analyzed))
+            # Analyze and publish files in batches while the scan is still
+            # running, so results show up progressively; the queue keeps
+            # the batches in order ahead of the final message
+            files = iter_multiple_paths(drives, progress_callback, stop_flag)
+            for chunk in analyze_files_iter(files, chunk_size=1000):
+                scan_queue.put(('files', chunk))
+            finish = self._scan_stopped if self.stop_scan else self._scan_complete
         except Exception as e:
-            self.root.after(0, lambda: self._scan_error(str(e)))
+            error = str(e)
+            finish = lambda: self._scan_error(error)
+        scan_queue.put(('done', finish))
+
+    def _poll_scan_queue(self, scan_queue):
+        """Apply the file batches and progress posted by the scan worker."""
+        latest = None
+        while True:
+            try:
+                kind, payload = scan_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'files':
+                self._extend_files(payload)
+            elif kind == 'progress':
+                latest = payload  # Only the newest count is worth showing
+            else:
+                payload()  # Sets the final status, so latest is dropped
+                return
+
+        if latest is not None:
+            self._set_scan_status(*latest)
+        self.root.after(50, self._poll_scan_queue, scan_queue)
+
+    def _set_scan_status(self, path: str, count: int):
+        """Show scan progress in the status bar."""
+        self.status_var.set(f"Scanning... {count:,} files found. Current: {path[:50]}...")
+
+    def _extend_files(self, chunk: list[FileEntry]):
+        """Append a batch of scanned files and refresh the view periodically."""
+        self.all_files.extend(chunk)
+        self._data_gen += 1
+        columns = build_filter_columns(chunk)
+        for name, column in columns.items():
+            self._columns[name].extend(column)
+        self._total_size += sum(columns['size'])
+        # Results being computed for the shorter list are still worth
+        # showing, so only the cache is dropped here
+        self._search_index = None
+        self._filter_memo = {}
+
+        now = time.monotonic()
+        if now - self._last_partial_refresh >= 1.0:
+            self._last_partial_refresh = now
+            self._apply_filters()
 
-    def _scan_complete(self, analyzed_files):
+    def _scan_complete(self):
         """Called when scan is complete."""
         self.progress.stop()
         self.scan_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
 
-        self.all_files = analyzed_files
-        self.filtered_files = analyzed_files
-
-        total_size = sum(f['file_info'].size for f in analyzed_files)
+        # _extend_files kept the filter columns up to date; the search
+        # index is left for the filter worker to build off the UI thread
+        self._invalidate_filters()
 
         self.status_var.set(
-            f"Scan complete! Found {len(analyzed_files):,} files "
-            f"({format_size(total_size)} total)"
+            f"Scan complete! Found {len(self.all_files):,} files "
+            f"({format_status_size(self._total_size)} total)"
         )
 
         self._apply_filters()
 
-    def _scan_stopped(self, analyzed_files):
+    def _scan_stopped(self):
         """Called when scan is stopped by user."""
         self.progress.stop()
         self.scan_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
 
-        self.all_files = analyzed_files
-        self.filtered_files = analyzed_files
-
-        total_size = sum(f['file_info'].size for f in analyzed_files)
+        # _extend_files kept the filter columns up to date; the search
+        # index is left for the filter worker to build off the UI thread
+        self._invalidate_filters()
 
         self.status_var.set(
-            f"Scan stopped. Found {len(analyzed_files):,} files "
-            f"({format_size(total_size)} total)"
+            f"Scan stopped. Found {len(self.all_files):,} files "
+            f"({format_status_size(self._total_size)} total)"
         )
 
         self._apply_filters()
@@ -590,47 +817,48 @@ class MainWindow:
 
     def _on_stop(self):
         """Handle stop button click."""
+        if self.delete_thread and self.delete_thread.is_alive():
+            self.stop_delete.set()
+            self.status_var.set("Stopping deletion...")
+            return
         self.stop_scan = True
         self.status_var.set("Stopping scan...")
 
     def _parse_size(self, size_str: str) -> int:
         """Parse size string to bytes."""
-        size_str = size_str.strip().upper()
-        if size_str == "0":
-            return 0
-
-        # Check longer suffixes first to avoid 'B' matching before 'MB'
-        multipliers = [
-            ('TB', 1024 ** 4),
-            ('GB', 1024 ** 3),
-            ('MB', 1024 ** 2),
-            ('KB', 1024),
-            ('B', 1),
-        ]
-
-        for suffix, mult in multipliers:
-            if size_str.endswith(suffix):
-                num = size_str[:-len(suffix)].strip()
-                try:
-                    return int(float(num) * mult)
-                except ValueError:
-                    return 0
-        return 0
+        # Combobox choices are looked up; anything else (e.g. from an
+        # older profile) goes through the general parser
+        size = SIZE_CHOICES.get(size_str)
+        return parse_size(size_str) if size is None else size
 
     def _parse_days(self, days_str: str) -> int:
         """Parse days string to integer."""
-        try:
-            return int(days_str.split()[0])
-        except (ValueError, IndexError):
-            return 0
+        days = DAYS_CHOICES.get(days_str)
+        return parse_days(days_str) if days is None else days
+
+    def _on_category_change(self, *args):
+        """Remember the category whenever its variable changes."""
+        self._category = self.category_var.get()
+
+    def _on_min_size_change(self, *args):
+        """Re-parse the minimum size whenever its variable changes."""
+        self._min_size_bytes = self._parse_size(self.min_size_var.get())
+
+    def _on_min_days_change(self, *args):
+        """Re-parse the minimum age whenever its variable changes."""
+        self._min_days_int = self._parse_days(self.min_days_var.get())
 
     def _on_search_change(self):
         """Handle search text change with debounce."""
-        # Cancel previous timer if exists
-        if hasattr(self, '_search_timer') and self._search_timer:
-            self.root.after_cancel(self._search_timer)
+        self._search_term = self.search_var.get().strip().lower()
         # Debounce: wait 300ms before applying filter
-        self._search_timer = self.root.after(300, self._apply_filters)
+        self._schedule_filters(300)
+
+    def _schedule_filters(self, delay: int = 150):
+        """Apply the filters after delay ms, restarting any pending wait."""
+        if self._filter_timer:
+            self.root.after_cancel(self._filter_timer)
+        self._filter_timer = self.root.after(delay, self._apply_filters)
 
     def _clear_search(self):
         """Clear the search box."""
@@ -639,45 +867,147 @@ class MainWindow:
 
     def _apply_filters(self):
         """Apply current filters to the file list."""
+        # This covers any debounced call still waiting
+        if self._filter_timer:
+            self.root.after_cancel(self._filter_timer)
+            self._filter_timer = None
         if not self.all_files:
             return
 
-        category = self.category_var.get()
+        category = self._category
         categories = None if category == "All" else [category]
-        min_size = self._parse_size(self.min_size_var.get())
-        min_days = self._parse_days(self.min_days_var.get())
-        search_term = self.search_var.get().strip().lower()
-
-        # Apply standard filters
-        self.filtered_files = filter_files(
-            self.all_files,
-            categories=categories,
-            min_size=min_size,
-            min_days_old=min_days
-        )
+        min_size = self._min_size_bytes
+        min_days = self._min_days_int
+        search_term = self._search_term
+
+        # Re-selecting the same value or refreshing twice changes nothing;
+        # data changes reset the key through _invalidate_filters
+        filter_key = (category, min_size, min_days, search_term, len(self.all_files))
+        if filter_key == self._last_filter_key:
+            return
+        self._last_filter_key = filter_key
+
+        # Any result still being computed is now stale
+        self._filter_gen += 1
+
+        if (categories is None and not min_size and not min_days
+                and not search_term and not self._exclusion_trie):
+            # Nothing to filter: show everything without building indices
+            self._show_filtered(self.all_files.copy(), self._total_size)
+            return
 
-        # Apply exclusion filter
-        self.filtered_files = [
-            f for f in self.filtered_files
-            if not self._is_excluded(f['file_info'].path)
-        ]
+        # Filter (and pre-sort) on a worker thread so typing stays responsive;
+        # the worker only reads this snapshot, and _filter_done drops its
+        # result if another filter or a data change happened meanwhile.
+        # A scan keeps extending all_files and the columns in place, so
+        # the worker only reads their first count entries.
+        params = (category, categories, min_size, min_days, search_term)
+        snapshot = (
+            self.all_files, len(self.all_files), self._columns, self._search_index,
+            self._exclusion_trie, dict(self._filter_memo)
+        )
+        threading.Thread(
+            target=self._filter_worker,
+            args=(self._filter_gen, params, snapshot, self.file_table.get_sort_key()),
+            daemon=True
+        ).start()
+
+    def _filter_worker(self, gen: int, params: tuple, snapshot: tuple, sort_key: tuple):
+        """Worker thread computing a filter result from a snapshot."""
+        category, categories, min_size, min_days, search_term = params
+        all_files, count, columns, search_index, exclusion_trie, memo = snapshot
+        # Array slices are cheap copies that a scan can't grow underneath us
+        columns = {name: column[:count] for name, column in columns.items()}
+
+        # A recent result for the same filters and a prefix of the search
+        # term (e.g. while the user keeps typing) already holds every match
+        memo_key = (category, min_size, min_days, search_term)
+        base = None
+        for key, memo_indices in memo.items():
+            term = key[3]
+            if key[:3] == memo_key[:3] and search_term.startswith(term) and \
+                    (base is None or len(term) > len(base[0])):
+                base = (term, memo_indices)
+
+        if base is not None:
+            term, indices = base
+            if search_term != term:
+                if search_index is None:
+                    search_index = SearchIndex(f.path_lc for f in islice(all_files, count))
+                indices = search_index.refine(indices, search_term)
+        else:
+            # Apply search filter first: a search usually keeps few files,
+            # so the column filters then only read the matches. The name is
+            # part of the path, so searching the lowercased paths covers both.
+            matches = None
+            if search_term:
+                if search_index is None:
+                    search_index = SearchIndex(f.path_lc for f in islice(all_files, count))
+                matches = search_index.find(search_term)
+
+            # Apply standard filters over the column arrays
+            indices = filter_indices(
+                columns,
+                categories=categories,
+                min_size=min_size,
+                min_days_old=min_days,
+                indices=matches
+            )
 
-        # Apply search filter
-        if search_term:
-            self.filtered_files = [
-                f for f in self.filtered_files
-                if search_term in f['file_info'].name.lower()
-                or search_term in f['file_info'].path.lower()
-            ]
+            # Apply exclusion filter last, so the per-path regex only runs
+            # on files that survived the cheaper column and search passes
+            if exclusion_trie and indices:
+                excluded = exclusion_trie.regex.match
+                indices = [
+                    i for i in indices
+                    if excluded(all_files[i].path_lc) is None
+                ]
+
+        filtered = list(map(all_files.__getitem__, indices))
+        # Sorting here leaves the table's own sort a linear pass over a run
+        key, reverse = sort_key
+        filtered.sort(key=key, reverse=reverse)
+
+        sizes = columns['size']
+        if len(indices) == len(sizes):
+            total_size = sum(sizes)
+        else:
+            total_size = sum(map(sizes.__getitem__, indices))
 
-        self.file_table.load_files(self.filtered_files)
+        result = (all_files, count, search_index, memo_key, indices)
+        self.root.after(0, self._filter_done, gen, result, filtered, total_size)
 
-        total_size = sum(f['file_info'].size for f in self.filtered_files)
+    def _filter_done(self, gen: int, result: tuple, filtered: list, total_size: int):
+        """Show a worker's filter result unless a newer one superseded it."""
+        if gen != self._filter_gen:
+            return
+        all_files, count, search_index, memo_key, indices = result
+        if all_files is self.all_files and count == len(all_files):
+            # Computed over the current data, so safe to build on
+            if self._search_index is None and len(search_index or ()) == count:
+                self._search_index = search_index
+            memo = self._filter_memo
+            memo.pop(memo_key, None)
+            memo[memo_key] = indices
+            if len(memo) > self.FILTER_MEMO_SIZE:
+                del memo[next(iter(memo))]
+        self._show_filtered(filtered, total_size)
+
+    def _show_filtered(self, filtered: list, total_size: int):
+        """Display a filtered file list and its totals."""
+        self.filtered_files = filtered
+        self.file_table.load_files(self.filtered_files, take_ownership=True)
         self.status_var.set(
             f"Showing {len(self.filtered_files):,} files "
-            f"({format_size(total_size)} total)"
+            f"({format_status_size(total_size)} total)"
         )
 
+    def _invalidate_filters(self):
+        """Forget cached and in-flight filter results after a data change."""
+        self._filter_memo = {}
+        self._last_filter_key = None
+        self._filter_gen += 1
+
     def _reset_filters(self):
         """Reset all filters to default."""
         self.category_var.set("All")
@@ -686,12 +1016,13 @@ class MainWindow:
         self.search_var.set("")
         self._apply_filters()
 
-    def _update_selection_info(self, event=None):
+    def _update_selection_info(self):
         """Update the selection info in status bar."""
+        # The table keeps the selection's count and size up to date
         count = self.file_table.get_selected_count()
         size = self.file_table.get_selected_size()
         if count > 0:
-            self.selection_var.set(f"Selected: {count} files ({format_size(size)})")
+            self.selection_var.set(f"Selected: {count} files ({format_status_size(size)})")
         else:
             self.selection_var.set("")
 
@@ -743,15 +1074,24 @@ class MainWindow:
         self._save_settings()
 
     def _on_file_select(self, event=None):
-        """Handle file selection - update preview pane."""
+        """Handle file selection with debounce."""
+        # Shift-click and drag selections fire a burst of events; only
+        # refresh once the burst is over
+        if self._select_timer:
+            self.root.after_cancel(self._select_timer)
+        self._select_timer = self.root.after(50, self._refresh_selection)
+
+    def _refresh_selection(self):
+        """Update selection info and preview pane."""
+        self._select_timer = None
+
         # Update selection info
         self._update_selection_info()
 
         # Update preview pane if visible
         if self.preview_visible:
-            selected = self.file_table.get_selected_files()
-            if len(selected) == 1:
-                self.preview_pane.show_file(selected[0])
+            if self.file_table.get_selected_count() == 1:
+                self.preview_pane.show_file(self.file_table.get_selected_files()[0])
             else:
                 self.preview_pane.clear()
 
@@ -760,21 +1100,47 @@ class MainWindow:
         if not self.all_files:
             show_info(self.root, "No Data", "Please scan drives first to see visualizations.")
             return
-        VisualizationWindow(self.root, self.filtered_files)
+        self._show_tool_window(VisualizationWindow, self.filtered_files, self._filter_gen)
 
     def _find_duplicates(self):
         """Open the duplicate file finder."""
         if not self.all_files:
             show_info(self.root, "No Data", "Please scan drives first to find duplicates.")
             return
-        DuplicateFinderWindow(self.root, self.filtered_files)
+        self._show_tool_window(DuplicateFinderWindow, self.filtered_files, self._filter_gen)
 
     def _smart_analysis(self):
         """Open the smart analysis window."""
         if not self.all_files:
             show_info(self.root, "No Data", "Please scan drives first for analysis.")
             return
-        SmartAnalysisWindow(self.root, self.all_files)
+        # Built from every file, so filter changes leave it current
+        self._show_tool_window(SmartAnalysisWindow, self.all_files, self._data_gen)
+
+    def _show_tool_window(self, window_class, files: list, generation: int):
+        """
+        Open a tool window, or raise the open one if its data is current.
+
+        The tool windows do expensive work over their files on creation,
+        so one is only rebuilt once files changes.
+
+        Args:
+            window_class: Tool window to show
+            files: Files the window is built from
+            generation: _filter_gen for filtered_files, _data_gen for all_files
+        """
+        # The generation catches changes made in place; the length
+        # catches batches appended while scanning
+        state = (id(files), len(files), generation)
+        if window_class in self._tool_windows:
+            tool, old_state = self._tool_windows[window_class]
+            if tool.window.winfo_exists():
+                if old_state == state:
+                    tool.window.deiconify()
+                    tool.window.lift()
+                    return
+                tool.window.destroy()
+        self._tool_windows[window_class] = (window_class(self.root, files), state)
 
     def _move_selected(self):
         """Move selected files to a new location."""
@@ -785,7 +1151,7 @@ class MainWindow:
             show_info(self.root, "No Selection", "Please select files to move.")
             return
 
-        total_size = sum(f['file_info'].size for f in selected)
+        total_size = self.file_table.get_selected_size()
         dialog = MoveFilesDialog(self.root, len(selected), total_size)
 
         if dialog.result:
@@ -797,17 +1163,15 @@ class MainWindow:
 
             def do_move():
                 stats = move_files(selected, dest, keep_structure)
-                self.root.after(0, lambda: self._move_complete(stats, selected))
+                self.root.after(0, lambda: self._move_complete(stats))
 
             threading.Thread(target=do_move, daemon=True).start()
 
-    def _move_complete(self, stats, moved_files):
+    def _move_complete(self, stats):
         """Called when move operation completes."""
         if stats['moved'] > 0:
             # Remove moved files from list
-            for file_dict in moved_files[:stats['moved']]:
-                if file_dict in self.all_files:
-                    self.all_files.remove(file_dict)
+            self._remove_files(stats['moved_files'])
             self._apply_filters()
 
         show_info(
@@ -870,8 +1234,7 @@ class MainWindow:
 
     def _export_csv(self):
         """Export file list to CSV."""
-        if not self.filtered_files:
-            show_info(self.root, "No Data", "No files to export.")
+        if not self._can_export():
             return
 
         from tkinter import filedialog
@@ -883,15 +1246,11 @@ class MainWindow:
         )
 
         if path:
-            if export_file_list(self.filtered_files, path, 'csv'):
-                show_info(self.root, "Export Complete", f"Exported to:\n{path}")
-            else:
-                show_error(self.root, "Export Failed", "Could not export file list.")
+            self._start_export(path, 'csv')
 
     def _export_html(self):
         """Export file list to HTML."""
-        if not self.filtered_files:
-            show_info(self.root, "No Data", "No files to export.")
+        if not self._can_export():
             return
 
         from tkinter import filedialog
@@ -903,32 +1262,97 @@ class MainWindow:
         )
 
         if path:
-            if export_file_list(self.filtered_files, path, 'html'):
-                show_info(self.root, "Export Complete", f"Exported to:\n{path}")
-                # Optionally open in browser
-                import webbrowser
-                webbrowser.open(f'file://{path}')
+            self._start_export(path, 'html')
+
+    def _can_export(self) -> bool:
+        """Check that there are files to export and no export running."""
+        if not self.filtered_files:
+            show_info(self.root, "No Data", "No files to export.")
+            return False
+        if self._exporting:
+            show_info(self.root, "Busy", "An export is already in progress.")
+            return False
+        return True
+
+    def _start_export(self, path: str, format: str):
+        """Write the filtered files to path on a worker thread."""
+        files = self.filtered_files  # Replaced, never mutated, by filtering
+        self._exporting = True
+        self.status_var.set(f"Exporting {len(files):,} file(s)...")
+        if not self._scan_running():
+            # The scan owns the progress bar while it runs
+            self.progress.config(mode='determinate', maximum=len(files), value=0)
+
+        progress_callback = self._throttled_progress(self._update_export_progress)
+
+        def do_export():
+            ok = export_file_list(files, path, format, progress_callback=progress_callback)
+            self.root.after(0, self._export_complete, ok, path, format)
+
+        threading.Thread(target=do_export, daemon=True).start()
+
+    def _update_export_progress(self, current: int, total: int):
+        """Show export progress in the status bar."""
+        self.status_var.set(f"Exporting... {current:,} of {total:,} file(s)")
+        if str(self.progress['mode']) == 'determinate':
+            self.progress['value'] = current
+
+    def _export_complete(self, ok: bool, path: str, format: str):
+        """Called on the main thread when an export finishes."""
+        self._exporting = False
+        if not self._scan_running():
+            self.progress.config(mode='indeterminate', value=0)
+
+        if ok:
+            self.status_var.set(f"Exported to {path}")
+            if format == 'html':
+                # Opening is left to the user, as a browser can take a
+                # long time to load a report with many rows
+                if ask_yes_no(
+                    self.root,
+                    "Export Complete",
+                    f"Exported to:\n{path}\n\nOpen the report in your browser?"
+                ):
+                    self._open_report(path)
             else:
-                show_error(self.root, "Export Failed", "Could not export file list.")
+                show_info(self.root, "Export Complete", f"Exported to:\n{path}")
+        else:
+            self.status_var.set("Export failed")
+            show_error(self.root, "Export Failed", "Could not export file list.")
+
+    def _open_report(self, path: str):
+        """Open an exported HTML report, warning first if it is large."""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        if size > self.LARGE_REPORT_SIZE and not ask_yes_no(
+            self.root,
+            "Large Report",
+            f"The report is {format_size(size)} and may be slow to open "
+            "in a browser.\n\nOpen it anyway?",
+            warning=True
+        ):
+            return
+        import webbrowser
+        webbrowser.open(f'file://{path}')
 
     def _rebuild_profiles_menu(self):
         """Rebuild the profiles menu with saved profiles."""
         # Remove existing profile entries (after separator)
         try:
             last = self.profiles_menu.index('end')
-            if last is not None and last >= 3:
-                for i in range(last, 2, -1):
-                    self.profiles_menu.delete(i)
+            if last is not None and last >= self.PROFILE_MENU_START:
+                self.profiles_menu.delete(self.PROFILE_MENU_START, last)
         except tk.TclError:
             pass
 
         # Add saved profiles
-        if self.profiles:
-            for name in sorted(self.profiles.keys()):
-                self.profiles_menu.add_command(
-                    label=f"Load: {name}",
-                    command=lambda n=name: self._load_profile(n)
-                )
+        for name in self._profile_names:
+            self.profiles_menu.add_command(
+                label=f"Load: {name}",
+                command=lambda n=name: self._load_profile(n)
+            )
 
     def _save_profile(self):
         """Save current filter settings as a profile."""
@@ -955,9 +1379,18 @@ class MainWindow:
             'search': self.search_var.get()
         }
 
+        if name not in self.profiles:
+            # Insert just the new entry, in sorted position after the
+            # two commands and the separator
+            index = bisect_left(self._profile_names, name)
+            self._profile_names.insert(index, name)
+            self.profiles_menu.insert_command(
+                self.PROFILE_MENU_START + index,
+                label=f"Load: {name}",
+                command=lambda n=name: self._load_profile(n)
+            )
         self.profiles[name] = profile
         self._save_profiles()
-        self._rebuild_profiles_menu()
 
         show_info(self.root, "Profile Saved", f"Profile '{name}' has been saved.")
 
@@ -979,11 +1412,15 @@ class MainWindow:
 
     def _manage_profiles(self):
         """Open profile management dialog."""
-        ProfileManagerDialog(self.root, self.profiles, self._on_profiles_changed)
+        ProfileManagerDialog(
+            self.root, self.profiles, self._on_profiles_changed, self._profile_names
+        )
 
     def _on_profiles_changed(self, new_profiles: dict):
         """Called when profiles are modified in the manager."""
         self.profiles = new_profiles
+        # The manager only deletes, so the remaining names stay sorted
+        self._profile_names = [n for n in self._profile_names if n in new_profiles]
         self._save_profiles()
         self._rebuild_profiles_menu()
 
@@ -991,9 +1428,11 @@ class MainWindow:
 class ProfileManagerDialog:
     """Dialog for managing saved filter profiles."""
 
-    def __init__(self, parent, profiles: dict, on_save):
+    def __init__(self, parent, profiles: dict, on_save, names: list = None):
         self.profiles = profiles.copy()
         self.on_save = on_save
+        # Profile names in display order; sorted unless given
+        self.names = sorted(profiles) if names is None else list(names)
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Manage Profiles")
@@ -1035,9 +1474,8 @@ class ProfileManagerDialog:
         self.profile_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         vsb.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Populate list
-        for name in sorted(self.profiles.keys()):
-            self.profile_list.insert(tk.END, name)
+        # Populate list in one Tcl call rather than one per profile
+        self.profile_list.insert(tk.END, *self.names)
 
         # Buttons
         btn_frame = ttk.Frame(main_frame)
@@ -2,18 +2,145 @@
 
 import tkinter as tk
 from tkinter import ttk
+import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from utils import format_size, format_date, days_since
 
 # Check if PIL is available for image previews
 try:
-    from PIL import Image, ImageTk
+    import PIL
+    from PIL import Image, ImageFile, ImageTk
     HAS_PIL = True
+    # Show what there is of a partly written or cut-off image rather
+    # than no preview at all
+    ImageFile.LOAD_TRUNCATED_IMAGES = True
+    # Pillow-SIMD, a drop-in Pillow build with vectorized resizing,
+    # marks its versions as post releases (e.g. 9.0.0.post1)
+    HAS_SIMD = '.post' in PIL.__version__
 except ImportError:
     HAS_PIL = False
+    HAS_SIMD = False
     Image = None
     ImageTk = None
 
+# Canvas color, also the padding around previews
+PREVIEW_BACKGROUND = '#f0f0f0'
+
+# Previews already made are kept here, so going back to a file
+# doesn't decode the original again
+THUMB_CACHE_DIR = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'disk_cleaner',
+    'thumbs'
+)
+# Oldest previews are removed once the cache grows past this
+THUMB_CACHE_MAX_BYTES = 50 * 1024 ** 2
+
+
+def _thumb_cache_path(file_info, box: tuple) -> str:
+    """Get the cache file for a preview of file_info fitting in box."""
+    # A changed file gets a new mtime or size, so a new name
+    key = f"{file_info.path}|{file_info.last_modified}|{file_info.size}|{box[0]}x{box[1]}"
+    digest = hashlib.blake2b(key.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+    return os.path.join(THUMB_CACHE_DIR, digest + '.webp')
+
+
+def trim_thumb_cache(max_bytes: int = THUMB_CACHE_MAX_BYTES, cache_dir: str = THUMB_CACHE_DIR):
+    """
+    Delete the least recently used previews until the cache fits in max_bytes.
+
+    Previews of changed or deleted files are never looked up again, so
+    without this the cache only grows.
+    """
+    entries = []
+    total = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    except OSError:
+        return  # No cache yet
+
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def _load_preview(file_info, box: tuple):
+    """Load a preview of an image, centered on a box-sized background."""
+    img = _load_thumbnail(file_info, box)
+    # Every preview has the same size, so the shown PhotoImage can be
+    # pasted over rather than made anew
+    padded = Image.new('RGB', box, PREVIEW_BACKGROUND)
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA')
+    offset = ((box[0] - img.width) // 2, (box[1] - img.height) // 2)
+    padded.paste(img, offset, img if img.mode == 'RGBA' else None)
+    return padded
+
+
+def _load_thumbnail(file_info, box: tuple):
+    """Load a thumbnail of an image that fits in box (on a worker thread)."""
+    cache_path = _thumb_cache_path(file_info, box)
+    try:
+        with Image.open(cache_path) as img:
+            img.load()
+    except OSError:
+        pass
+    else:
+        # Mark it recently used, so trimming removes other previews first
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return img
+
+    # Load and resize image
+    with Image.open(file_info.path) as img:
+        # thumbnail keeps the aspect ratio, never enlarges, and drafts
+        # JPEGs so they decode at 1/2, 1/4 or 1/8 scale
+        img.thumbnail(box, _resample_filter(img.size, box))
+    threading.Thread(target=_save_thumbnail, args=(img, cache_path), daemon=True).start()
+    return img
+
+
+def _resample_filter(size: tuple, box: tuple):
+    """Pick a resampling filter for shrinking an image of size into box."""
+    ratio = max(size[0] / box[0], size[1] / box[1])
+    # The bigger the reduction, the less a costly filter shows
+    if ratio >= 4:
+        return Image.Resampling.BOX
+    if ratio >= 2 and not HAS_SIMD:
+        return Image.Resampling.BILINEAR
+    return Image.Resampling.LANCZOS
+
+
+def _save_thumbnail(img, cache_path: str):
+    """Write a preview to the cache; failures just leave it uncached."""
+    tmp_path = cache_path + f'.{threading.get_ident()}.tmp'
+    try:
+        os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+        img.save(tmp_path, 'WEBP', quality=80)
+        os.replace(tmp_path, cache_path)
+    except Exception:  # Unwritable cache dir, or a mode WebP can't hold
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
 
 class PreviewPane(ttk.Frame):
     """A panel showing preview/info for selected files."""
@@ -24,14 +151,28 @@ class PreviewPane(ttk.Frame):
     # Video extensions (show placeholder)
     VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm'}
 
+    # Milliseconds the selection must rest before an image is decoded
+    PREVIEW_DELAY = 120
+
+    # Tags of the canvas item groups, of which one is shown at a time
+    CANVAS_GROUPS = ('image', 'video_icon', 'file_icon', 'placeholder')
+
     def __init__(self, parent, width=300):
         super().__init__(parent, width=width)
         self.pack_propagate(False)  # Maintain fixed width
 
         self.current_file = None
-        self.photo_image = None  # Keep reference to prevent garbage collection
+        self.photo_image = None  # Shown preview; kept for reuse and from GC
+        self._executor = ThreadPoolExecutor(max_workers=2)  # Loads image previews
+        self._preview_token = 0  # Bumped to discard previews still loading
+        self._pending_preview = None  # after() id of a preview not yet started
+        # Canvas size, kept from <Configure> instead of asking Tk each time
+        self._canvas_width = 280
+        self._canvas_height = 200
+        self._canvas_center = (150, 100)  # Where the canvas items are centered
 
         self._create_widgets()
+        self._executor.submit(trim_thumb_cache)
 
     def _create_widgets(self):
         """Create the preview pane widgets."""
@@ -52,25 +193,13 @@ class PreviewPane(ttk.Frame):
         # Canvas for image preview
         self.canvas = tk.Canvas(
             self.preview_frame,
-            bg='#f0f0f0',
+            bg=PREVIEW_BACKGROUND,
             highlightthickness=1,
             highlightbackground='#cccccc'
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
-
-        # Placeholder label (shown when no preview available)
-        self.placeholder_label = ttk.Label(
-            self.canvas,
-            text="Select a file\nto preview",
-            font=('Segoe UI', 10),
-            justify=tk.CENTER,
-            foreground='gray'
-        )
-        self.canvas.create_window(
-            150, 100,
-            window=self.placeholder_label,
-            anchor=tk.CENTER
-        )
+        self._create_canvas_items()
+        self.canvas.bind('<Configure>', self._on_canvas_resize)
 
         # Info section
         self.info_frame = ttk.LabelFrame(self, text="File Info", padding=10)
@@ -146,96 +275,111 @@ class PreviewPane(ttk.Frame):
         ext = file_info.extension.lower()
 
         if HAS_PIL and ext in self.IMAGE_EXTENSIONS:
-            self._show_image_preview(file_info.path)
+            self._show_image_preview(file_info)
         elif ext in self.VIDEO_EXTENSIONS:
             self._show_video_placeholder(file_info.name)
         else:
             self._show_file_icon(category)
 
-    def _show_image_preview(self, path: str):
-        """Show image preview."""
-        try:
-            # Load and resize image
-            img = Image.open(path)
-
-            # Calculate size to fit canvas
-            canvas_width = self.canvas.winfo_width() or 280
-            canvas_height = self.canvas.winfo_height() or 200
-
-            # Maintain aspect ratio
-            img_ratio = img.width / img.height
-            canvas_ratio = canvas_width / canvas_height
+    def _show_image_preview(self, file_info):
+        """Start loading an image preview; _apply_preview shows it."""
+        # Decoding runs on the pool so the UI doesn't wait for it. It
+        # starts once the selection has settled, so arrowing through a
+        # list decodes only the image it stops on; the info labels above
+        # are already up to date meanwhile.
+        self._preview_token += 1
+        token = self._preview_token
+        self._cancel_pending_preview()
+        self._pending_preview = self.after(
+            self.PREVIEW_DELAY, self._start_preview, file_info, token
+        )
 
-            if img_ratio > canvas_ratio:
-                new_width = min(canvas_width - 20, img.width)
-                new_height = int(new_width / img_ratio)
+    def _start_preview(self, file_info, token: int):
+        """Submit a settled image preview to the pool."""
+        self._pending_preview = None
+        # Calculate size to fit canvas
+        box = (max(1, self._canvas_width - 20), max(1, self._canvas_height - 20))
+        future = self._executor.submit(_load_preview, file_info, box)
+        future.add_done_callback(lambda f: self.after(0, self._apply_preview, f, token))
+
+    def _cancel_pending_preview(self):
+        """Cancel a preview that hasn't started loading yet."""
+        if self._pending_preview:
+            self.after_cancel(self._pending_preview)
+            self._pending_preview = None
+
+    def _apply_preview(self, future, token: int):
+        """Show a loaded preview unless another file was shown since."""
+        if token != self._preview_token:
+            return
+        try:
+            img = future.result()
+            photo = self.photo_image
+            if photo is not None and (photo.width(), photo.height()) == img.size:
+                # Same size as the last preview: reuse its Tk image
+                photo.paste(img)
             else:
-                new_height = min(canvas_height - 20, img.height)
-                new_width = int(new_height * img_ratio)
-
-            # Resize
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            # Convert to PhotoImage
-            self.photo_image = ImageTk.PhotoImage(img)
-
-            # Clear canvas and show image
-            self.canvas.delete("all")
-            self.canvas.create_image(
-                canvas_width // 2,
-                canvas_height // 2,
-                image=self.photo_image,
-                anchor=tk.CENTER
-            )
+                # Convert to PhotoImage
+                self.photo_image = ImageTk.PhotoImage(img)
+                self.canvas.itemconfigure(self.image_item, image=self.photo_image)
+
+            # Show image
+            self._show_canvas_group('image')
 
-        except Exception:
+        except (OSError, ValueError, SyntaxError, Image.DecompressionBombError):
+            # Not an image Pillow can read, after all
             self._show_file_icon("Image")
 
-    def _show_video_placeholder(self, name: str):
-        """Show video placeholder."""
-        self.canvas.delete("all")
+    def _on_canvas_resize(self, event):
+        """Remember the canvas size and keep the drawing centered."""
+        self._canvas_width = event.width
+        self._canvas_height = event.height
+        cx, cy = event.width // 2, event.height // 2
+        self.canvas.move('all', cx - self._canvas_center[0], cy - self._canvas_center[1])
+        self._canvas_center = (cx, cy)
+
+    def _create_canvas_items(self):
+        """Draw the preview image, video, file icon and placeholder once.
 
-        canvas_width = self.canvas.winfo_width() or 280
-        canvas_height = self.canvas.winfo_height() or 200
+        Every item is centered on the canvas; switching previews only
+        changes which tag is visible and the icon's label.
+        """
+        cx, cy = self._canvas_center
+        canvas = self.canvas
 
-        # Draw play button icon
-        cx, cy = canvas_width // 2, canvas_height // 2
+        self.image_item = canvas.create_image(cx, cy, anchor=tk.CENTER, tags='image')
 
+        # Video: play button icon
         # Background circle
-        self.canvas.create_oval(
+        canvas.create_oval(
             cx - 40, cy - 40, cx + 40, cy + 40,
             fill='#666666',
             outline='#444444',
-            width=2
+            width=2,
+            tags='video_icon'
         )
 
         # Play triangle
-        self.canvas.create_polygon(
+        canvas.create_polygon(
             cx - 15, cy - 25,
             cx - 15, cy + 25,
             cx + 25, cy,
-            fill='white'
+            fill='white',
+            tags='video_icon'
         )
 
         # Label
-        self.canvas.create_text(
+        canvas.create_text(
             cx, cy + 60,
             text="Video File",
             font=('Segoe UI', 10),
-            fill='#666666'
+            fill='#666666',
+            tags='video_icon'
         )
 
-    def _show_file_icon(self, category: str):
-        """Show generic file icon."""
-        self.canvas.delete("all")
-
-        canvas_width = self.canvas.winfo_width() or 280
-        canvas_height = self.canvas.winfo_height() or 200
-        cx, cy = canvas_width // 2, canvas_height // 2
-
-        # Draw file icon
+        # Generic file icon
         # Page shape
-        self.canvas.create_polygon(
+        canvas.create_polygon(
             cx - 30, cy - 45,
             cx + 15, cy - 45,
             cx + 30, cy - 30,
@@ -243,30 +387,62 @@ class PreviewPane(ttk.Frame):
             cx - 30, cy + 45,
             fill='#e0e0e0',
             outline='#999999',
-            width=2
+            width=2,
+            tags='file_icon'
         )
 
         # Folded corner
-        self.canvas.create_polygon(
+        canvas.create_polygon(
             cx + 15, cy - 45,
             cx + 15, cy - 30,
             cx + 30, cy - 30,
             fill='#cccccc',
-            outline='#999999'
+            outline='#999999',
+            tags='file_icon'
         )
 
         # Category label
-        self.canvas.create_text(
+        self.file_icon_label = canvas.create_text(
             cx, cy + 65,
-            text=category,
             font=('Segoe UI', 10),
-            fill='#666666'
+            fill='#666666',
+            tags='file_icon'
+        )
+
+        # Placeholder (shown when nothing is selected)
+        canvas.create_text(
+            cx, cy,
+            text="Select a file\nto preview",
+            font=('Segoe UI', 10),
+            fill='gray',
+            justify=tk.CENTER,
+            tags='placeholder'
         )
+        self._show_canvas_group('placeholder')
+
+    def _show_canvas_group(self, tag: str):
+        """Show the canvas items tagged tag and hide the others."""
+        for group in self.CANVAS_GROUPS:
+            self.canvas.itemconfigure(group, state=tk.NORMAL if group == tag else tk.HIDDEN)
+
+    def _show_video_placeholder(self, name: str):
+        """Show video placeholder."""
+        self._preview_token += 1
+        self._cancel_pending_preview()
+        self._show_canvas_group('video_icon')
+
+    def _show_file_icon(self, category: str):
+        """Show generic file icon."""
+        self._preview_token += 1
+        self._cancel_pending_preview()
+        self.canvas.itemconfigure(self.file_icon_label, text=category)
+        self._show_canvas_group('file_icon')
 
     def clear(self):
         """Clear the preview pane."""
         self.current_file = None
-        self.photo_image = None
+        self._preview_token += 1
+        self._cancel_pending_preview()
 
         # Reset info labels
         for label in self.info_labels.values():
@@ -277,18 +453,7 @@ class PreviewPane(ttk.Frame):
         self.location_btn.config(state=tk.DISABLED)
 
         # Show placeholder
-        self.canvas.delete("all")
-        canvas_width = self.canvas.winfo_width() or 280
-        canvas_height = self.canvas.winfo_height() or 200
-
-        self.canvas.create_text(
-            canvas_width // 2,
-            canvas_height // 2,
-            text="Select a file\nto preview",
-            font=('Segoe UI', 10),
-            fill='gray',
-            justify=tk.CENTER
-        )
+        self._show_canvas_group('placeholder')
 
     def _open_file(self):
         """Open the current file."""
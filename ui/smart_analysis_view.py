@@ -4,18 +4,47 @@ import tkinter as tk
 from tkinter import ttk
 import threading
 import os
+import time
+import heapq
 from utils import format_size, format_date, get_available_drives
 from smart_analysis import (
     find_empty_folders, find_temp_files, find_large_folders,
-    find_old_downloads, analyze_disk_usage
+    find_old_downloads, analyze_disk_usage, remove_deleted_files
 )
+from file_operations import trash_files, trash_paths, HAS_SEND2TRASH
 from ui.dialogs import ask_confirmation, show_info, show_error
 
-try:
-    from send2trash import send2trash
-    HAS_SEND2TRASH = True
-except ImportError:
-    HAS_SEND2TRASH = False
+
+# Tcl procedure that appends rows of column values to a treeview, so a
+# whole tab is filled by one call instead of a Tcl round trip per row.
+# Each row's iid is its index in rows.
+_INSERT_ROWS = '::disk_cleaner_insert_rows'
+_INSERT_ROWS_PROC = f"""
+proc {_INSERT_ROWS} {{tree rows}} {{
+    set id 0
+    foreach row $rows {{
+        $tree insert {{}} end -id $id -values $row
+        incr id
+    }}
+}}
+"""
+
+
+def _fill_tree(tree, rows: list):
+    """Replace a treeview's rows with rows of column values, with iids "0", "1", ..."""
+    tree.delete(*tree.get_children())
+    if not tree.tk.call('info', 'commands', _INSERT_ROWS):
+        tree.tk.eval(_INSERT_ROWS_PROC)
+    tree.tk.call(_INSERT_ROWS, tree._w, rows)
+
+
+# Most files listed in a file tab; the largest are the ones shown
+MAX_SHOWN_FILES = 500
+
+
+def _file_size(file_dict) -> int:
+    """Sort key for the largest files."""
+    return file_dict['file_info'].size
 
 
 class SmartAnalysisWindow:
@@ -26,6 +55,10 @@ class SmartAnalysisWindow:
         self.files = files
         self.analysis_results = {}
         self.empty_folders = []
+        self._tab_fills = {}  # Tab widget name -> (tree, rows it still needs)
+        self._tree_files = {}  # File tree name -> file dicts, indexed by iid
+        self._deleting = False  # A delete worker is moving files to the trash
+        self._scanning = False  # The empty folder scan is running
 
         self.window = tk.Toplevel(parent)
         self.window.title("Smart Analysis")
@@ -40,6 +73,7 @@ class SmartAnalysisWindow:
         # Notebook for tabs
         self.notebook = ttk.Notebook(self.window)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         # Tab 1: Temp Files
         self._create_temp_files_tab()
@@ -287,63 +321,149 @@ class SmartAnalysisWindow:
     def _analysis_worker(self):
         """Background worker for analysis."""
         try:
-            self.analysis_results = analyze_disk_usage(self.files)
-            self.window.after(0, self._populate_results)
+            results = analyze_disk_usage(self.files)
+            rows = self._format_rows(results)
         except Exception as e:
-            self.window.after(0, lambda: self.status_var.set(f"Error: {e}"))
+            self.window.after(0, self.status_var.set, f"Error: {e}")
+            return
+        self.window.after(0, self._populate_results, results, rows)
+
+    @staticmethod
+    def _format_rows(results: dict) -> dict:
+        """Pick and format the rows of the result tabs, off the Tk thread."""
+        # nlargest only keeps a heap of the shown files, instead of
+        # sorting every match
+        temp_files = heapq.nlargest(
+            MAX_SHOWN_FILES, results.get('temp_files', []), key=_file_size
+        )
+        downloads_files = heapq.nlargest(
+            MAX_SHOWN_FILES, results.get('old_downloads', []), key=_file_size
+        )
 
-    def _populate_results(self):
-        """Populate all tabs with analysis results."""
-        # Temp files
-        temp_files = self.analysis_results.get('temp_files', [])
-        for file_dict in temp_files[:500]:  # Limit to 500
+        temp_rows = []
+        for file_dict in temp_files:
             file_info = file_dict['file_info']
-            self.temp_tree.insert('', tk.END, values=(
+            temp_rows.append((
                 file_info.name,
                 format_size(file_info.size),
                 file_info.path
             ))
 
-        temp_size = self.analysis_results.get('temp_size', 0)
-        self.temp_size_var.set(f"Total: {format_size(temp_size)}")
-
-        # Old downloads
-        old_downloads = self.analysis_results.get('old_downloads', [])
-        for file_dict in old_downloads[:500]:
+        downloads_rows = []
+        for file_dict in downloads_files:
             file_info = file_dict['file_info']
-            self.downloads_tree.insert('', tk.END, values=(
+            downloads_rows.append((
                 file_info.name,
                 format_size(file_info.size),
                 format_date(file_info.last_accessed),
                 file_info.path
             ))
 
-        downloads_size = self.analysis_results.get('downloads_size', 0)
+        large_rows = [
+            (folder, format_size(size), count)
+            for folder, size, count in results.get('large_folders', [])[:100]
+        ]
+
+        return {
+            'temp': temp_rows,
+            'temp_files': temp_files,
+            'downloads': downloads_rows,
+            'downloads_files': downloads_files,
+            'large': large_rows,
+        }
+
+    def _populate_results(self, results: dict, rows: dict):
+        """Populate all tabs with analysis results."""
+        self.analysis_results = results
+
+        # Only the tab on screen gets its rows now; the others are
+        # inserted the first time they are shown
+        self._tab_fills = {}
+        # Temp files
+        self._tree_files[str(self.temp_tree)] = rows['temp_files']
+        self._fill_when_shown(self.temp_tree, rows['temp'])
+
+        temp_size = results.get('temp_size', 0)
+        self.temp_size_var.set(f"Total: {format_size(temp_size)}")
+
+        # Old downloads
+        self._tree_files[str(self.downloads_tree)] = rows['downloads_files']
+        self._fill_when_shown(self.downloads_tree, rows['downloads'])
+
+        downloads_size = results.get('downloads_size', 0)
         self.downloads_size_var.set(f"Total: {format_size(downloads_size)}")
 
         # Large folders
-        large_folders = self.analysis_results.get('large_folders', [])
-        for folder, size, count in large_folders[:100]:
-            self.large_tree.insert('', tk.END, values=(
-                folder,
-                format_size(size),
-                count
-            ))
+        self._fill_when_shown(self.large_tree, rows['large'])
+
+        self._on_tab_changed()
 
         # Enable buttons
-        if HAS_SEND2TRASH:
-            if temp_files:
-                self.clean_temp_btn.config(state=tk.NORMAL)
-                self.clean_all_temp_btn.config(state=tk.NORMAL)
-            if old_downloads:
-                self.clean_downloads_btn.config(state=tk.NORMAL)
+        self._update_buttons()
 
         # Update status
-        potential = self.analysis_results.get('potential_savings', 0)
+        potential = results.get('potential_savings', 0)
         self.status_var.set(
             f"Analysis complete. Potential savings: {format_size(potential)}"
         )
 
+    def _update_buttons(self):
+        """Enable the delete buttons that have something to delete, unless a delete is running."""
+        can_delete = HAS_SEND2TRASH and not self._deleting
+        results = self.analysis_results
+        temp_state = tk.NORMAL if can_delete and results.get('temp_files') else tk.DISABLED
+        self.clean_temp_btn.config(state=temp_state)
+        self.clean_all_temp_btn.config(state=temp_state)
+        downloads_state = tk.NORMAL if can_delete and results.get('old_downloads') else tk.DISABLED
+        self.clean_downloads_btn.config(state=downloads_state)
+        # A rescan would replace the folders a delete is working through
+        idle = not self._deleting and not self._scanning
+        self.scan_empty_btn.config(state=tk.NORMAL if idle else tk.DISABLED)
+        empty_state = tk.NORMAL if idle and HAS_SEND2TRASH and self.empty_folders else tk.DISABLED
+        self.delete_empty_btn.config(state=empty_state)
+
+    def _start_delete(self, work, done, *args):
+        """
+        Run work(*args) on a worker thread, then done(result) on the Tk thread.
+
+        The delete buttons stay disabled meanwhile, so the same files
+        can't be sent to the trash twice.
+        """
+        self._deleting = True
+        self._update_buttons()
+
+        def finish(result):
+            self._deleting = False
+            done(result)
+            self._update_buttons()
+
+        def worker():
+            result = work(*args)
+            try:
+                self.window.after(0, self._if_open, finish, result)
+            except tk.TclError:
+                pass  # Tk has shut down
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _if_open(self, callback, *args):
+        """Call callback(*args) unless the window was closed meanwhile."""
+        if self.window.winfo_exists():
+            callback(*args)
+
+    def _fill_when_shown(self, tree, rows: list):
+        """Fill tree with rows once its notebook tab is shown."""
+        tab = tree
+        while tab.master is not self.notebook:
+            tab = tab.master
+        self._tab_fills[str(tab)] = (tree, rows)
+
+    def _on_tab_changed(self, event=None):
+        """Fill the shown tab's tree if its rows are still pending."""
+        fill = self._tab_fills.pop(self.notebook.select(), None)
+        if fill is not None:
+            _fill_tree(*fill)
+
     def _delete_selected(self, tree):
         """Delete selected items from a tree."""
         if not HAS_SEND2TRASH:
@@ -355,34 +475,29 @@ class SmartAnalysisWindow:
             show_info(self.window, "No Selection", "Select items to delete.")
             return
 
-        paths = []
-        for item in selected:
-            values = tree.item(item, 'values')
-            path = values[-1]  # Path is last column
-            if os.path.isfile(path):
-                paths.append(path)
-
-        if not paths:
-            return
-
-        total_size = sum(os.path.getsize(p) for p in paths if os.path.exists(p))
+        # The analysis already has each file's size; no need to stat them
+        files = self._tree_files[str(tree)]
+        selected_files = [files[int(item)] for item in selected]
+        paths = [f['file_info'].path for f in selected_files]
+        total_size = sum(f['file_info'].size for f in selected_files)
 
         if not ask_confirmation(self.window, paths, total_size):
             return
 
-        deleted = 0
-        for path in paths:
-            try:
-                send2trash(path)
-                deleted += 1
-            except Exception:
-                pass
+        self.status_var.set(f"Deleting {len(selected_files):,} file(s)...")
 
-        show_info(self.window, "Done", f"Deleted {deleted} file(s)")
+        def done(stats):
+            show_info(self.window, "Done", f"Deleted {stats['deleted']} file(s)")
+            self.status_var.set(f"Deleted {stats['deleted']} file(s)")
 
-        # Remove from tree
-        for item in selected:
-            tree.delete(item)
+            # Remove from tree; failed files stay listed
+            deleted = set(map(id, stats['deleted_files']))
+            tree.delete(*[
+                item for item, f in zip(selected, selected_files) if id(f) in deleted
+            ])
+
+        # trash_files runs the moves concurrently, off the Tk thread
+        self._start_delete(trash_files, done, selected_files)
 
     def _delete_all(self, category):
         """Delete all files in a category."""
@@ -400,23 +515,23 @@ class SmartAnalysisWindow:
         if not ask_confirmation(self.window, paths, total_size):
             return
 
-        deleted = 0
-        for path in paths:
-            try:
-                if os.path.exists(path):
-                    send2trash(path)
-                    deleted += 1
-            except Exception:
-                pass
-
-        show_info(
-            self.window,
-            "Done",
-            f"Deleted {deleted} file(s), freed {format_size(total_size)}"
-        )
+        self.status_var.set(f"Deleting {len(files):,} file(s)...")
 
-        # Refresh
-        self._run_analysis()
+        def done(stats):
+            show_info(
+                self.window,
+                "Done",
+                f"Deleted {stats['deleted']} file(s), "
+                f"freed {format_size(stats['total_size'])}"
+            )
+
+            # Refresh; only the deleted files change, so the results are
+            # patched rather than analyzed again
+            results = remove_deleted_files(self.analysis_results, stats['deleted_files'])
+            self._populate_results(results, self._format_rows(results))
+
+        # trash_files runs the moves concurrently, off the Tk thread
+        self._start_delete(trash_files, done, files)
 
     def _open_large_folder(self):
         """Open selected large folder in explorer."""
@@ -430,7 +545,8 @@ class SmartAnalysisWindow:
 
     def _scan_empty_folders(self):
         """Scan for empty folders."""
-        self.scan_empty_btn.config(state=tk.DISABLED)
+        self._scanning = True
+        self._update_buttons()
         self.empty_listbox.delete(0, tk.END)
         self.empty_count_var.set("Scanning...")
 
@@ -441,8 +557,15 @@ class SmartAnalysisWindow:
         """Background worker for empty folder scan."""
         drives = get_available_drives()
 
+        last_post = 0.0
+
         def progress(path, count):
-            self.window.after(0, lambda: self.empty_count_var.set(f"Scanning... {count}"))
+            # At most ~30 updates a second; the result sets the final count
+            nonlocal last_post
+            now = time.monotonic()
+            if now - last_post >= 0.033:
+                last_post = now
+                self.window.after(0, self.empty_count_var.set, f"Scanning... {count}")
 
         self.empty_folders = find_empty_folders(drives, progress)
         self.window.after(0, self._populate_empty_folders)
@@ -450,15 +573,12 @@ class SmartAnalysisWindow:
     def _populate_empty_folders(self):
         """Populate empty folders list."""
         self.empty_listbox.delete(0, tk.END)
-
-        for folder in self.empty_folders[:1000]:
-            self.empty_listbox.insert(tk.END, folder)
+        # One Tcl call for the whole list rather than one per folder
+        self.empty_listbox.insert(tk.END, *self.empty_folders[:1000])
 
         self.empty_count_var.set(f"Found: {len(self.empty_folders)} empty folders")
-        self.scan_empty_btn.config(state=tk.NORMAL)
-
-        if self.empty_folders and HAS_SEND2TRASH:
-            self.delete_empty_btn.config(state=tk.NORMAL)
+        self._scanning = False
+        self._update_buttons()
 
     def _delete_empty_selected(self):
         """Delete selected empty folders."""
@@ -476,19 +596,19 @@ class SmartAnalysisWindow:
         if not ask_confirmation(self.window, folders, 0):
             return
 
-        deleted = 0
-        for folder in folders:
-            try:
-                if os.path.isdir(folder):
-                    send2trash(folder)
-                    deleted += 1
-            except Exception:
-                pass
-
-        show_info(self.window, "Done", f"Deleted {deleted} empty folder(s)")
-
-        # Remove from list
-        for i in reversed(selected):
-            self.empty_listbox.delete(i)
-            if i < len(self.empty_folders):
-                self.empty_folders.pop(i)
+        def done(deleted):
+            show_info(self.window, "Done", f"Deleted {len(deleted)} empty folder(s)")
+
+            # Remove from list, matching by folder rather than by the
+            # indices selected earlier; failed folders stay listed
+            deleted = set(deleted)
+            self.empty_folders = [f for f in self.empty_folders if f not in deleted]
+            shown = self.empty_listbox.get(0, tk.END)
+            for i in reversed(range(len(shown))):
+                if shown[i] in deleted:
+                    self.empty_listbox.delete(i)
+
+        # trash_paths runs the moves concurrently, off the Tk thread
+        self._start_delete(
+            lambda: trash_paths([f for f in folders if os.path.isdir(f)]), done
+        )
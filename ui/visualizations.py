@@ -1,13 +1,205 @@
 """Visualization components for disk usage analysis."""
 
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import ttk
 import math
+import threading
+from array import array
 from collections import defaultdict
+from itertools import accumulate
 import os
+from operator import itemgetter
 from utils import format_size
 
 
+# Tcl procedure that creates a list of canvas items, so a whole chart
+# is drawn by one call instead of a Tcl round trip per item. Each item
+# is the arguments of "canvas create": type, coordinates and options.
+_CREATE_ITEMS = '::disk_cleaner_create_items'
+_CREATE_ITEMS_PROC = f"""
+proc {_CREATE_ITEMS} {{canvas items}} {{
+    set ids {{}}
+    foreach item $items {{
+        lappend ids [$canvas create {{*}}$item]
+    }}
+    return $ids
+}}
+"""
+
+
+def _create_items(canvas, items: list) -> tuple:
+    """Create canvas items from (type, *coords, '-option', value, ...) tuples."""
+    if not items:
+        return ()
+    if not canvas.tk.call('info', 'commands', _CREATE_ITEMS):
+        canvas.tk.eval(_CREATE_ITEMS_PROC)
+    return canvas.tk.splitlist(canvas.tk.call(_CREATE_ITEMS, canvas._w, items))
+
+
+def rank_categories(category_sizes: dict) -> list:
+    """
+    Order categories for the pie chart and treemap.
+
+    Returns:
+        List of (category, size) pairs with a size, largest first
+    """
+    return sorted(
+        (item for item in category_sizes.items() if item[1] > 0),
+        key=itemgetter(1),
+        reverse=True
+    )
+
+
+def fold_small_categories(ranked: list, min_size: float) -> list:
+    """
+    Merge the categories smaller than min_size into one 'Other' category.
+
+    A single small category is kept as it is, since folding it would only
+    rename it.
+
+    Args:
+        ranked: (category, size) pairs, largest first
+        min_size: Smallest size kept as its own category
+
+    Returns:
+        (category, size) pairs, largest first
+    """
+    small = [size for _, size in ranked if size < min_size]
+    if len(small) < 2:
+        return ranked
+    other = sum(small)
+    kept = []
+    for category, size in ranked[:len(ranked) - len(small)]:
+        if category == 'Other':
+            other += size
+        else:
+            kept.append((category, size))
+    # Put 'Other' back where its size ranks
+    index = len(kept)
+    while index and kept[index - 1][1] < other:
+        index -= 1
+    kept.insert(index, ('Other', other))
+    return kept
+
+
+def aggregate_sizes(files: list) -> dict:
+    """
+    Total file sizes by category and by folder, in one pass.
+
+    Returns:
+        Dict with 'category_sizes' and 'folder_sizes' (name -> bytes),
+        'ranked_categories' (from rank_categories), 'folder_counts'
+        (folder -> files) and 'total_size'
+    """
+    category_sizes = defaultdict(int)
+    folder_sizes = defaultdict(int)
+    folder_counts = defaultdict(int)
+    total_size = 0
+    sep = os.sep
+
+    for file_dict in files:
+        file_info = file_dict.file_info
+        path = file_info.path
+        size = file_info.size
+        # Paths are built with os.path.join, so everything before the
+        # last separator is the folder; roots keep dirname's spelling
+        folder = path.rpartition(sep)[0]
+        if not folder or folder[-1] in ':/':
+            folder = os.path.dirname(path)
+        category_sizes[file_dict.category] += size
+        folder_sizes[folder] += size
+        folder_counts[folder] += 1
+        total_size += size
+
+    return {
+        'category_sizes': dict(category_sizes),
+        'ranked_categories': rank_categories(category_sizes),
+        'folder_sizes': folder_sizes,
+        'folder_counts': folder_counts,
+        'total_size': total_size,
+    }
+
+
+def squarify(sizes: list, x: float, y: float, w: float, h: float) -> list:
+    """
+    Lay out rectangles with areas proportional to sizes within (x, y, w, h).
+
+    Uses the squarified treemap algorithm: the sizes are laid out in
+    rows along the shorter side of the space left, and a row only takes
+    the next size while that keeps its rectangles closer to square.
+
+    Args:
+        sizes: Positive sizes, largest first
+
+    Returns:
+        List of (x, y, w, h) rectangles, one per size in the same order
+    """
+    total = sum(sizes)
+    if total <= 0 or w <= 0 or h <= 0:
+        return []
+
+    if sizes[0] == sizes[-1]:
+        # All the same size, so there is nothing to balance:
+        # lay them out directly in rows of a near-square grid
+        count = len(sizes)
+        cols = max(1, min(count, round(math.sqrt(count * w / h))))
+        cell_area = w * h / count
+        rects = []
+        for start in range(0, count, cols):
+            # A short last row gets wider cells, so every area matches
+            in_row = min(cols, count - start)
+            row_h = in_row * cell_area / w
+            cell_w = w / in_row
+            rects.extend((x + col * cell_w, y, cell_w, row_h) for col in range(in_row))
+            y += row_h
+        return rects
+
+    scale = w * h / total
+    areas = [size * scale for size in sizes]
+    rects = []
+    start = 0
+
+    while start < len(areas):
+        # Grow the row while its worst aspect ratio improves; the
+        # sizes are sorted, so each new one is the row's smallest
+        side2 = min(w, h) ** 2
+        largest = areas[start]
+        row_area = largest
+        worst = max(side2 / largest, largest / side2)
+        end = start + 1
+        while end < len(areas):
+            area = areas[end]
+            grown = row_area + area
+            grown2 = grown * grown
+            ratio = max(side2 * largest / grown2, grown2 / (side2 * area))
+            if ratio > worst:
+                break
+            row_area, worst = grown, ratio
+            end += 1
+
+        # Place the row along the shorter side, then shrink the space
+        if w >= h:
+            row_w = row_area / h
+            row_y = y
+            for area in areas[start:end]:
+                rects.append((x, row_y, row_w, area / row_w))
+                row_y += area / row_w
+            x += row_w
+            w -= row_w
+        else:
+            row_h = row_area / w
+            row_x = x
+            for area in areas[start:end]:
+                rects.append((row_x, y, area / row_h, row_h))
+                row_x += area / row_h
+            y += row_h
+            h -= row_h
+        start = end
+
+    return rects
+
+
 class CategoryPieChart(ttk.Frame):
     """Pie chart showing file distribution by category."""
 
@@ -27,6 +219,13 @@ class CategoryPieChart(ttk.Frame):
         self.width = width
         self.height = height
         self.data = {}
+        self._ranked = []  # (category, size) pairs with a size, largest first
+        self._drawn_data = None  # Data the chart shows, None before the first draw
+        # Legend rows are kept and relabelled rather than rebuilt; each
+        # is (row frame, color box canvas, color rectangle id, label)
+        self._legend_rows = []
+        # Canvas size, kept from <Configure> instead of asking Tk each draw
+        self._canvas_size = (width - 150, height)
 
         self._create_widgets()
 
@@ -53,6 +252,10 @@ class CategoryPieChart(ttk.Frame):
             highlightbackground='#cccccc'
         )
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.bind('<Configure>', self._on_canvas_resize)
+
+        # Named font shared by the legend labels, resolved by Tk once
+        self._label_font = tkfont.Font(family='Segoe UI', size=9)
 
         # Legend
         self.legend_frame = ttk.Frame(container)
@@ -60,21 +263,25 @@ class CategoryPieChart(ttk.Frame):
 
     def set_data(self, category_sizes: dict):
         """Set the data and redraw the chart."""
-        self.data = category_sizes
+        self.set_ranked(rank_categories(category_sizes))
+
+    def set_ranked(self, ranked: list):
+        """Set the data from rank_categories and redraw the chart."""
+        self.data = dict(ranked)
+        if ranked == self._drawn_data:
+            return  # Already shown
+        self._drawn_data = self._ranked = list(ranked)
         self._draw_chart()
 
     def _draw_chart(self):
         """Draw the pie chart."""
         self.canvas.delete("all")
 
-        # Clear legend
-        for widget in self.legend_frame.winfo_children():
-            widget.destroy()
-
-        if not self.data:
+        if not self._ranked:
+            self._hide_legend_rows(0)
             self.canvas.create_text(
-                self.canvas.winfo_width() // 2 or 125,
-                self.canvas.winfo_height() // 2 or 150,
+                self._canvas_size[0] // 2,
+                self._canvas_size[1] // 2,
                 text="No data",
                 font=('Segoe UI', 10),
                 fill='gray'
@@ -82,13 +289,10 @@ class CategoryPieChart(ttk.Frame):
             return
 
         # Calculate total
-        total = sum(self.data.values())
-        if total == 0:
-            return
+        total = sum(size for _, size in self._ranked)
 
         # Get canvas dimensions
-        canvas_width = self.canvas.winfo_width() or (self.width - 150)
-        canvas_height = self.canvas.winfo_height() or self.height
+        canvas_width, canvas_height = self._canvas_size
 
         # Pie dimensions
         cx = canvas_width // 2
@@ -96,47 +300,73 @@ class CategoryPieChart(ttk.Frame):
         radius = min(cx, cy) - 20
 
         # Draw pie slices
-        start_angle = 0
-        categories = sorted(self.data.items(), key=lambda x: x[1], reverse=True)
-
-        for i, (category, size) in enumerate(categories):
-            if size == 0:
-                continue
-
+        categories = self._ranked
+        bbox = (cx - radius, cy - radius, cx + radius, cy + radius)
+        slices = []
+        shown = 0  # Legend rows in use
+
+        # Each slice starts where the sizes before it end; angles come from
+        # the exact integer running total, so no rounding error builds up
+        ends = accumulate(size for _, size in categories)
+        for i, ((category, size), end) in enumerate(zip(categories, ends)):
             # Calculate angle
-            angle = (size / total) * 360
+            start_angle = (end - size) * 360 / total
+            angle = size * 360 / total
             color = self.COLORS[i % len(self.COLORS)]
 
-            # Draw arc
-            self.canvas.create_arc(
-                cx - radius, cy - radius,
-                cx + radius, cy + radius,
-                start=start_angle,
-                extent=angle,
-                fill=color,
-                outline='white',
-                width=2
-            )
+            # Arc, drawn with the others below
+            slices.append((
+                'arc',
+                *bbox,
+                '-start', start_angle,
+                '-extent', angle,
+                '-fill', color,
+                '-outline', 'white',
+                '-width', 2
+            ))
 
             # Add legend entry
-            legend_row = ttk.Frame(self.legend_frame)
+            if shown == len(self._legend_rows):
+                self._legend_rows.append(self._create_legend_row())
+            legend_row, color_box, color_rect, label = self._legend_rows[shown]
+            shown += 1
             legend_row.pack(fill=tk.X, pady=2)
-
-            # Color box
-            color_box = tk.Canvas(legend_row, width=16, height=16, highlightthickness=0)
-            color_box.pack(side=tk.LEFT, padx=(0, 5))
-            color_box.create_rectangle(0, 0, 16, 16, fill=color, outline='')
+            color_box.itemconfigure(color_rect, fill=color)
 
             # Category name and size
             percent = (size / total) * 100
-            text = f"{category}: {format_size(size)} ({percent:.1f}%)"
-            ttk.Label(
-                legend_row,
-                text=text,
-                font=('Segoe UI', 9)
-            ).pack(side=tk.LEFT)
+            label.configure(text=f"{category}: {format_size(size)} ({percent:.1f}%)")
+
+        _create_items(self.canvas, slices)
+        self._hide_legend_rows(shown)
+
+    def _on_canvas_resize(self, event):
+        """Remember the canvas size and fit the chart to it."""
+        size = (event.width, event.height)
+        if size != self._canvas_size:
+            self._canvas_size = size
+            if self._drawn_data is not None:
+                self._draw_chart()
 
-            start_angle += angle
+    def _create_legend_row(self) -> tuple:
+        """Create an (unpacked) legend row for _legend_rows."""
+        legend_row = ttk.Frame(self.legend_frame)
+
+        # Color box
+        color_box = tk.Canvas(legend_row, width=16, height=16, highlightthickness=0)
+        color_box.pack(side=tk.LEFT, padx=(0, 5))
+        color_rect = color_box.create_rectangle(0, 0, 16, 16, outline='')
+
+        # Category name and size
+        label = ttk.Label(legend_row, font=self._label_font)
+        label.pack(side=tk.LEFT)
+
+        return legend_row, color_box, color_rect, label
+
+    def _hide_legend_rows(self, start: int):
+        """Hide the legend rows from index start on."""
+        for legend_row, *_ in self._legend_rows[start:]:
+            legend_row.pack_forget()
 
 
 class FolderSizeView(ttk.Frame):
@@ -144,7 +374,14 @@ class FolderSizeView(ttk.Frame):
 
     def __init__(self, parent):
         super().__init__(parent)
-        self.folder_data = {}
+        # Every folder is listed, so the treeview is virtualized like the
+        # file table: it only holds one row per visible line ("slot"),
+        # and scrolling rewrites the slots' values
+        self.folder_rows = []  # (folder, size, file count), largest first
+        self._total_size = 0
+        self._top = 0  # Index in folder_rows of the first shown row
+        self._slots = []  # Values shown in each treeview row; iid is the index
+        self._page = 15  # Rows that fit in the treeview
 
         self._create_widgets()
 
@@ -159,7 +396,9 @@ class FolderSizeView(ttk.Frame):
 
         # Treeview
         columns = ('folder', 'size', 'files', 'percent')
-        self.tree = ttk.Treeview(self, columns=columns, show='headings', height=15)
+        self.tree = ttk.Treeview(
+            self, columns=columns, show='headings', height=self._page, selectmode='none'
+        )
 
         self.tree.heading('folder', text='Folder')
         self.tree.heading('size', text='Size')
@@ -171,55 +410,133 @@ class FolderSizeView(ttk.Frame):
         self.tree.column('files', width=60)
         self.tree.column('percent', width=60)
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar; it scrolls folder_rows, not the treeview
+        self.vsb = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._yview)
 
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.vsb.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self._scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self._scroll(3))
 
     def set_data(self, files: list):
         """Analyze files and show folder sizes."""
-        # Clear existing
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        if not files:
-            return
-
-        # Aggregate by folder
-        folder_stats = defaultdict(lambda: {'size': 0, 'count': 0})
-
-        for file_dict in files:
-            file_info = file_dict['file_info']
-            folder = os.path.dirname(file_info.path)
-            folder_stats[folder]['size'] += file_info.size
-            folder_stats[folder]['count'] += 1
-
-        # Calculate total
-        total_size = sum(f['size'] for f in folder_stats.values())
+        totals = aggregate_sizes(files)
+        self.set_totals(totals['folder_sizes'], totals['folder_counts'], totals['total_size'])
 
+    def set_totals(self, folder_sizes: dict, folder_counts: dict, total_size: int):
+        """Show folder sizes already aggregated by aggregate_sizes."""
         # Sort by size descending
-        sorted_folders = sorted(
-            folder_stats.items(),
-            key=lambda x: x[1]['size'],
+        self.folder_rows = sorted(
+            ((folder, size, folder_counts[folder]) for folder, size in folder_sizes.items()),
+            key=itemgetter(1),
             reverse=True
         )
-
-        # Show top 100 folders
-        for folder, stats in sorted_folders[:100]:
-            percent = (stats['size'] / total_size * 100) if total_size > 0 else 0
-            self.tree.insert('', tk.END, values=(
-                folder,
-                format_size(stats['size']),
-                stats['count'],
-                f"{percent:.1f}%"
-            ))
+        self._total_size = total_size
+        self._top = 0
+        self._render()
+
+    def _render(self):
+        """Show the page of folder_rows starting at _top in the slots."""
+        data = self.folder_rows
+        self._top = max(0, min(self._top, len(data) - self._page))
+        rows = data[self._top:self._top + self._page]
+        total_size = self._total_size
+
+        # Only rows whose values changed are written to the treeview
+        tree = self.tree
+        slots = self._slots
+        for slot, (folder, size, count) in enumerate(rows):
+            percent = (size / total_size * 100) if total_size > 0 else 0
+            values = (folder, format_size(size), count, f"{percent:.1f}%")
+            if slot >= len(slots):
+                tree.insert('', tk.END, iid=str(slot), values=values)
+                slots.append(values)
+            elif slots[slot] != values:
+                tree.item(str(slot), values=values)
+                slots[slot] = values
+        if len(slots) > len(rows):
+            tree.delete(*map(str, range(len(rows), len(slots))))
+            del slots[len(rows):]
+
+        if data:
+            self.vsb.set(self._top / len(data), (self._top + len(rows)) / len(data))
+        else:
+            self.vsb.set(0, 1)
+
+    def _on_resize(self, event):
+        """Fit the number of slots to the treeview's new height."""
+        try:
+            bbox = self.tree.bbox('0') if self._slots else ''
+        except tk.TclError:
+            bbox = ''
+        if bbox:
+            header, row_height = bbox[1], bbox[3]
+        else:
+            # Guess from the style, erring towards fewer rows
+            try:
+                row_height = int(ttk.Style(self).lookup('Treeview', 'rowheight') or 20)
+            except (tk.TclError, ValueError):
+                row_height = 20
+            header = 2 * row_height
+        page = max(1, (event.height - header) // max(1, row_height))
+        if page != self._page:
+            self._page = page
+            self._render()
+
+    def _yview(self, *args):
+        """Scroll folder_rows from the vertical scrollbar."""
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.folder_rows)))
+        elif args[0] == 'scroll':
+            count = int(args[1])
+            if args[2] == 'pages':
+                count *= max(1, self._page - 1)
+            self._scroll(count)
+
+    def _scroll(self, count: int):
+        """Scroll by a number of rows."""
+        self._scroll_to(self._top + count)
+        return 'break'
+
+    def _scroll_to(self, top: int):
+        """Show folder_rows from index top, as far as it can be shown."""
+        top = max(0, min(top, len(self.folder_rows) - self._page))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch."""
+        return self._scroll(-3 if event.delta > 0 else 3)
+
+
+def _empty_rectangles() -> dict:
+    """Make empty treemap rectangle columns: category names, sizes and x/y/w/h."""
+    return {
+        'category': [],
+        'size': array('q'),
+        'x': array('d'),
+        'y': array('d'),
+        'w': array('d'),
+        'h': array('d'),
+    }
 
 
 class TreemapView(ttk.Frame):
     """Treemap visualization of file/folder sizes."""
 
+    # Milliseconds between tooltip updates while the mouse moves
+    HOVER_DELAY = 20
+
+    # Pixel size of the grid cells used to find the rectangle under the cursor
+    GRID_CELL = 32
+
+    # Categories that would cover fewer pixels than this are shown as 'Other'
+    MIN_AREA = 64.0
+
     COLORS = [
         '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4',
         '#FFEAA7', '#DDA0DD', '#98D8C8', '#F7DC6F',
@@ -230,7 +547,15 @@ class TreemapView(ttk.Frame):
         super().__init__(parent)
         self.width = width
         self.height = height
-        self.rectangles = []
+        self.rectangles = _empty_rectangles()  # Shown rectangles, as columns
+        self._grid = {}  # (column, row) grid cell -> indices of rectangles overlapping it
+        self._bbox = (0, 0, -1, -1)  # Area the rectangles cover, empty if none
+        self._last_hit = None  # Index of the rectangle last found under the cursor
+        self._items = {}  # Category -> (rectangle id, label id, drawn spec)
+        self._drawn_data = None  # Data the treemap shows, None before the first draw
+        self._drawn_size = None  # Canvas size it was laid out for
+        # Canvas size, kept from <Configure> instead of asking Tk each draw
+        self._canvas_size = (width, height)
 
         self._create_widgets()
 
@@ -253,6 +578,10 @@ class TreemapView(ttk.Frame):
             highlightbackground='#cccccc'
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind('<Configure>', self._on_canvas_resize)
+
+        # Named font shared by the labels and tooltip, resolved by Tk once
+        self._label_font = tkfont.Font(family='Segoe UI', size=9)
 
         # Bind hover for tooltip
         self.canvas.bind('<Motion>', self._on_hover)
@@ -260,112 +589,212 @@ class TreemapView(ttk.Frame):
         # Tooltip
         self.tooltip = None
         self.tooltip_id = None
+        self._tooltip_rect = None  # Index of the rectangle the tooltip describes
+        self._hover_pos = (0, 0)  # Last cursor position over the canvas
+        self._hover_timer = None  # after() id of a pending tooltip update
 
     def set_data(self, category_sizes: dict):
         """Draw treemap from category sizes."""
-        self.canvas.delete("all")
-        self.rectangles = []
+        self.set_ranked(rank_categories(category_sizes))
 
-        if not category_sizes or sum(category_sizes.values()) == 0:
-            self.canvas.create_text(
-                self.width // 2, self.height // 2,
+    def set_ranked(self, ranked: list):
+        """Draw treemap from rank_categories' (category, size) pairs."""
+        # Get canvas size
+        width, height = self._canvas_size
+        if ranked == self._drawn_data and (width, height) == self._drawn_size:
+            return  # Already shown
+        self._drawn_data = list(ranked)
+        self._drawn_size = (width, height)
+
+        canvas = self.canvas
+        canvas.delete('no_data')
+        self._last_hit = None
+        self._tooltip_rect = None
+        if self.tooltip_id:
+            canvas.itemconfigure(self.tooltip_id, state=tk.HIDDEN)
+
+        if not ranked:
+            self._draw_rectangles(_empty_rectangles(), [])
+            self._grid = {}
+            self._bbox = (0, 0, -1, -1)
+            canvas.create_text(
+                width // 2, height // 2,
                 text="No data",
                 font=('Segoe UI', 10),
-                fill='gray'
+                fill='gray',
+                tags='no_data'
             )
             return
 
-        # Get canvas size
-        w = self.canvas.winfo_width() or self.width
-        h = self.canvas.winfo_height() or self.height
+        # Tiny categories couldn't be seen anyway, so lay them out as one
+        if width > 0 and height > 0:
+            total = sum(size for _, size in ranked)
+            ranked = fold_small_categories(ranked, self.MIN_AREA * total / (width * height))
+        rects = squarify([size for _, size in ranked], 0, 0, width, height)
+
+        # Rectangles are stored as columns, like the analyzer's filter
+        # columns: one array per field, indexed by rectangle
+        shown = _empty_rectangles()
+        colors = []
+        for i, ((category, size), (x, y, w, h)) in enumerate(zip(ranked, rects)):
+            if w < 10 or h < 10:
+                continue
+            shown['category'].append(category)
+            shown['size'].append(size)
+            shown['x'].append(x)
+            shown['y'].append(y)
+            shown['w'].append(w)
+            shown['h'].append(h)
+            colors.append(self.COLORS[i % len(self.COLORS)])
+        self._draw_rectangles(shown, colors)
+
+        # Index the rectangles by the grid cells they overlap, so hover
+        # only tests the few in the cursor's cell
+        cell = self.GRID_CELL
+        grid = defaultdict(list)
+        for index, (x, y, w, h) in enumerate(zip(shown['x'], shown['y'], shown['w'], shown['h'])):
+            for col in range(int(x) // cell, int(x + w) // cell + 1):
+                for row in range(int(y) // cell, int(y + h) // cell + 1):
+                    grid[col, row].append(index)
+        self._grid = grid
+        self._bbox = (0, 0, width, height)
+
+    def _draw_rectangles(self, shown: dict, colors: list):
+        """Show rectangle columns in the given colors, reusing the canvas items of their categories.
+
+        Each category keeps its rectangle and label items between draws;
+        only the items whose position, color or label changed are
+        updated, and new categories are created in one call.
+        """
+        canvas = self.canvas
+        items = self._items
+        created = []  # (category, spec) of categories new to the canvas
+        new_items = []
+
+        columns = (shown['category'], shown['size'], shown['x'], shown['y'], shown['w'], shown['h'])
+        for (category, size, x, y, w, h), color in zip(zip(*columns), colors):
+            # Add label if space permits
+            spec = (
+                (x + 1, y + 1, x + w - 1, y + h - 1),
+                color,
+                (x + w // 2, y + h // 2),
+                f"{category}\n{format_size(size)}",
+                tk.NORMAL if w > 60 and h > 30 else tk.HIDDEN
+            )
+            drawn = items.get(category)
+            if drawn is None:
+                created.append((category, spec))
+                new_items.append((
+                    'rectangle', *spec[0],
+                    '-fill', spec[1],
+                    '-outline', 'white',
+                    '-width', 2
+                ))
+                new_items.append((
+                    'text', *spec[2],
+                    '-text', spec[3],
+                    '-state', spec[4],
+                    '-font', self._label_font,
+                    '-fill', 'white',
+                    '-justify', tk.CENTER
+                ))
+                continue
 
-        # Sort by size descending
-        sorted_data = sorted(category_sizes.items(), key=lambda x: x[1], reverse=True)
-        total = sum(category_sizes.values())
+            rect_id, text_id, old = drawn
+            if spec != old:
+                if spec[:2] != old[:2]:
+                    canvas.coords(rect_id, *spec[0])
+                    canvas.itemconfigure(rect_id, fill=spec[1])
+                if spec[2:] != old[2:]:
+                    canvas.coords(text_id, *spec[2])
+                    canvas.itemconfigure(text_id, text=spec[3], state=spec[4])
+                items[category] = (rect_id, text_id, spec)
+
+        # Categories no longer shown lose their items
+        kept = set(shown['category'])
+        for category in [c for c in items if c not in kept]:
+            rect_id, text_id, _ = items.pop(category)
+            canvas.delete(rect_id, text_id)
+
+        # Draw the new categories in one call; each rectangle is
+        # followed by its label
+        ids = _create_items(canvas, new_items)
+        for (category, spec), rect_id, text_id in zip(created, ids[::2], ids[1::2]):
+            items[category] = (int(rect_id), int(text_id), spec)
+        if self.tooltip_id and created:
+            canvas.tag_raise(self.tooltip_id)
+
+        self.rectangles = shown
+
+    def _on_canvas_resize(self, event):
+        """Remember the canvas size and lay the treemap out again for it."""
+        self._canvas_size = (event.width, event.height)
+        if self._drawn_data is not None:
+            self.set_ranked(self._drawn_data)
 
-        # Simple treemap layout (squarified algorithm simplified)
-        self._draw_treemap(sorted_data, 0, 0, w, h, total)
+    def _on_hover(self, event):
+        """Show tooltip on hover, at most every HOVER_DELAY ms."""
+        # Motion events come faster than the tooltip needs updating, so
+        # only the latest position is kept until the timer fires
+        self._hover_pos = (event.x, event.y)
+        if self._hover_timer is None:
+            self._hover_timer = self.after(self.HOVER_DELAY, self._update_tooltip)
+
+    def _update_tooltip(self):
+        """Move the tooltip to the last hover position."""
+        self._hover_timer = None
+        x, y = self._hover_pos
+        rect = self._rect_at(x, y)
 
-    def _draw_treemap(self, data, x, y, w, h, total, depth=0):
-        """Draw treemap rectangles recursively."""
-        if not data or w < 10 or h < 10:
+        # No rectangle found, hide tooltip
+        if rect is None:
+            if self.tooltip_id:
+                self.canvas.itemconfigure(self.tooltip_id, state=tk.HIDDEN)
+            self._tooltip_rect = None
             return
 
-        if len(data) == 1:
-            category, size = data[0]
-            color = self.COLORS[depth % len(self.COLORS)]
-            rect_id = self.canvas.create_rectangle(
-                x + 1, y + 1, x + w - 1, y + h - 1,
-                fill=color,
-                outline='white',
-                width=2
+        if self.tooltip_id is None:
+            self.tooltip_id = self.canvas.create_text(
+                x + 10, y - 10,
+                font=self._label_font,
+                fill='black',
+                anchor=tk.NW
+            )
+        else:
+            self.canvas.coords(self.tooltip_id, x + 10, y - 10)
+
+        # The text only changes when the cursor enters another rectangle
+        if rect != self._tooltip_rect:
+            self._tooltip_rect = rect
+            rects = self.rectangles
+            self.canvas.itemconfigure(
+                self.tooltip_id,
+                text=f"{rects['category'][rect]}: {format_size(rects['size'][rect])}",
+                state=tk.NORMAL
             )
-            self.rectangles.append({
-                'id': rect_id,
-                'category': category,
-                'size': size,
-                'x': x, 'y': y, 'w': w, 'h': h
-            })
-
-            # Add label if space permits
-            if w > 60 and h > 30:
-                self.canvas.create_text(
-                    x + w // 2, y + h // 2,
-                    text=f"{category}\n{format_size(size)}",
-                    font=('Segoe UI', 9),
-                    fill='white',
-                    justify=tk.CENTER
-                )
-            return
-
-        # Split data into two groups
-        mid = len(data) // 2
-        left_data = data[:mid]
-        right_data = data[mid:]
-
-        left_total = sum(item[1] for item in left_data)
-        right_total = sum(item[1] for item in right_data)
 
-        if left_total + right_total == 0:
-            return
+    def _rect_at(self, x: int, y: int):
+        """Get the index of the rectangle under a canvas position, or None."""
+        left, top, right, bottom = self._bbox
+        if not (left <= x <= right and top <= y <= bottom):
+            return None
 
-        # Decide split direction
-        if w > h:
-            # Vertical split
-            left_w = int(w * left_total / (left_total + right_total))
-            self._draw_treemap(left_data, x, y, left_w, h, left_total, depth)
-            self._draw_treemap(right_data, x + left_w, y, w - left_w, h, right_total, depth + 1)
-        else:
-            # Horizontal split
-            top_h = int(h * left_total / (left_total + right_total))
-            self._draw_treemap(left_data, x, y, w, top_h, left_total, depth)
-            self._draw_treemap(right_data, x, y + top_h, w, h - top_h, right_total, depth + 1)
+        rects = self.rectangles
+        rx, ry, rw, rh = rects['x'], rects['y'], rects['w'], rects['h']
 
-    def _on_hover(self, event):
-        """Show tooltip on hover."""
-        # Find rectangle under cursor
-        for rect in self.rectangles:
-            if (rect['x'] <= event.x <= rect['x'] + rect['w'] and
-                rect['y'] <= event.y <= rect['y'] + rect['h']):
-
-                # Show tooltip
-                if self.tooltip_id:
-                    self.canvas.delete(self.tooltip_id)
-
-                text = f"{rect['category']}: {format_size(rect['size'])}"
-                self.tooltip_id = self.canvas.create_text(
-                    event.x + 10, event.y - 10,
-                    text=text,
-                    font=('Segoe UI', 9),
-                    fill='black',
-                    anchor=tk.NW
-                )
-                return
+        # The cursor usually stays in the rectangle it was last over
+        index = self._last_hit
+        if index is not None and (rx[index] <= x <= rx[index] + rw[index] and
+                                  ry[index] <= y <= ry[index] + rh[index]):
+            return index
 
-        # No rectangle found, hide tooltip
-        if self.tooltip_id:
-            self.canvas.delete(self.tooltip_id)
-            self.tooltip_id = None
+        cell = self.GRID_CELL
+        for index in self._grid.get((x // cell, y // cell), ()):
+            if (rx[index] <= x <= rx[index] + rw[index] and
+                    ry[index] <= y <= ry[index] + rh[index]):
+                self._last_hit = index
+                return index
+        return None
 
 
 class VisualizationWindow:
@@ -418,14 +847,29 @@ class VisualizationWindow:
         if not self.files:
             return
 
-        # Calculate category sizes
-        category_sizes = defaultdict(int)
-        for file_dict in self.files:
-            category = file_dict['category']
-            size = file_dict['file_info'].size
-            category_sizes[category] += size
+        # Totalling a large scan takes a while, so it runs off the Tk
+        # thread; the window opens meanwhile and _apply_data fills it in
+        threading.Thread(target=self._aggregate_worker, daemon=True).start()
+
+    def _aggregate_worker(self):
+        """Background worker totalling the files for the views."""
+        # One pass over the files gives every view's totals
+        totals = aggregate_sizes(self.files)
+        try:
+            self.window.after(0, self._apply_data, totals)
+        except tk.TclError:
+            pass  # Tk has shut down
+
+    def _apply_data(self, totals: dict):
+        """Show totals from aggregate_sizes in every view."""
+        if not self.window.winfo_exists():
+            return  # Closed while the totals were computed
+        # Both charts show the categories in the same order, ranked once
+        ranked = totals['ranked_categories']
 
         # Update visualizations
-        self.pie_chart.set_data(dict(category_sizes))
-        self.folder_view.set_data(self.files)
-        self.treemap.set_data(dict(category_sizes))
+        self.pie_chart.set_ranked(ranked)
+        self.folder_view.set_totals(
+            totals['folder_sizes'], totals['folder_counts'], totals['total_size']
+        )
+        self.treemap.set_ranked(ranked)
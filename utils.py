@@ -1,45 +1,113 @@
 """Utility functions for the disk cleaner app."""
 
+import json
+import math
+import os
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 
+# Try to import orjson for faster JSON serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
+
+# (divisor, format) for each unit past bytes, indexed by log2(size) // 10
+_FORMAT_UNITS = [
+    (1024, "{:.1f} KB"),
+    (1024 ** 2, "{:.1f} MB"),
+    (1024 ** 3, "{:.2f} GB"),
+    (1024 ** 4, "{:.2f} TB"),
+]
+
+
+@lru_cache(maxsize=4096)
 def format_size(size_bytes: int) -> str:
     """Convert bytes to human-readable format."""
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 ** 2:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 ** 3:
-        return f"{size_bytes / (1024 ** 2):.1f} MB"
-    elif size_bytes < 1024 ** 4:
-        return f"{size_bytes / (1024 ** 3):.2f} GB"
-    else:
-        return f"{size_bytes / (1024 ** 4):.2f} TB"
+    # Each unit spans 10 bits, so the bit length picks it without a
+    # chain of comparisons
+    unit = min((int(size_bytes).bit_length() - 1) // 10, len(_FORMAT_UNITS))
+    divisor, fmt = _FORMAT_UNITS[unit - 1]
+    return fmt.format(size_bytes / divisor)
+
+
+def format_status_size(size_bytes: int) -> str:
+    """
+    Format a running total for the status bar.
+
+    Sizes of 1 MB and up are rounded down to whole KB first, which does not
+    change their displayed precision but lets format_size's cache absorb
+    nearby totals.
+    """
+    if size_bytes >= 1024 ** 2:
+        size_bytes = size_bytes >> 10 << 10
+    return format_size(size_bytes)
 
 
 def format_date(timestamp: float) -> str:
-    """Convert timestamp to readable date string."""
+    """
+    Convert timestamp to readable date string.
+
+    Dates are shown to the minute, so the timestamp is rounded down to
+    whole seconds first; files written together then share a cache entry.
+    """
     try:
-        dt = datetime.fromtimestamp(timestamp)
+        return _format_date(math.floor(timestamp))
+    except (ValueError, OverflowError):
+        return "Unknown"
+
+
+@lru_cache(maxsize=4096)
+def _format_date(seconds: int) -> str:
+    """Format a whole-second timestamp for format_date."""
+    try:
+        dt = datetime.fromtimestamp(seconds)
         return dt.strftime("%Y-%m-%d %H:%M")
-    except (ValueError, OSError):
+    except (ValueError, OSError, OverflowError):
         return "Unknown"
 
 
-def days_since(timestamp: float) -> int:
-    """Calculate days since a timestamp."""
+def days_since(timestamp: float, now: float = None) -> int:
+    """
+    Calculate days since a timestamp.
+
+    Counts whole days of elapsed time, like the age filters' cutoffs. Not
+    cached, since the answer changes with the clock.
+
+    Args:
+        timestamp: Timestamp to count from
+        now: Current time as a timestamp (default: time.time()); pass
+            one in when computing ages for many files
+    """
+    if now is None:
+        now = time.time()
     try:
-        dt = datetime.fromtimestamp(timestamp)
-        delta = datetime.now() - dt
-        return delta.days
-    except (ValueError, OSError):
+        return int((now - timestamp) // 86400)
+    except (ValueError, OverflowError, TypeError):
         return 0
 
 
 def get_available_drives() -> list:
     """Get list of available drive letters on Windows."""
     import string
-    import os
+
+    if os.name == 'nt':
+        # One call gives a bitmask of the drive letters in use, without
+        # touching (and waking, or timing out on) each drive
+        import ctypes
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        if mask:
+            return [
+                f"{letter}:\\"
+                for i, letter in enumerate(string.ascii_uppercase)
+                if mask & (1 << i)
+            ]
 
     drives = []
     for letter in string.ascii_uppercase:
@@ -47,3 +115,92 @@ def get_available_drives() -> list:
         if os.path.exists(drive):
             drives.append(drive)
     return drives
+
+
+def load_json(path: str, default=None):
+    """
+    Load a JSON file, returning default if it is missing or unreadable.
+
+    Uses orjson when it is installed.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+    except (ValueError, OSError):
+        return default
+
+
+def save_json(path: str, obj) -> None:
+    """
+    Atomically write obj to a JSON file.
+
+    The data is written and flushed to disk in a temporary file that then
+    replaces the target, so neither an interrupted save nor a crash right
+    after it leaves a half-written file. Uses orjson when it is installed.
+    Raises OSError if the file cannot be written, leaving the target
+    untouched and no temporary file behind.
+    """
+    if HAS_ORJSON:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            # Without this the rename can reach the disk before the data
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+_MISSING = object()  # JsonCache entry for a missing or unreadable file
+
+
+class JsonCache:
+    """
+    Parsed JSON files, memoized by modification time.
+
+    get() only stats a file whose mtime is unchanged since it was last read
+    or written through the cache, and re-parses it otherwise. Safe to use
+    from several threads. Returned objects are shared with the cache, so
+    callers that modify one should write it back with save().
+    """
+
+    def __init__(self):
+        self._entries = {}  # path -> (st_mtime_ns or None, data)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _mtime(path: str):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, path: str, default=None):
+        """Return the parsed contents of path, or default if unreadable."""
+        mtime = self._mtime(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == mtime:
+                data = entry[1]
+                return default if data is _MISSING else data
+        data = load_json(path, _MISSING) if mtime is not None else _MISSING
+        with self._lock:
+            self._entries[path] = (mtime, data)
+        return default if data is _MISSING else data
+
+    def save(self, path: str, obj) -> None:
+        """Atomically write obj to path and remember it as the cached value."""
+        save_json(path, obj)
+        with self._lock:
+            self._entries[path] = (self._mtime(path), obj)